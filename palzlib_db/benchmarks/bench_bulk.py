@@ -0,0 +1,137 @@
+"""
+Write throughput of the bulk insert and upsert helpers against the ORM baseline.
+
+The script writes the same synthetic sentiment rows (the fields of `Sentiments.asdict()`
+plus an article id) with `session.add` per row, then with each bulk method, into a fresh
+table, and reports rows per second. Without connection options it runs against a
+temporary SQLite file; pass the Postgres settings to include `COPY FROM STDIN`.
+
+Usage:
+    python benchmarks/bench_bulk.py --size 100000
+    python benchmarks/bench_bulk.py --dialect postgresql+psycopg2 --host localhost \\
+        --username user --password secret --dbname bench
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table
+
+from palzlib_db.db_bulk import bulk_insert, bulk_upsert
+from palzlib_db.db_client import DBClient
+from palzlib_db.db_config import DBConfig
+from palzlib_db.db_mapper import DBMapper
+
+TABLE_NAME = "bench_sentiments"
+LABELS = ["very_negative", "negative", "neutral", "positive", "very_positive"]
+
+
+def make_rows(size: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for article_id in range(1, size + 1):
+        scores = [rng.random() for _ in LABELS]
+        total = sum(scores)
+        row = {label: round(score / total, 4) for label, score in zip(LABELS, scores)}
+        label = max(LABELS, key=row.get)
+        row.update(
+            article_id=article_id,
+            compound=round(row["positive"] - row["negative"], 4),
+            compound_label="",
+            sentiment_label=label,
+            sentiment_value=row[label],
+        )
+        rows.append(row)
+    return rows
+
+
+def create_table(db_client: DBClient):
+    metadata = MetaData()
+    table = Table(
+        TABLE_NAME,
+        metadata,
+        Column("article_id", Integer, primary_key=True, autoincrement=False),
+        *(Column(label, Float) for label in LABELS),
+        Column("compound", Float),
+        Column("compound_label", String(16)),
+        Column("sentiment_label", String(16)),
+        Column("sentiment_value", Float),
+    )
+    metadata.drop_all(db_client.engine)
+    metadata.create_all(db_client.engine)
+    return DBMapper(db_client, mapping_tables=[TABLE_NAME])[TABLE_NAME]
+
+
+def orm_insert(db_client: DBClient, model, rows: list[dict], chunk_size: int) -> int:
+    for offset in range(0, len(rows), chunk_size):
+        with db_client.get_db_session() as session:
+            for row in rows[offset : offset + chunk_size]:
+                session.add(model(**row))
+            session.commit()
+    return len(rows)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size", type=int, default=50000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--dialect", default="sqlite")
+    parser.add_argument("--dbname", default=None, help="defaults to a temporary SQLite file")
+    parser.add_argument("--host", default="")
+    parser.add_argument("--port", type=int, default=5432)
+    parser.add_argument("--username", default="")
+    parser.add_argument("--password", default="")
+    args = parser.parse_args()
+
+    dbname = args.dbname or os.path.join(tempfile.mkdtemp(), "bench.db")
+    db_client = DBClient(
+        DBConfig(
+            username=args.username,
+            password=args.password,
+            dbname=dbname,
+            host=args.host,
+            dialect=args.dialect,
+            port=args.port,
+        )
+    )
+    rows = make_rows(args.size, args.seed)
+
+    runs = {
+        "orm": lambda model: orm_insert(db_client, model, rows, args.chunk_size),
+        "executemany": lambda model: bulk_insert(
+            db_client, model, rows, args.chunk_size, method="executemany"
+        ),
+        "values": lambda model: bulk_insert(
+            db_client, model, rows, args.chunk_size, method="values"
+        ),
+    }
+    if db_client.engine.dialect.driver == "psycopg2":
+        runs["copy"] = lambda model: bulk_insert(
+            db_client, model, rows, args.chunk_size, method="copy"
+        )
+
+    baseline = None
+    for name, run in runs.items():
+        model = create_table(db_client)
+        start = time.perf_counter()
+        written = run(model)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{name:<12} {written / elapsed:10.1f} rows/s  speedup {baseline / elapsed:.1f}x")
+
+    # Upserting every row again measures the conflict path: all rows are updated
+    start = time.perf_counter()
+    written = bulk_upsert(db_client, model, rows, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - start
+    print(f"{'upsert':<12} {written / elapsed:10.1f} rows/s  speedup {baseline / elapsed:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
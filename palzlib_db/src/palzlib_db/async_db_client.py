@@ -0,0 +1,125 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from .db_config import DBConfig
+from .db_pool import TimedAsyncQueuePool, install_idle_pre_ping, pool_stats
+
+# The asyncio driver used for a sync dialect, so one DBConfig serves both clients
+ASYNC_DIALECTS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+class AsyncDBClient:
+    """
+    Asyncio database client for managing SQLAlchemy async sessions and connections.
+
+    Queries await the database instead of blocking a thread, so one process can keep
+    as many queries in flight as the pool has connections.
+
+    Attributes:
+        connection_string (str): The connection string for the database.
+        auto_flush (bool): Whether to enable autoflush.
+        expire_on_commit (bool): Whether to expire objects on commit.
+        engine (AsyncEngine): SQLAlchemy async database engine.
+        session_local (async_sessionmaker): Configured async session factory.
+    """
+
+    def __init__(
+        self,
+        db_config: DBConfig,
+        expire_on_commit: bool = False,
+        auto_flush: bool = False,
+    ):
+        """
+        Initializes the AsyncDBClient with the provided database configuration.
+
+        Args:
+            db_config: Object containing database connection parameters. Sync
+                dialects are mapped to their asyncio driver, see `ASYNC_DIALECTS`.
+            expire_on_commit (bool, optional): Whether to expire objects on commit. Defaults to False.
+            auto_flush (bool, optional): Whether to enable autoflush. Defaults to False.
+        Raises:
+            ValueError: If db_config is missing.
+            SQLAlchemyError: If engine creation fails, e.g. the driver is not async.
+        """
+        if db_config is None:
+            raise ValueError("Missing database configuration.")
+
+        self.auto_flush = auto_flush
+        self.expire_on_commit = expire_on_commit
+        self.db_config = db_config
+
+        dialect = ASYNC_DIALECTS.get(db_config.dialect, db_config.dialect)
+        self.connection_string = db_config.url(dialect)
+        self.engine = self._create_engine()
+        self.session_local = self._create_session()
+
+    def _create_engine(self):
+        """
+        Creates and returns the SQLAlchemy async engine.
+
+        Returns:
+            AsyncEngine: SQLAlchemy async database engine.
+        Raises:
+            SQLAlchemyError: If engine creation fails.
+        """
+        try:
+            engine = create_async_engine(
+                self.connection_string,
+                poolclass=TimedAsyncQueuePool,
+                **self.db_config.pool_options(),
+            )
+        except SQLAlchemyError as ex:
+            raise SQLAlchemyError(f"Database engine creation failed: {str(ex)}") from ex
+
+        if self.db_config.pool_pre_ping and self.db_config.pool_pre_ping_idle:
+            install_idle_pre_ping(engine.sync_engine, self.db_config.pool_pre_ping_idle)
+        return engine
+
+    def _create_session(self):
+        """
+        Creates and returns an async session factory.
+
+        Returns:
+            async_sessionmaker: Configured async session factory.
+        """
+        return async_sessionmaker(
+            bind=self.engine,
+            autoflush=self.auto_flush,
+            expire_on_commit=self.expire_on_commit,
+        )
+
+    @asynccontextmanager
+    async def get_db_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Async context manager for obtaining a database session.
+
+        The session is rolled back on SQLAlchemy errors and always closed, as with
+        `DBClient.get_db_session`.
+        """
+        session = self.session_local()
+        try:
+            yield session
+        except SQLAlchemyError as ex:
+            await session.rollback()
+            raise SQLAlchemyError(f"Session error: {str(ex)}") from ex
+        finally:
+            await session.close()
+
+    def pool_stats(self) -> dict:
+        """
+        Returns live statistics of the connection pool, see `DBClient.pool_stats`.
+        """
+        return pool_stats(self.engine.pool)
+
+    async def dispose(self):
+        """
+        Closes the pooled connections; call it before the event loop shuts down.
+        """
+        await self.engine.dispose()
@@ -0,0 +1,217 @@
+import io
+import json
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+from sqlalchemy import Table, insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from .db_client import DBClient
+
+BULK_METHODS = ("auto", "executemany", "values", "copy")
+
+
+def _table(model) -> Table:
+    """
+    Returns the table of a mapped class from DBMapper, or the table itself.
+    """
+    return getattr(model, "__table__", model)
+
+
+def _chunks(rows: Iterable[dict], chunk_size: int) -> Iterator[List[dict]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _copy_value(value) -> str:
+    # COPY's CSV format reads an unquoted empty field as NULL and a quoted one as ""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea's hex input format
+        value = "\\x" + bytes(value).hex()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_chunk(connection, table: Table, chunk: List[dict]):
+    """
+    Writes the rows with Postgres `COPY ... FROM STDIN`, one round-trip per chunk.
+    """
+    preparer = connection.dialect.identifier_preparer
+    columns = list(chunk[0])
+    buffer = io.StringIO()
+    for row in chunk:
+        buffer.write(",".join(_copy_value(row[column]) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    statement = (
+        f"COPY {preparer.format_table(table)} "
+        f"({', '.join(preparer.quote(column) for column in columns)}) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(statement, buffer)
+
+
+def _upsert_statement(
+    connection, table: Table, columns, conflict_columns, update_columns
+):
+    dialect_name = connection.dialect.name
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise ValueError(
+            f"Upserts are not supported for the '{dialect_name}' dialect."
+        )
+
+    statement = dialect_insert(table)
+    if update_columns is None:
+        update_columns = [
+            column for column in columns if column not in conflict_columns
+        ]
+    if not update_columns:
+        return statement.on_conflict_do_nothing(index_elements=conflict_columns)
+    return statement.on_conflict_do_update(
+        index_elements=conflict_columns,
+        set_={column: statement.excluded[column] for column in update_columns},
+    )
+
+
+def _write(
+    db_client: DBClient,
+    table: Table,
+    rows: Iterable[dict],
+    chunk_size: int,
+    method: str,
+    upsert: tuple = None,
+) -> int:
+    if method not in BULK_METHODS:
+        raise ValueError(f"Unsupported bulk method: {method}")
+    if chunk_size < 1:
+        raise ValueError("'chunk_size' must be positive")
+
+    dialect = db_client.engine.dialect
+    if method == "auto":
+        use_copy = upsert is None and dialect.driver == "psycopg2"
+        method = "copy" if use_copy else "executemany"
+    if method == "copy" and (upsert is not None or dialect.driver != "psycopg2"):
+        raise ValueError(
+            "The 'copy' method needs the psycopg2 driver and does not upsert."
+        )
+
+    written = 0
+    try:
+        with db_client.engine.connect() as connection:
+            for chunk in _chunks(rows, chunk_size):
+                if upsert is not None:
+                    statement = _upsert_statement(
+                        connection, table, list(chunk[0]), *upsert
+                    )
+                else:
+                    statement = insert(table)
+
+                if method == "copy":
+                    _copy_chunk(connection, table, chunk)
+                elif method == "values":
+                    # One multi-row INSERT per slice, within the driver's parameter limit
+                    limit = dialect.insertmanyvalues_max_parameters
+                    step = max(1, limit // len(chunk[0]))
+                    for offset in range(0, len(chunk), step):
+                        values = chunk[offset : offset + step]
+                        connection.execute(statement.values(values))
+                else:
+                    connection.execute(statement, chunk)
+
+                # Commit per chunk, so a failure keeps the chunks already written
+                connection.commit()
+                written += len(chunk)
+    except SQLAlchemyError as ex:
+        # Keep the error type, e.g. IntegrityError on duplicate keys
+        ex.written = written
+        raise
+    return written
+
+
+def bulk_insert(
+    db_client: DBClient,
+    model,
+    rows: Iterable[dict],
+    chunk_size: int = 5000,
+    method: str = "auto",
+) -> int:
+    """
+    Inserts rows in chunks instead of one INSERT and round-trip per ORM object.
+
+    Args:
+        db_client (DBClient): The client whose engine is written through.
+        model: A mapped class from DBMapper, or a Table.
+        rows (Iterable[dict]): The rows as column name -> value, e.g. `Sentiments.asdict()`
+            merged with the keys; all rows need the same keys. Consumed lazily.
+        chunk_size (int, optional): Rows per chunk and transaction. Defaults to 5000.
+        method (str, optional): "executemany" (SQLAlchemy batches it into multi-row
+            VALUES where the driver supports it), "values" (one `insert().values()`
+            statement per slice, compiled in Python for every slice, for drivers
+            without batching), "copy" (Postgres `COPY FROM STDIN`, psycopg2 only) or
+            "auto", which uses "copy" when possible. Defaults to "auto".
+    Returns:
+        int: The number of rows written.
+    Raises:
+        ValueError: If the method is unknown or not supported by the driver.
+        SQLAlchemyError: If a chunk fails, as raised by SQLAlchemy (e.g. IntegrityError);
+            the chunks before it stay committed, and its `written` attribute holds their
+            number of rows.
+    """
+    return _write(db_client, _table(model), rows, chunk_size, method)
+
+
+def bulk_upsert(
+    db_client: DBClient,
+    model,
+    rows: Iterable[dict],
+    conflict_columns: List[str] = None,
+    update_columns: List[str] = None,
+    chunk_size: int = 5000,
+    method: str = "executemany",
+) -> int:
+    """
+    Inserts rows in chunks, updating the existing rows with `INSERT ... ON CONFLICT`.
+
+    Args:
+        db_client (DBClient): The client whose engine is written through; Postgres
+            and SQLite support upserts.
+        model: A mapped class from DBMapper, or a Table.
+        rows (Iterable[dict]): The rows as column name -> value. Consumed lazily.
+        conflict_columns (List[str], optional): The columns of the unique index or
+            constraint rows conflict on. Defaults to the primary key.
+        update_columns (List[str], optional): The columns updated on conflict. Defaults
+            to every column of the rows except the conflict columns; an empty list
+            keeps the existing rows (`DO NOTHING`).
+        chunk_size (int, optional): Rows per chunk and transaction. Defaults to 5000.
+        method (str, optional): "executemany" or "values", see `bulk_insert`.
+    Returns:
+        int: The number of rows written, inserted or not.
+    Raises:
+        ValueError: If the dialect or method does not support upserts.
+        SQLAlchemyError: If a chunk fails, as raised by SQLAlchemy (e.g. IntegrityError);
+            the chunks before it stay committed, and its `written` attribute holds their
+            number of rows.
+    """
+    table = _table(model)
+    if conflict_columns is None:
+        conflict_columns = [column.name for column in table.primary_key.columns]
+    if not conflict_columns:
+        raise ValueError(
+            f"Table '{table.name}' has no primary key; pass conflict_columns."
+        )
+    upsert = (conflict_columns, update_columns)
+    return _write(db_client, table, rows, chunk_size, method, upsert)
@@ -1,10 +1,12 @@
 from contextlib import contextmanager
+from typing import Iterator, List
 
 from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
 from .db_config import DBConfig
+from .db_pool import TimedQueuePool, install_idle_pre_ping, pool_stats
 
 
 class DBClient:
@@ -45,12 +47,10 @@ class DBClient:
         self.auto_commit = auto_commit
         self.auto_flush = auto_flush
         self.expire_on_commit = expire_on_commit
+        self.db_config = db_config
 
         # Construct database connection string
-        self.connection_string = (
-            f"{db_config.dialect}://{db_config.username}:{db_config.password}@"
-            f"{db_config.host}:{db_config.port}/{db_config.dbname}"
-        )
+        self.connection_string = db_config.url()
         self.engine = self._create_engine()
         self.session_local = self._create_session()
 
@@ -64,10 +64,29 @@ class DBClient:
             SQLAlchemyError: If engine creation fails.
         """
         try:
-            return create_engine(self.connection_string, pool_pre_ping=True)
+            engine = create_engine(
+                self.connection_string,
+                poolclass=TimedQueuePool,
+                **self.db_config.pool_options(),
+            )
         except SQLAlchemyError as ex:
             raise SQLAlchemyError(f"Database engine creation failed: {str(ex)}") from ex
 
+        if self.db_config.pool_pre_ping and self.db_config.pool_pre_ping_idle:
+            install_idle_pre_ping(engine, self.db_config.pool_pre_ping_idle)
+        return engine
+
+    def pool_stats(self) -> dict:
+        """
+        Returns live statistics of the connection pool, to size it from data.
+
+        Returns:
+            dict: The configured size, the connections checked in and out, the
+                current overflow, and the checkout counters of `PoolStats.snapshot`
+                (checkouts, timeouts, total and maximum wait, wait histogram).
+        """
+        return pool_stats(self.engine.pool)
+
     def _create_session(self):
         """
         Creates and returns a session factory.
@@ -115,3 +134,99 @@ class DBClient:
             raise SQLAlchemyError(f"Session error: {str(ex)}") from ex
         finally:
             session.close()
+
+    def stream_query(
+        self,
+        statement,
+        partition_size: int = 1000,
+        scalars: bool = False,
+        keyset_column=None,
+        after=None,
+    ) -> Iterator[List]:
+        """
+        Runs a select and yields its rows in partitions of `partition_size`, so memory
+        stays flat however many rows the query returns.
+
+        Without `keyset_column`, the rows are streamed from a server-side cursor
+        (`yield_per`) in one transaction. With it, the rows are read page by page with
+        `WHERE keyset_column > last ORDER BY keyset_column LIMIT partition_size`, each
+        page in its own short transaction; an interrupted job resumes by passing the
+        key of the last row it processed as `after`. The ordering of the statement is
+        replaced by the keyset column, and it must not have a LIMIT or OFFSET.
+
+        Args:
+            statement (Select): The query, of columns (yielding lightweight rows) or
+                of mapped classes.
+            partition_size (int, optional): Rows per partition. Defaults to 1000.
+            scalars (bool, optional): Yield the first column of each row, e.g. the
+                ORM entities of `select(Model)`. Defaults to False.
+            keyset_column (optional): A unique, indexed column to page by, e.g.
+                `Model.id`; the statement must select it or its mapped class.
+            after (optional): Only read rows whose key is greater than this.
+        Returns:
+            Iterator[List]: The partitions of rows, read while iterating.
+        Raises:
+            ValueError: If partition_size is not positive, or with a keyset column, if
+                the statement has a LIMIT or OFFSET; raised by the call. While
+                iterating, if the keyset column is not selected.
+            SQLAlchemyError: If the query fails.
+        """
+        if partition_size < 1:
+            raise ValueError("'partition_size' must be positive")
+
+        if keyset_column is None:
+            return self._stream_partitions(statement, partition_size, scalars)
+
+        if (
+            getattr(statement, "_limit_clause", None) is not None
+            or getattr(statement, "_offset_clause", None) is not None
+        ):
+            raise ValueError(
+                "Keyset paging sets its own LIMIT; the statement must not have "
+                "a LIMIT or OFFSET."
+            )
+        return self._stream_keyset(
+            statement, partition_size, scalars, keyset_column, after
+        )
+
+    def _stream_partitions(self, statement, partition_size: int, scalars: bool):
+        with self.get_db_session() as session:
+            result = session.execute(
+                statement.execution_options(yield_per=partition_size)
+            )
+            if scalars:
+                result = result.scalars()
+            for partition in result.partitions():
+                yield partition
+
+    def _stream_keyset(
+        self, statement, partition_size: int, scalars: bool, keyset_column, after
+    ):
+        while True:
+            page = statement.order_by(None).order_by(keyset_column)
+            if after is not None:
+                page = page.where(keyset_column > after)
+            with self.get_db_session() as session:
+                result = session.execute(page.limit(partition_size))
+                partition = result.scalars().all() if scalars else result.all()
+            if not partition:
+                return
+            yield partition
+            if len(partition) < partition_size:
+                return
+            after = self._keyset_value(partition[-1], keyset_column)
+
+    @staticmethod
+    def _keyset_value(row, keyset_column):
+        """
+        Returns the key of a row: a Row holding the column, or an ORM entity.
+        """
+        mapping = getattr(row, "_mapping", None)
+        if mapping is None:
+            return getattr(row, keyset_column.key)
+        for key in (keyset_column, getattr(keyset_column, "expression", None)):
+            if key is not None and key in mapping:
+                return mapping[key]
+        if not hasattr(row[0], keyset_column.key):
+            raise ValueError("The statement must select the keyset column.")
+        return getattr(row[0], keyset_column.key)
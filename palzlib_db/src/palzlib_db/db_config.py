@@ -1,5 +1,8 @@
 from dataclasses import dataclass, field
 
+# Fields SQLite connections do without; `dbname` is the path of the database file
+SQLITE_OPTIONAL_FIELDS = ("username", "password", "host")
+
 
 @dataclass
 class DBConfig:
@@ -9,6 +12,21 @@ class DBConfig:
     host: str
     dialect: str = field(default="postgresql+psycopg2")
     port: int = field(default=5432)
+    # Connection pool: connections kept open, extra connections allowed under load
+    # (-1 for no limit), and seconds to wait for a connection before TimeoutError
+    pool_size: int = field(default=5)
+    max_overflow: int = field(default=10)
+    pool_timeout: float | int = field(default=30)
+    # Seconds after which a connection is replaced on checkout, -1 to never recycle
+    pool_recycle: int = field(default=-1)
+    # Test connections for liveness on checkout. With pool_pre_ping_idle > 0 only
+    # connections idle for longer than that many seconds are tested, which saves
+    # the round-trip on busy pools.
+    pool_pre_ping: bool = field(default=True)
+    pool_pre_ping_idle: float | int = field(default=0)
+    # Reuse the most recently returned connection first, so idle connections can
+    # time out server-side; the default is FIFO
+    pool_use_lifo: bool = field(default=False)
 
     def validate(self):
         """Validate the types and fields' values"""
@@ -20,11 +38,60 @@ class DBConfig:
                 msg = f"Invalid attribute type. '{field_name}' must be '{field_type}'"
                 raise TypeError(msg)
 
-            if field_value == "":
+            if field_value == "" and not (
+                self.is_sqlite and field_name in SQLITE_OPTIONAL_FIELDS
+            ):
                 error_msg = (
                     f"Missing value from the database configuration: '{field_name}'"
                 )
                 raise ValueError(error_msg)
 
+        if self.pool_size < 0:
+            raise ValueError("'pool_size' must not be negative")
+        if self.max_overflow < -1:
+            raise ValueError("'max_overflow' must be -1 (no limit) or more")
+        if self.pool_timeout <= 0:
+            raise ValueError("'pool_timeout' must be positive")
+        if self.pool_pre_ping_idle < 0:
+            raise ValueError("'pool_pre_ping_idle' must not be negative")
+
     def __post_init__(self) -> None:
         self.validate()
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self.dialect.split("+")[0] == "sqlite"
+
+    def url(self, dialect: str = None) -> str:
+        """
+        Returns the connection string.
+
+        Args:
+            dialect (str, optional): The dialect and driver to use instead of the
+                configured one, e.g. "postgresql+asyncpg" for the async client.
+        Returns:
+            str: The connection string; for SQLite, `dbname` is the database file.
+        """
+        dialect = dialect or self.dialect
+        if dialect.split("+")[0] == "sqlite":
+            return f"{dialect}:///{self.dbname}"
+        return (
+            f"{dialect}://{self.username}:{self.password}@"
+            f"{self.host}:{self.port}/{self.dbname}"
+        )
+
+    def pool_options(self) -> dict:
+        """
+        Returns the pool keyword arguments of `create_engine` for this configuration.
+
+        The idle-based pre-ping is not a `create_engine` option; it is installed by
+        the client as pool event listeners, see `palzlib_db.db_pool`.
+        """
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping and not self.pool_pre_ping_idle,
+            "pool_use_lifo": self.pool_use_lifo,
+        }
@@ -9,6 +9,7 @@ from sqlalchemy.ext.automap import (
 )
 
 from .db_client import DBClient
+from .db_metadata_cache import MetadataCache, schema_fingerprint
 
 
 class DBMapper:
@@ -17,14 +18,26 @@ class DBMapper:
 
     :param db_client: An instance of DBClient to connect to the database.
     :param mapping_tables: Optional list of table names to be mapped. If None, all tables are mapped.
+    :param metadata_cache_dir: Optional directory caching the reflected metadata between processes,
+        see `MetadataCache`. While the schema fingerprint matches, the mapping skips reflection.
     """
 
-    def __init__(self, db_client: DBClient, mapping_tables: list = None):
+    def __init__(
+        self,
+        db_client: DBClient,
+        mapping_tables: list = None,
+        metadata_cache_dir: str = None,
+    ):
         self.db_client = db_client
         self.mapping_tables = mapping_tables or []
         self.metadata = MetaData()
         self.db_classes = None
         self.sorted_tables: List[str] = []
+        self.metadata_cache = (
+            MetadataCache(metadata_cache_dir) if metadata_cache_dir else None
+        )
+        # Whether the last mapping was built from the metadata cache
+        self.loaded_from_cache = False
 
         self._initialize_mapping()
 
@@ -32,15 +45,54 @@ class DBMapper:
         if not self.db_client:
             return
 
+        self._map(self.db_client.engine)
+
+    def _map(self, bind):
+        """
+        Maps the tables from the metadata cache while it is fresh, otherwise reflects
+        them and refreshes the cache.
+
+        :param bind: The engine or connection to reflect through.
+        """
+        self.loaded_from_cache = False
+        if self.metadata_cache is None:
+            self._prepare(bind)
+            return
+
+        path = self.metadata_cache.path(bind, self.mapping_tables)
+        fingerprint = schema_fingerprint(bind)
+        metadata = self.metadata_cache.load(path, fingerprint)
+        if metadata is not None:
+            self.metadata = metadata
+            self._automap()
+            self.loaded_from_cache = True
+            return
+
+        self._prepare(bind)
+        self.metadata_cache.store(path, fingerprint, self.metadata)
+
+    def _prepare(self, bind):
+        """
+        Reflects the tables and views and automaps them.
+
+        :param bind: The engine or connection to reflect through.
+        """
         reflection_options = {"views": True}
         if self.mapping_tables:
             reflection_options["only"] = self.mapping_tables
 
-        self.metadata.reflect(self.db_client.engine, **reflection_options)
+        self.metadata.reflect(bind, **reflection_options)
+        self._automap(bind)
+
+    def _automap(self, bind=None):
+        """
+        Automaps the tables of the metadata.
 
+        :param bind: The engine or connection to reflect through; None maps the metadata as is.
+        """
         AutoBase = automap_base(metadata=self.metadata)
         # reflect the tables
-        AutoBase.prepare(self.db_client.engine)
+        AutoBase.prepare(bind)
 
         """ Optional
         AutoBase.prepare(
@@ -74,6 +126,41 @@ class DBMapper:
             return self.db_classes[item]
         raise KeyError(f"Key '{item}' not found in mapped classes.")
 
+    def is_metadata_cache_stale(self) -> bool:
+        """
+        Checks with one catalog query whether the schema changed since the metadata
+        cache was written, without loading it.
+
+        :return: True if there is no cache entry or it does not match the schema.
+        :raises TypeError: If the client is async; use `AsyncDBMapper.is_metadata_cache_stale_async`.
+        """
+        if hasattr(self.db_client.engine, "sync_engine"):
+            raise TypeError(
+                "The staleness check of an async client needs the event loop; "
+                "use 'await is_metadata_cache_stale_async()'."
+            )
+        if self.metadata_cache is None:
+            return True
+        fingerprint = schema_fingerprint(self.db_client.engine)
+        return self._is_stale(fingerprint)
+
+    def _is_stale(self, fingerprint) -> bool:
+        stored = self.metadata_cache.stored_fingerprint(self._cache_path())
+        return fingerprint is None or stored != fingerprint
+
+    def _cache_path(self) -> str:
+        # The sync engine behind an AsyncEngine, which `_map` reflects through
+        engine = getattr(self.db_client.engine, "sync_engine", self.db_client.engine)
+        return self.metadata_cache.path(engine, self.mapping_tables)
+
+    def invalidate_metadata_cache(self):
+        """
+        Removes this mapping's metadata cache entry, e.g. after a migration; the next
+        mapper reflects the database again.
+        """
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(self._cache_path())
+
     def get_model(self, item: str, default=None):
         return self.db_classes.get(item, default) if self.db_classes else default
 
@@ -118,3 +205,57 @@ class DBMapper:
                 base, local_cls, referred_cls, constraint
             )
         )
+
+
+class AsyncDBMapper(DBMapper):
+    """
+    DBMapper for an AsyncDBClient. Reflection is a sync API, so it runs on the
+    async connection through `run_sync`; create instances with `await AsyncDBMapper.create(...)`.
+
+    The mapped classes are used with `AsyncSession` as usual, e.g.
+    `await session.execute(select(db_mapper.articles))`.
+
+    The metadata cache staleness check queries the database, so it is the coroutine
+    `is_metadata_cache_stale_async`; the sync `is_metadata_cache_stale` raises TypeError.
+    """
+
+    @classmethod
+    async def create(
+        cls, db_client, mapping_tables: list = None, metadata_cache_dir: str = None
+    ) -> "AsyncDBMapper":
+        """
+        Creates the mapper and reflects the tables.
+
+        :param db_client: An instance of AsyncDBClient to connect to the database.
+        :param mapping_tables: Optional list of table names to be mapped. If None, all tables are mapped.
+        :param metadata_cache_dir: Optional directory caching the reflected metadata, see `DBMapper`.
+        :return: The initialized mapper.
+        """
+        db_mapper = cls(db_client, mapping_tables, metadata_cache_dir)
+        await db_mapper.initialize()
+        return db_mapper
+
+    def _initialize_mapping(self):
+        # Reflection needs the event loop, see `initialize`
+        pass
+
+    async def initialize(self):
+        """
+        Reflects the tables and views and automaps them.
+        """
+        if not self.db_client:
+            return
+
+        async with self.db_client.engine.connect() as connection:
+            await connection.run_sync(self._map)
+
+    async def is_metadata_cache_stale_async(self) -> bool:
+        """
+        Checks whether the schema changed since the metadata cache was written, see
+        `DBMapper.is_metadata_cache_stale`.
+        """
+        if self.metadata_cache is None:
+            return True
+        async with self.db_client.engine.connect() as connection:
+            fingerprint = await connection.run_sync(schema_fingerprint)
+        return self._is_stale(fingerprint)
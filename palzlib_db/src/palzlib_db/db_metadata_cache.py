@@ -0,0 +1,163 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from typing import List, Optional
+
+import sqlalchemy
+from sqlalchemy import MetaData, text
+
+logger = logging.getLogger(__name__)
+
+# One catalog query per dialect, returning the rows the fingerprint is hashed from
+FINGERPRINT_QUERIES = {
+    "postgresql": """
+        SELECT c.relname::text, c.relkind::text,
+               a.attnum::text || ' ' || a.attname || ' '
+               || format_type(a.atttypid, a.atttypmod) || ' ' || a.attnotnull::text
+               || ' ' || coalesce(pg_get_expr(d.adbin, d.adrelid), '')
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_catalog.pg_attribute a
+            ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+        LEFT JOIN pg_catalog.pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+        WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+        UNION ALL
+        SELECT c.relname::text, 'constraint', con.conname || ' '
+               || pg_get_constraintdef(con.oid)
+        FROM pg_catalog.pg_constraint con
+        JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema()
+        UNION ALL
+        SELECT tablename::text, 'index', indexdef
+        FROM pg_catalog.pg_indexes
+        WHERE schemaname = current_schema()
+        ORDER BY 1, 2, 3
+    """,
+    "sqlite": "SELECT type, name, tbl_name, sql FROM sqlite_master ORDER BY type, name",
+}
+
+
+def schema_fingerprint(bind) -> Optional[str]:
+    """
+    Returns a hash of the tables, views, columns, constraints and indexes of the
+    current schema, read with a single catalog query.
+
+    Args:
+        bind (Engine | Connection): The database to fingerprint.
+    Returns:
+        str: The fingerprint, or None if the dialect is not supported.
+    """
+    query = FINGERPRINT_QUERIES.get(bind.dialect.name)
+    if query is None:
+        return None
+
+    digest = hashlib.sha256()
+    if isinstance(bind, sqlalchemy.engine.Engine):
+        with bind.connect() as connection:
+            rows = connection.execute(text(query)).all()
+    else:
+        rows = bind.execute(text(query)).all()
+    for row in rows:
+        digest.update(repr(tuple(row)).encode())
+    return digest.hexdigest()
+
+
+class MetadataCache:
+    """
+    On-disk cache of reflected `MetaData`, so cold starts skip reflection.
+
+    An entry is identified by the database URL (without the password), the mapped
+    tables and the SQLAlchemy version, and is valid while the schema fingerprint it
+    was stored with matches the database. The entries are pickles: only use a cache
+    directory that is not writable by others.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def path(self, bind, mapping_tables: List[str] = None) -> str:
+        """
+        Returns:
+            str: The file of the entry for a database and mapped tables.
+        """
+        engine = bind if isinstance(bind, sqlalchemy.engine.Engine) else bind.engine
+        identity = repr(
+            (
+                engine.url.render_as_string(hide_password=True),
+                sorted(mapping_tables or []),
+                sqlalchemy.__version__,
+            )
+        )
+        name = hashlib.sha256(identity.encode()).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"{name}.metadata.pickle")
+
+    def stored_fingerprint(self, path: str) -> Optional[str]:
+        """
+        Returns the fingerprint an entry was stored with, without loading its
+        MetaData, or None if there is no readable entry.
+        """
+        try:
+            with open(path, "rb") as file:
+                return pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def load(self, path: str, fingerprint: Optional[str]) -> Optional[MetaData]:
+        """
+        Returns:
+            MetaData: The cached MetaData, or None if the entry is missing, stale
+                or unreadable.
+        """
+        if fingerprint is None:
+            return None
+        try:
+            with open(path, "rb") as file:
+                if pickle.load(file) != fingerprint:
+                    return None
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            # e.g. written by an incompatible SQLAlchemy version; reflect again
+            logger.warning("Ignoring unreadable metadata cache %s: %s", path, ex)
+            return None
+
+    def store(self, path: str, fingerprint: Optional[str], metadata: MetaData):
+        """
+        Writes an entry atomically, so concurrent workers never read a partial file.
+        """
+        if fingerprint is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(fingerprint, file)
+                pickle.dump(metadata, file)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def invalidate(self, path: str = None):
+        """
+        Removes an entry, or every entry without a path.
+        """
+        if path is not None:
+            paths = [path]
+        elif os.path.isdir(self.cache_dir):
+            paths = [
+                os.path.join(self.cache_dir, name)
+                for name in os.listdir(self.cache_dir)
+                if name.endswith(".metadata.pickle")
+            ]
+        else:
+            paths = []
+        for entry in paths:
+            try:
+                os.remove(entry)
+            except FileNotFoundError:
+                pass
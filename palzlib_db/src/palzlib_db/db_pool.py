@@ -0,0 +1,138 @@
+import bisect
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import DisconnectionError, TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds in seconds of the checkout wait histogram buckets; slower checkouts
+# fall into a last, unbounded bucket
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+class PoolStats:
+    """
+    Thread-safe counters of connection checkouts, used to size pools from data.
+
+    The wait of a checkout is the time `Pool.connect()` takes: waiting for a free
+    connection, opening a new one and the pre-ping, if enabled.
+    """
+
+    def __init__(self, buckets: tuple = WAIT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._wait_seconds += seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, seconds)
+            if timed_out:
+                self._timeouts += 1
+            else:
+                self._checkouts += 1
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._checkouts = 0
+            self._timeouts = 0
+            self._wait_seconds = 0.0
+            self._max_wait_seconds = 0.0
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: The number of checkouts and timeouts, the total and maximum wait in
+                seconds, and the wait histogram as {upper bound: count}, where each
+                count covers the waits above the previous bound.
+        """
+        with self._lock:
+            bounds = self.buckets + (float("inf"),)
+            return {
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_seconds": self._wait_seconds,
+                "max_wait_seconds": self._max_wait_seconds,
+                "wait_histogram": dict(zip(bounds, self._counts)),
+            }
+
+
+class TimedPoolMixin:
+    """
+    Records the wait of every checkout of a pool in its `stats`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def recreate(self):
+        # Engine.dispose() replaces the pool; keep counting into the same stats
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except TimeoutError:
+            self.stats.observe(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.observe(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(pool) -> dict:
+    """
+    Returns:
+        dict: The configured size, the connections checked in and out, the current
+            overflow, and the checkout counters of the pool's `PoolStats`.
+    """
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        **pool.stats.snapshot(),
+    }
+
+
+def install_idle_pre_ping(engine, idle_seconds: float):
+    """
+    Tests connections for liveness on checkout only when they were idle in the pool
+    for longer than `idle_seconds`, instead of on every checkout like `pool_pre_ping`.
+
+    A connection failing the test is discarded, and the pool retries the checkout
+    with a new connection.
+
+    Args:
+        engine (Engine): The engine; an `AsyncEngine` is given as its `sync_engine`.
+        idle_seconds (float): The idle time after which connections are tested.
+    """
+    dialect = engine.dialect
+
+    @event.listens_for(engine, "checkin")
+    def _record_checkin(dbapi_connection, connection_record):
+        connection_record.info["palzlib_checkin_time"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _ping_idle(dbapi_connection, connection_record, connection_proxy):
+        checkin_time = connection_record.info.get("palzlib_checkin_time")
+        if checkin_time is None or time.monotonic() - checkin_time <= idle_seconds:
+            return
+        try:
+            dialect.do_ping(dbapi_connection)
+        except Exception as ex:
+            raise DisconnectionError(f"Idle connection failed the ping: {ex}") from ex
@@ -0,0 +1,85 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from palzlib_db.async_db_client import AsyncDBClient
+from palzlib_db.db_config import DBConfig
+from palzlib_db.db_mapper import AsyncDBMapper
+
+
+def make_config(tmp_path, **pool_settings):
+    path = str(tmp_path / "async.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT)")
+    connection.commit()
+    connection.close()
+    return DBConfig("", "", path, "", dialect="sqlite", **pool_settings)
+
+
+def test_sync_dialect_maps_to_the_async_driver(tmp_path):
+    db_client = AsyncDBClient(make_config(tmp_path))
+
+    assert db_client.connection_string.startswith("sqlite+aiosqlite:///")
+    asyncio.run(db_client.dispose())
+
+
+def test_sessions_commit_and_roll_back(tmp_path):
+    async def main():
+        db_client = AsyncDBClient(make_config(tmp_path))
+        db_mapper = await AsyncDBMapper.create(db_client, mapping_tables=["articles"])
+        Article = db_mapper.articles
+
+        async with db_client.get_db_session() as session:
+            session.add(Article(id=1, title="kept"))
+            await session.commit()
+        with pytest.raises(SQLAlchemyError):
+            async with db_client.get_db_session() as session:
+                session.add(Article(id=2, title="rolled back"))
+                await session.flush()
+                await session.execute(text("SELECT missing_column FROM articles"))
+
+        async def count():
+            async with db_client.get_db_session() as session:
+                return (await session.execute(select(func.count(Article.id)))).scalar()
+
+        counts = await asyncio.gather(*(count() for _ in range(20)))
+        stats = db_client.pool_stats()
+        await db_client.dispose()
+        return db_mapper, counts, stats
+
+    db_mapper, counts, stats = asyncio.run(main())
+
+    assert db_mapper.sorted_tables == ["articles"]
+    assert counts == [1] * 20
+    assert stats["checkouts"] >= 22
+    assert stats["checked_out"] == 0
+
+
+def test_async_mapper_uses_the_metadata_cache(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+
+    async def main():
+        db_client = AsyncDBClient(make_config(tmp_path, pool_pre_ping_idle=30))
+        first = await AsyncDBMapper.create(db_client, metadata_cache_dir=cache_dir)
+        second = await AsyncDBMapper.create(db_client, metadata_cache_dir=cache_dir)
+        fresh = not await second.is_metadata_cache_stale_async()
+        second.invalidate_metadata_cache()
+        stale = await second.is_metadata_cache_stale_async()
+        await db_client.dispose()
+        return first, second, fresh, stale
+
+    first, second, fresh, stale = asyncio.run(main())
+
+    assert not first.loaded_from_cache
+    assert second.loaded_from_cache
+    assert list(second.db_classes.keys()) == ["articles"]
+    assert fresh and stale
+    with pytest.raises(TypeError):
+        second.is_metadata_cache_stale()
@@ -0,0 +1,133 @@
+import pytest
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, func, select
+from sqlalchemy.exc import IntegrityError
+
+from palzlib_db.db_bulk import _copy_value, bulk_insert, bulk_upsert
+from palzlib_db.db_client import DBClient
+from palzlib_db.db_config import DBConfig
+
+
+def make_client(tmp_path):
+    db_client = DBClient(
+        DBConfig("", "", str(tmp_path / "bulk.db"), "", dialect="sqlite")
+    )
+    metadata = MetaData()
+    table = Table(
+        "sentiments",
+        metadata,
+        Column("article_id", Integer, primary_key=True, autoincrement=False),
+        Column("sentiment_label", String(16)),
+        Column("sentiment_value", Float),
+    )
+    metadata.create_all(db_client.engine)
+    return db_client, table
+
+
+def make_rows(start, stop, label="positive"):
+    return [
+        {"article_id": i, "sentiment_label": label, "sentiment_value": i / 100}
+        for i in range(start, stop)
+    ]
+
+
+def read_rows(db_client, table):
+    with db_client.engine.connect() as connection:
+        return connection.execute(select(table).order_by(table.c.article_id)).all()
+
+
+@pytest.mark.parametrize("method", ["executemany", "values", "auto"])
+def test_bulk_insert_writes_every_chunk(tmp_path, method):
+    db_client, table = make_client(tmp_path)
+
+    written = bulk_insert(
+        db_client, table, iter(make_rows(0, 1203)), chunk_size=500, method=method
+    )
+
+    rows = read_rows(db_client, table)
+    assert written == 1203
+    assert len(rows) == 1203
+    assert rows[7] == (7, "positive", 0.07)
+
+
+def test_values_method_splits_by_the_parameter_limit(tmp_path, monkeypatch):
+    db_client, table = make_client(tmp_path)
+    monkeypatch.setattr(db_client.engine.dialect, "insertmanyvalues_max_parameters", 30)
+
+    assert bulk_insert(db_client, table, make_rows(0, 95), method="values") == 95
+    assert len(read_rows(db_client, table)) == 95
+
+
+def test_bulk_upsert_updates_all_non_conflict_columns_by_default(tmp_path):
+    db_client, table = make_client(tmp_path)
+    bulk_insert(db_client, table, make_rows(0, 10))
+
+    written = bulk_upsert(db_client, table, make_rows(5, 15, label="negative"))
+
+    rows = read_rows(db_client, table)
+    assert written == 10
+    assert len(rows) == 15
+    assert [row.sentiment_label for row in rows] == ["positive"] * 5 + ["negative"] * 10
+
+
+def test_bulk_upsert_updates_only_the_given_columns(tmp_path):
+    db_client, table = make_client(tmp_path)
+    bulk_insert(db_client, table, make_rows(0, 3))
+    changed = [
+        {"article_id": 1, "sentiment_label": "negative", "sentiment_value": 0.9}
+    ]
+
+    bulk_upsert(
+        db_client, table, changed, update_columns=["sentiment_value"], method="values"
+    )
+
+    assert read_rows(db_client, table)[1] == (1, "positive", 0.9)
+
+
+def test_bulk_upsert_with_no_update_columns_keeps_existing_rows(tmp_path):
+    db_client, table = make_client(tmp_path)
+    bulk_insert(db_client, table, make_rows(0, 3))
+
+    written = bulk_upsert(
+        db_client, table, make_rows(2, 4, label="negative"), update_columns=[]
+    )
+
+    rows = read_rows(db_client, table)
+    assert written == 2
+    assert [row.sentiment_label for row in rows] == [
+        "positive",
+        "positive",
+        "positive",
+        "negative",
+    ]
+
+
+def test_chunks_before_a_failure_stay_committed(tmp_path):
+    db_client, table = make_client(tmp_path)
+    # The third chunk repeats a key of the first
+    rows = make_rows(0, 20) + make_rows(0, 10)
+
+    with pytest.raises(IntegrityError) as error:
+        bulk_insert(db_client, table, rows, chunk_size=10, method="executemany")
+
+    assert error.value.written == 20
+    with db_client.engine.connect() as connection:
+        assert connection.execute(select(func.count()).select_from(table)).scalar() == 20
+
+
+def test_invalid_arguments_are_rejected(tmp_path):
+    db_client, table = make_client(tmp_path)
+
+    with pytest.raises(ValueError):
+        bulk_insert(db_client, table, make_rows(0, 1), method="bulk")
+    with pytest.raises(ValueError):
+        bulk_insert(db_client, table, make_rows(0, 1), chunk_size=0)
+    with pytest.raises(ValueError):
+        bulk_insert(db_client, table, make_rows(0, 1), method="copy")
+
+
+def test_copy_values_are_csv_encoded():
+    values = [None, "", 1, 0.5, True, 'a"b', {"k": 1}, b"\x00\xff"]
+
+    assert ",".join(_copy_value(value) for value in values) == (
+        ',"",1,0.5,true,"a""b","{""k"": 1}","\\x00ff"'
+    )
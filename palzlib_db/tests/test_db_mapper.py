@@ -0,0 +1,110 @@
+import pickle
+import sqlite3
+
+import pytest
+from sqlalchemy import event
+
+from palzlib_db.db_client import DBClient
+from palzlib_db.db_config import DBConfig
+from palzlib_db.db_mapper import DBMapper
+from palzlib_db.db_metadata_cache import MetadataCache, schema_fingerprint
+
+
+def make_database(tmp_path):
+    path = str(tmp_path / "mapper.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT)")
+    connection.execute(
+        "CREATE TABLE sentiments (id INTEGER PRIMARY KEY,"
+        " article_id INTEGER REFERENCES articles(id), label TEXT)"
+    )
+    connection.commit()
+    connection.close()
+    return path
+
+
+def make_mapper(path, cache_dir, mapping_tables=None):
+    db_client = DBClient(DBConfig("", "", path, "", dialect="sqlite"))
+    queries = []
+    event.listen(
+        db_client.engine,
+        "before_cursor_execute",
+        lambda *args: queries.append(args[2]),
+    )
+    db_mapper = DBMapper(db_client, mapping_tables, metadata_cache_dir=str(cache_dir))
+    return db_mapper, queries
+
+
+def execute(path, statement):
+    connection = sqlite3.connect(path)
+    connection.execute(statement)
+    connection.commit()
+    connection.close()
+
+
+def test_second_mapper_loads_from_cache(tmp_path):
+    path = make_database(tmp_path)
+
+    first, first_queries = make_mapper(path, tmp_path / "cache")
+    second, second_queries = make_mapper(path, tmp_path / "cache")
+
+    assert not first.loaded_from_cache
+    assert second.loaded_from_cache
+    # Only the fingerprint query
+    assert len(second_queries) == 1 < len(first_queries)
+    assert second.sorted_tables == first.sorted_tables
+    assert sorted(second.db_classes.keys()) == ["articles", "sentiments"]
+    assert not second.is_metadata_cache_stale()
+
+
+def test_schema_change_makes_the_cache_stale(tmp_path):
+    path = make_database(tmp_path)
+    db_mapper, _ = make_mapper(path, tmp_path / "cache")
+
+    execute(path, "ALTER TABLE articles ADD COLUMN body TEXT")
+
+    assert db_mapper.is_metadata_cache_stale()
+    remapped, _ = make_mapper(path, tmp_path / "cache")
+    assert not remapped.loaded_from_cache
+    assert "body" in remapped.articles.__table__.columns
+    assert not remapped.is_metadata_cache_stale()
+
+
+def test_invalidate_metadata_cache_forces_reflection(tmp_path):
+    path = make_database(tmp_path)
+    db_mapper, _ = make_mapper(path, tmp_path / "cache")
+
+    db_mapper.invalidate_metadata_cache()
+
+    assert db_mapper.is_metadata_cache_stale()
+    assert not make_mapper(path, tmp_path / "cache")[0].loaded_from_cache
+
+
+def test_entries_are_keyed_by_the_mapped_tables(tmp_path):
+    path = make_database(tmp_path)
+    make_mapper(path, tmp_path / "cache")
+
+    db_mapper, _ = make_mapper(path, tmp_path / "cache", mapping_tables=["articles"])
+
+    assert not db_mapper.loaded_from_cache
+    assert make_mapper(path, tmp_path / "cache", ["articles"])[0].loaded_from_cache
+
+
+@pytest.mark.parametrize("content", [b"not a pickle", None])
+def test_unreadable_entry_falls_back_to_reflection(tmp_path, content):
+    path = make_database(tmp_path)
+    db_mapper, _ = make_mapper(path, tmp_path / "cache")
+    entry = db_mapper._cache_path()
+    if content is None:
+        # A valid fingerprint followed by a truncated MetaData pickle
+        fingerprint = schema_fingerprint(db_mapper.db_client.engine)
+        content = pickle.dumps(fingerprint) + pickle.dumps(db_mapper.metadata)[:20]
+    with open(entry, "wb") as file:
+        file.write(content)
+
+    assert MetadataCache(str(tmp_path / "cache")).load(entry, "fingerprint") is None
+    remapped, _ = make_mapper(path, tmp_path / "cache")
+    assert not remapped.loaded_from_cache
+    assert sorted(remapped.db_classes.keys()) == ["articles", "sentiments"]
+    # The entry was rewritten
+    assert make_mapper(path, tmp_path / "cache")[0].loaded_from_cache
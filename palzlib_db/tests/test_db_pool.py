@@ -0,0 +1,125 @@
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError
+
+from palzlib_db.db_client import DBClient
+from palzlib_db.db_config import DBConfig
+from palzlib_db.db_pool import PoolStats, TimedQueuePool, install_idle_pre_ping
+
+
+def make_config(**pool_settings):
+    return DBConfig("user", "secret", "news", "localhost", **pool_settings)
+
+
+@pytest.mark.parametrize(
+    "pool_settings",
+    [
+        {"pool_size": -1},
+        {"max_overflow": -2},
+        {"pool_timeout": 0},
+        {"pool_pre_ping_idle": -1},
+    ],
+)
+def test_invalid_pool_settings_are_rejected(pool_settings):
+    with pytest.raises(ValueError):
+        make_config(**pool_settings)
+
+
+def test_pool_settings_are_type_checked():
+    with pytest.raises(TypeError):
+        make_config(pool_size="5")
+
+
+def test_pool_options_keep_the_previous_defaults():
+    assert make_config().pool_options() == {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": -1,
+        "pool_pre_ping": True,
+        "pool_use_lifo": False,
+    }
+
+
+def test_idle_pre_ping_replaces_the_pre_ping_on_every_checkout():
+    options = make_config(pool_pre_ping_idle=30, pool_use_lifo=True).pool_options()
+
+    assert options["pool_pre_ping"] is False
+    assert options["pool_use_lifo"] is True
+
+
+def test_pool_stats_counts_checkouts_into_the_histogram():
+    stats = PoolStats(buckets=(0.01, 0.1))
+
+    for seconds in (0.001, 0.01, 0.05, 2.0):
+        stats.observe(seconds)
+    stats.observe(0.2, timed_out=True)
+
+    snapshot = stats.snapshot()
+    assert snapshot["checkouts"] == 4
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_seconds"] == pytest.approx(2.261)
+    assert snapshot["max_wait_seconds"] == 2.0
+    assert snapshot["wait_histogram"] == {0.01: 2, 0.1: 1, float("inf"): 2}
+
+    stats.reset()
+    assert stats.snapshot()["checkouts"] == 0
+
+
+def test_client_pool_stats_report_checkouts_and_timeouts(tmp_path):
+    config = DBConfig(
+        "",
+        "",
+        str(tmp_path / "pool.db"),
+        "",
+        dialect="sqlite",
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    db_client = DBClient(config)
+
+    with db_client.engine.connect(), db_client.engine.connect():
+        assert db_client.pool_stats()["checked_out"] == 2
+        with pytest.raises(TimeoutError):
+            db_client.engine.connect()
+    # The stats survive the pool being replaced
+    db_client.engine.dispose()
+    with db_client.engine.connect():
+        pass
+
+    stats = db_client.pool_stats()
+    assert stats["size"] == 2
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 3
+    assert stats["timeouts"] == 1
+    assert sum(stats["wait_histogram"].values()) == 4
+
+
+def test_idle_pre_ping_tests_only_idle_connections(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ping.db'}", poolclass=TimedQueuePool)
+    pings = []
+    ping = engine.dialect.do_ping
+
+    def failing_first_ping(dbapi_connection):
+        pings.append(dbapi_connection)
+        if len(pings) == 1:
+            raise RuntimeError("connection lost")
+        return ping(dbapi_connection)
+
+    engine.dialect.do_ping = failing_first_ping
+    install_idle_pre_ping(engine, 0.02)
+
+    with engine.connect():
+        pass
+    with engine.connect():
+        pass
+    assert pings == []
+
+    time.sleep(0.05)
+    with engine.connect() as connection:
+        # The failed ping discarded the connection; the checkout got a new one
+        assert connection.exec_driver_sql("SELECT 1").scalar() == 1
+    assert len(pings) == 1
@@ -0,0 +1,102 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import select
+
+from palzlib_db.db_client import DBClient
+from palzlib_db.db_config import DBConfig
+from palzlib_db.db_mapper import DBMapper
+
+
+def make_mapper(tmp_path, size=25):
+    path = str(tmp_path / "stream.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT)")
+    connection.executemany(
+        "INSERT INTO articles VALUES (?, ?)",
+        ((i, f"title {i}") for i in range(1, size + 1)),
+    )
+    connection.commit()
+    connection.close()
+    db_client = DBClient(DBConfig("", "", path, "", dialect="sqlite"))
+    return db_client, DBMapper(db_client).articles
+
+
+def test_streams_rows_in_fixed_size_partitions(tmp_path):
+    db_client, Article = make_mapper(tmp_path)
+
+    partitions = list(
+        db_client.stream_query(
+            select(Article.id, Article.title).order_by(Article.id), partition_size=10
+        )
+    )
+
+    assert [len(partition) for partition in partitions] == [10, 10, 5]
+    assert partitions[0][0] == (1, "title 1")
+    assert [row.id for partition in partitions for row in partition] == list(range(1, 26))
+
+
+def test_streams_orm_entities_with_scalars(tmp_path):
+    db_client, Article = make_mapper(tmp_path)
+
+    partitions = list(
+        db_client.stream_query(select(Article), partition_size=20, scalars=True)
+    )
+
+    assert [len(partition) for partition in partitions] == [20, 5]
+    assert isinstance(partitions[0][0], Article)
+
+
+@pytest.mark.parametrize("scalars", [False, True])
+def test_keyset_paging_resumes_after_a_key(tmp_path, scalars):
+    db_client, Article = make_mapper(tmp_path)
+    statement = select(Article) if scalars else select(Article.id, Article.title)
+
+    partitions = list(
+        db_client.stream_query(
+            statement.order_by(Article.title.desc()),
+            partition_size=10,
+            scalars=scalars,
+            keyset_column=Article.id,
+            after=3,
+        )
+    )
+
+    assert [len(partition) for partition in partitions] == [10, 10, 2]
+    # The caller's ordering is replaced by the keyset column
+    ids = [row.id for partition in partitions for row in partition]
+    assert ids == list(range(4, 26))
+
+
+def test_keyset_paging_stops_on_an_exactly_full_last_page(tmp_path):
+    db_client, Article = make_mapper(tmp_path, size=20)
+
+    partitions = list(
+        db_client.stream_query(
+            select(Article.id), partition_size=10, keyset_column=Article.id
+        )
+    )
+
+    assert [len(partition) for partition in partitions] == [10, 10]
+
+
+def test_keyset_paging_rejects_limit_and_offset_at_the_call(tmp_path):
+    db_client, Article = make_mapper(tmp_path)
+
+    with pytest.raises(ValueError):
+        db_client.stream_query(select(Article).limit(5), keyset_column=Article.id)
+    with pytest.raises(ValueError):
+        db_client.stream_query(select(Article).offset(5), keyset_column=Article.id)
+    with pytest.raises(ValueError):
+        db_client.stream_query(select(Article), partition_size=0)
+
+
+def test_keyset_column_must_be_selected(tmp_path):
+    db_client, Article = make_mapper(tmp_path)
+
+    with pytest.raises(ValueError):
+        list(
+            db_client.stream_query(
+                select(Article.title), partition_size=5, keyset_column=Article.id
+            )
+        )
@@ -0,0 +1,101 @@
+"""
+Benchmark for the length-bucketed batching of the transformer analyzers.
+
+Compares the padded-token waste and the wall time of scoring a mixed-length corpus
+(short headlines mixed with long article bodies) with:
+    - the pipeline, one text per forward pass (what `analyze_batch(texts)` does)
+    - the pipeline, `batch_size` texts per forward pass in input order
+    - the length-bucketed path (`analyze_batch(texts, batch_size=...)`)
+
+Usage:
+    python benchmarks/bench_length_buckets.py --language hun --size 256 --batch-size 16
+"""
+import argparse
+import random
+import time
+
+from sentiment_analyzer.analyzers.dan.sentiment_analyzer import DanishSentimentAnalyzer
+from sentiment_analyzer.analyzers.hun.sentiment_analyzer import HungarianSentimentAnalyzer
+
+ANALYZERS = {
+    "hun": HungarianSentimentAnalyzer,
+    "dan": DanishSentimentAnalyzer,
+}
+
+WORDS = (
+    "market government election budget inflation company results growth crisis "
+    "minister report energy prices football match team players season film "
+    "review story city police court decision record profit loss strike"
+).split()
+
+
+def make_corpus(size: int, long_ratio: float, seed: int) -> list:
+    """
+    Builds a synthetic corpus of short headlines mixed with long article bodies.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        word_count = rng.randint(150, 250) if rng.random() < long_ratio else rng.randint(5, 15)
+        corpus.append(" ".join(rng.choice(WORDS) for _ in range(word_count)))
+    return corpus
+
+
+def padded_tokens(lengths: list, batch_size: int) -> int:
+    """
+    Counts the tokens (real and padding) fed to the model when `lengths` are
+    batched `batch_size` at a time and padded to the longest item of each batch.
+    """
+    return sum(
+        max(lengths[start : start + batch_size]) * len(lengths[start : start + batch_size])
+        for start in range(0, len(lengths), batch_size)
+    )
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--language", choices=sorted(ANALYZERS), default="hun")
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--long-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    analyzer = ANALYZERS[args.language]()
+    corpus = make_corpus(args.size, args.long_ratio, args.seed)
+    lengths = [len(ids) for ids in analyzer.tokenizer(corpus, truncation=True)["input_ids"]]
+    real_tokens = sum(lengths)
+
+    print(f"corpus: {len(corpus)} texts, {real_tokens} tokens, batch size {args.batch_size}")
+    for name, batch_lengths in (
+        ("input order", lengths),
+        ("length buckets", sorted(lengths)),
+    ):
+        total = padded_tokens(batch_lengths, args.batch_size)
+        waste = total - real_tokens
+        print(f"  {name:<15} {total:>9} tokens fed, {waste:>9} padding ({waste / total:.1%})")
+
+    # Warm-up, so the first measured run does not pay for lazy initialization
+    analyzer.analyze_batch(corpus[: args.batch_size], batch_size=args.batch_size)
+
+    runs = (
+        ("pipeline, unbatched", lambda: analyzer.pipeline(corpus, truncation=True)),
+        (
+            "pipeline, batched",
+            lambda: analyzer.pipeline(corpus, batch_size=args.batch_size, truncation=True),
+        ),
+        ("length buckets", lambda: analyzer.analyze_batch(corpus, batch_size=args.batch_size)),
+    )
+    for name, run in runs:
+        elapsed = timed(run)
+        print(f"  {name:<20} {elapsed:8.2f} s  {len(corpus) / elapsed:8.1f} texts/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Accuracy drift and throughput of the ONNX Runtime backends against the torch backend.
+
+For every backend the script scores the same synthetic corpus and reports the throughput,
+the largest absolute difference of the class probabilities from the torch backend and the
+share of texts whose label differs. It exits with status 1 when the drift of a backend
+exceeds its tolerance.
+
+Usage:
+    python benchmarks/bench_onnx.py --language hun --size 512
+"""
+import argparse
+import sys
+import time
+
+from bench_length_buckets import ANALYZERS, make_corpus
+
+# The largest tolerated absolute probability difference from the torch backend
+TOLERANCES = {
+    "onnx": 1e-3,
+    "onnx-int8": 0.1,
+}
+SCORE_FIELDS = ("very_negative", "negative", "neutral", "positive", "very_positive")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--language", choices=sorted(ANALYZERS), default="hun")
+    parser.add_argument("--size", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--long-ratio", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.size, args.long_ratio, args.seed)
+    failed = False
+    reference = None
+
+    for backend in ("torch", "onnx", "onnx-int8"):
+        analyzer = ANALYZERS[args.language](backend=backend)
+        # Warm-up, so the measured run does not pay for lazy initialization
+        analyzer.analyze_batch(corpus[: args.batch_size], batch_size=args.batch_size)
+
+        start = time.perf_counter()
+        results = analyzer.analyze_batch(corpus, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+        line = f"{backend:<10} {len(corpus) / elapsed:9.1f} texts/s"
+
+        if reference is None:
+            reference = results
+        else:
+            drift = max(
+                abs(getattr(result, name) - getattr(expected, name))
+                for result, expected in zip(results, reference)
+                for name in SCORE_FIELDS
+            )
+            flipped = sum(
+                result.sentiment_label != expected.sentiment_label
+                for result, expected in zip(results, reference)
+            )
+            line += f"  max drift {drift:.5f}  label changes {flipped / len(corpus):.2%}"
+            if drift > TOLERANCES[backend]:
+                line += f"  (exceeds {TOLERANCES[backend]})"
+                failed = True
+        print(line)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
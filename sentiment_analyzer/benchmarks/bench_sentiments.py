@@ -0,0 +1,106 @@
+"""
+Benchmark for building `Sentiments` from model predictions.
+
+Compares the wall time and the peak traced memory of mapping synthetic pipeline
+predictions to `Sentiments`:
+    - one by one, as the language analyzers did (a dict per prediction, then `__post_init__`)
+    - from the collected probability matrix with `Sentiments.from_probabilities`
+    - into a columnar `SentimentBatch` with `SentimentBatch.from_probabilities`
+and checks that all paths give identical results. No model is loaded.
+
+Usage:
+    python benchmarks/bench_sentiments.py --size 100000 --classes 5
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from sentiment_analyzer.models.sentiment_batch import SentimentBatch
+from sentiment_analyzer.models.sentiments import LABEL_MAPPING_ROBERTA, Sentiments
+
+FIELDS = {
+    3: {"negativ": "negative", "neutral": "neutral", "positiv": "positive"},
+    5: LABEL_MAPPING_ROBERTA,
+}
+
+
+def make_predictions(size: int, label_fields: dict, seed: int) -> list:
+    """
+    Builds predictions in the pipeline's format: label/score dicts sorted by score.
+    """
+    rng = np.random.default_rng(seed)
+    labels = list(label_fields)
+    predictions = []
+    for row in rng.dirichlet(np.ones(len(labels)), size=size).tolist():
+        items = [{"label": label, "score": score} for label, score in zip(labels, row)]
+        predictions.append(sorted(items, key=lambda item: item["score"], reverse=True))
+    return predictions
+
+
+def per_prediction(predictions: list, label_fields: dict) -> list:
+    return [
+        Sentiments(**{label_fields[item["label"]]: round(item["score"], 4) for item in prediction})
+        for prediction in predictions
+    ]
+
+
+def probability_matrix(predictions: list, label_fields: dict):
+    labels = list(label_fields)
+    columns = {label: index for index, label in enumerate(labels)}
+    probabilities = np.zeros((len(predictions), len(labels)))
+    for row, prediction in enumerate(predictions):
+        for item in prediction:
+            probabilities[row, columns[item["label"]]] = item["score"]
+    return [label_fields[label] for label in labels], probabilities
+
+
+def measure(function, *args):
+    """
+    Times an untraced run, then measures the peak memory of a traced one
+    (tracing slows the allocations down too much for timing).
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--classes", type=int, choices=sorted(FIELDS), default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    label_fields = FIELDS[args.classes]
+    predictions = make_predictions(args.size, label_fields, args.seed)
+    fields, probabilities = probability_matrix(predictions, label_fields)
+
+    expected, elapsed, peak = measure(per_prediction, predictions, label_fields)
+    print(f"per prediction        {elapsed:7.3f}s  peak {peak / 2**20:7.1f} MiB")
+
+    _, elapsed, _ = measure(probability_matrix, predictions, label_fields)
+    print(f"probability matrix    {elapsed:7.3f}s  (collecting the scores, shared by both below)")
+
+    results, elapsed, peak = measure(Sentiments.from_probabilities, fields, probabilities)
+    print(f"from_probabilities    {elapsed:7.3f}s  peak {peak / 2**20:7.1f} MiB")
+
+    batch, elapsed, peak = measure(SentimentBatch.from_probabilities, fields, probabilities)
+    print(f"SentimentBatch        {elapsed:7.3f}s  peak {peak / 2**20:7.1f} MiB")
+
+    mismatches = sum(result != reference for result, reference in zip(results, expected))
+    mismatches += sum(row != reference for row, reference in zip(batch, expected))
+    print(f"mismatches {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Benchmark for the share of tokenization in the length-bucketed batch path.
+
+Scores a corpus of short headlines with `analyze_batch(texts, batch_size=...)` and reports the wall
+time and the time spent in the tokenizer:
+    - tokenizing on every call (the default)
+    - passing a `PretokenizedBatch` (see `pretokenize`), tokenized once up front
+    - with a warm shared `TokenizationCache`, as when the texts were already scored by another model
+and checks that all variants give identical results.
+
+Usage:
+    python benchmarks/bench_tokenization.py --language hun --size 2048 --batch-size 32
+"""
+import argparse
+import random
+import sys
+import time
+
+from sentiment_analyzer.analyzers.base_analyzer import SentimentAnalyzerSingleton
+from sentiment_analyzer.analyzers.dan.sentiment_analyzer import DanishSentimentAnalyzer
+from sentiment_analyzer.analyzers.hun.sentiment_analyzer import HungarianSentimentAnalyzer
+from sentiment_analyzer.analyzers.tokenization import TokenizationCache
+
+ANALYZERS = {
+    "hun": HungarianSentimentAnalyzer,
+    "dan": DanishSentimentAnalyzer,
+}
+
+WORDS = (
+    "market government election budget inflation company results growth crisis "
+    "minister report energy prices football match team players season film "
+    "review story city police court decision record profit loss strike"
+).split()
+
+
+def make_headlines(size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 15))) for _ in range(size)]
+
+
+class _TimedTokenizer:
+    """
+    Wraps the analyzer's tokenizer and sums the time spent in its calls.
+    """
+
+    def __init__(self, tokenizer):
+        self._tokenizer = tokenizer
+        self.seconds = 0.0
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._tokenizer(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def __getattr__(self, name):
+        return getattr(self._tokenizer, name)
+
+    def __len__(self):
+        return len(self._tokenizer)
+
+
+def run(analyzer, texts, batch_size: int, timed: _TimedTokenizer):
+    timed.seconds = 0.0
+    start = time.perf_counter()
+    results = analyzer.analyze_batch(texts, batch_size=batch_size)
+    return results, time.perf_counter() - start, timed.seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--language", choices=sorted(ANALYZERS), default="hun")
+    parser.add_argument("--size", type=int, default=2048)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    analyzer = ANALYZERS[args.language]()
+    texts = make_headlines(args.size, args.seed)
+    # Warm-up, so the measured runs do not pay for lazy initialization
+    analyzer.analyze_batch(texts[: args.batch_size], batch_size=args.batch_size)
+
+    loaded = analyzer._loaded_model()
+    timed = _TimedTokenizer(loaded.tokenizer)
+    analyzer._weights = loaded._replace(tokenizer=timed)
+
+    expected, elapsed, tokenizing = run(analyzer, texts, args.batch_size, timed)
+    print(f"tokenize per call     {elapsed:7.3f}s  tokenizer {tokenizing:6.3f}s ({tokenizing / elapsed:6.1%})")
+
+    timed.seconds = 0.0
+    pretokenized = analyzer.pretokenize(texts)
+    pretokenize_seconds = timed.seconds
+    results, elapsed, tokenizing = run(analyzer, pretokenized, args.batch_size, timed)
+    mismatches = sum(result != reference for result, reference in zip(results, expected))
+    print(
+        f"pretokenized          {elapsed:7.3f}s  tokenizer {tokenizing:6.3f}s ({tokenizing / elapsed:6.1%})"
+        f"  pretokenize {pretokenize_seconds:.3f}s once"
+    )
+
+    SentimentAnalyzerSingleton.tokenization_cache = TokenizationCache()
+    analyzer.pretokenize(texts)  # Fills the cache, as a first model would
+    results, elapsed, tokenizing = run(analyzer, texts, args.batch_size, timed)
+    mismatches += sum(result != reference for result, reference in zip(results, expected))
+    print(f"warm cache            {elapsed:7.3f}s  tokenizer {tokenizing:6.3f}s ({tokenizing / elapsed:6.1%})")
+
+    print(f"mismatches {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
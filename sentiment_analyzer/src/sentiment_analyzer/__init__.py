@@ -0,0 +1,23 @@
+import importlib
+
+# The public names and their modules, imported on first access so that importing the package
+# loads neither torch, transformers nor NLTK
+_exports = {
+    "analyze_corpus": "sentiment_analyzer.analyzers.corpus",
+    "DanishSentimentAnalyzer": "sentiment_analyzer.analyzers.dan.sentiment_analyzer",
+    "EnglishSentimentAnalyzer": "sentiment_analyzer.analyzers.eng.sentiment_analyzer",
+    "HungarianSentimentAnalyzer": "sentiment_analyzer.analyzers.hun.sentiment_analyzer",
+    "SentimentAnalyzerFactory": "sentiment_analyzer.factory.sentiment_factory",
+    "SentimentBatch": "sentiment_analyzer.models.sentiment_batch",
+    "SentimentCache": "sentiment_analyzer.cache.result_cache",
+    "Sentiments": "sentiment_analyzer.models.sentiments",
+    "SqliteSentimentCache": "sentiment_analyzer.cache.sqlite_cache",
+}
+
+__all__ = sorted(_exports)
+
+
+def __getattr__(name: str):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_exports[name]), name)
@@ -1,6 +1,35 @@
+import asyncio
+import os
 import threading
+import time
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
 
-from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+import numpy as np
+
+from sentiment_analyzer.analyzers.async_batcher import AsyncBatcher
+from sentiment_analyzer.analyzers.documents import AGGREGATIONS, aggregate_windows
+from sentiment_analyzer.analyzers.instrumentation import Instrumentation
+from sentiment_analyzer.analyzers.micro_batcher import MicroBatcher
+from sentiment_analyzer.analyzers.model_registry import ModelRegistry, model_nbytes
+from sentiment_analyzer.analyzers.model_version import resolve_model_version
+from sentiment_analyzer.analyzers.onnx_backend import OnnxSequenceClassifier
+from sentiment_analyzer.analyzers.streaming import ErrorCallback, stream_sentiments
+from sentiment_analyzer.analyzers.tokenization import PretokenizedBatch, TokenizationCache, tokenizer_id
+from sentiment_analyzer.cache.result_cache import BaseSentimentCache
+from sentiment_analyzer.models.sentiment_batch import SentimentBatch
+from sentiment_analyzer.models.sentiments import Sentiments
+
+
+class _LoadedModel(NamedTuple):
+    """
+    The heavy state of an analyzer, dropped as a whole when the model registry evicts it.
+    """
+
+    tokenizer: Any
+    model: Any
+    pipeline: Any
+    onnx: Optional[OnnxSequenceClassifier]
 
 
 class SentimentAnalyzerSingleton:
@@ -10,45 +39,733 @@ class SentimentAnalyzerSingleton:
     even in a multi-threaded environment.
     """
 
-    # Stores the instances of the sentiment analyzer per model name
+    # Stores the instances of the sentiment analyzer per model name and backend
     _instances = {}  # type: ignore
     _lock = threading.Lock()  # Ensures thread safety during initialization
+    _supported_backends = ("torch", "onnx", "onnx-int8")
+    # The number of texts per forward pass of the ONNX backends when none is given
+    _default_batch_size = 32
+    # Keeps the loaded models of all analyzers within a memory budget, see `ModelRegistry`
+    model_registry = ModelRegistry()
+    # The `Sentiments` field of every model label, set by the language analyzers
+    _label_fields: Dict[str, str] = {}
+    # Shared by all analyzers when set, so texts are tokenized once per tokenizer (see `pretokenize`)
+    tokenization_cache: Optional[TokenizationCache] = None
+    # Reports per-stage timings of all analyzers to the callbacks registered on it
+    instrumentation = Instrumentation()
 
-    def __new__(cls, model_name):
+    def __new__(cls, model_name, backend: str = "torch"):
         """
-        Returns a singleton instance of SentimentAnalyzer for a given model name.
+        Returns a singleton instance of SentimentAnalyzer for a given model name and backend.
         If the instance does not exist, it initializes the model, tokenizer, and pipeline.
 
         Args:
             model_name (str): The name of the model to use for sentiment analysis.
+            backend (str): "torch" runs the model with PyTorch, "onnx" with ONNX Runtime and
+                           "onnx-int8" with ONNX Runtime on the int8 quantized model.
         Returns:
             SentimentAnalyzerSingleton: An instance of the sentiment analyzer for the model.
         """
         with cls._lock:
-            if model_name not in cls._instances:
+            if (model_name, backend) not in cls._instances:
                 # Create a new instance if it does not exist
                 instance = super().__new__(cls)
-                instance._init_model(model_name)
-                cls._instances[model_name] = instance
-            return cls._instances[model_name]
+                instance._init_model(model_name, backend)
+                cls._instances[(model_name, backend)] = instance
+            return cls._instances[(model_name, backend)]
 
-    def _init_model(self, model_name):
+    def _init_model(self, model_name, backend: str = "torch"):
         """
         Initializes the model, tokenizer, and sentiment analysis pipeline.
         This method is only called once per model name during the first instance creation.
+        When the model registry evicts the model later, it is reloaded on next use (see `_load`).
+
+        With an ONNX backend the model is exported to ONNX on first use (see `export_onnx_model`)
+        and served by ONNX Runtime; no PyTorch model or pipeline is kept in memory.
 
         Args:
             model_name (str): The name of the model to load from Hugging Face.
+            backend (str): The inference backend, see `__new__`.
+        """
+        if backend not in self._supported_backends:
+            supported = ", ".join(self._supported_backends)
+            raise ValueError(f"Unsupported backend: {backend}. Supported backends: {supported}")
+
+        self.model_name = model_name
+        self.backend = backend
+        self._weights: Optional[_LoadedModel] = None
+        self._load_lock = threading.Lock()
+        self._load()
+        # Collects concurrent `analyze` calls into batches when enabled
+        self._batcher = None
+        # Coalesces concurrent `analyze_text_async` calls, created on first use
+        self._async_batcher: Optional[AsyncBatcher] = None
+        # Serves repeated texts without inference when set
+        self._cache: Optional[BaseSentimentCache] = None
+
+    def release(self):
+        """
+        Removes this analyzer from the singleton cache and the model registry, stops its
+        micro-batcher and drops its model. Callers still holding the analyzer reload the model
+        on next use; the next construction creates a new analyzer.
+        """
+        self.disable_micro_batching()
+        with self._lock:
+            for key, instance in list(self._instances.items()):
+                if instance is self:
+                    del self._instances[key]
+        self.model_registry.discard(self)
+        self._weights = None
+
+    def _load(self) -> _LoadedModel:
+        """
+        Loads the tokenizer and the model (or the ONNX session) and reports the load to the
+        model registry, which may evict the least recently used models of other analyzers.
+
+        Returns:
+            _LoadedModel: The loaded state.
+        """
+        # Imported on the first load, so importing the analyzers does not load torch and transformers
+        from transformers import AutoConfig, AutoModelForSequenceClassification, AutoTokenizer, pipeline
+
+        started = time.perf_counter()
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        if self.backend == "torch":
+            model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+            self.config = model.config
+            self.model_version = resolve_model_version(self.model_name, self.config)
+            loaded = _LoadedModel(
+                tokenizer=tokenizer,
+                model=model,
+                pipeline=pipeline(
+                    "sentiment-analysis",
+                    model=model,
+                    tokenizer=tokenizer,
+                    top_k=None,  # Ensures all sentiment labels are returned
+                ),
+                onnx=None,
+            )
+            nbytes = model_nbytes(model)
+        else:
+            self.config = AutoConfig.from_pretrained(self.model_name)
+            self.model_version = resolve_model_version(self.model_name, self.config)
+            onnx_model = OnnxSequenceClassifier(
+                self.model_name, self.model_version, quantize=self.backend == "onnx-int8"
+            )
+            loaded = _LoadedModel(tokenizer=tokenizer, model=None, pipeline=None, onnx=onnx_model)
+            nbytes = os.path.getsize(onnx_model.model_path)
+
+        self._weights = loaded
+        self.model_registry.record_load(
+            self, f"{self.model_name}/{self.backend}", nbytes, time.perf_counter() - started
+        )
+        return loaded
+
+    def _loaded_model(self) -> _LoadedModel:
+        """
+        Returns the loaded state, reloading the model if the registry evicted it.
+        """
+        loaded = self._weights
+        if loaded is None:
+            with self._load_lock:
+                loaded = self._weights
+                if loaded is None:
+                    loaded = self._load()
+        else:
+            self.model_registry.touch(self)
+        return loaded
+
+    def _evict(self):
+        """
+        Drops the model; called by the model registry. Inference running meanwhile keeps its
+        references and completes.
+        """
+        self._weights = None
+
+    @property
+    def tokenizer(self):
+        return self._loaded_model().tokenizer
+
+    @property
+    def model(self):
+        """
+        The PyTorch model, None with an ONNX backend.
+        """
+        return self._loaded_model().model
+
+    @property
+    def pipeline(self):
+        """
+        The Hugging Face pipeline, None with an ONNX backend.
+        """
+        return self._loaded_model().pipeline
+
+    @property
+    def _onnx(self) -> Optional[OnnxSequenceClassifier]:
+        return self._loaded_model().onnx
+
+    def set_cache(self, cache: Optional[BaseSentimentCache]):
+        """
+        Puts a result cache in front of `analyze_text` and `analyze_batch`.
+        The cached results are keyed by the model name and version.
+
+        Args:
+            cache (BaseSentimentCache, optional): The in-memory or persistent cache to use.
+                                                  None disables caching.
+        """
+        self._cache = cache
+
+    def _cached_results(self, texts: List[str], compute: Callable) -> list:
+        """
+        Returns the results of the texts, computing only the ones missing from the cache.
+
+        Args:
+            texts (list): The texts to analyze.
+            compute (Callable): Analyzes a list of texts, returning the results in the same order.
+        Returns:
+            list: The `Sentiments` per text, in input order.
+        """
+        if self._cache is None:
+            return compute(texts)
+        model_id = f"{self.model_name}@{self.model_version}/{self.backend}"
+        if not self.instrumentation.enabled:
+            return self._cache.resolve(model_id, texts, compute)
+
+        # The cache stage is the lookup and storage time, without the scoring of the misses
+        computed = []
+
+        def timed_compute(misses: List[str]) -> list:
+            started = time.perf_counter()
+            try:
+                return compute(misses)
+            finally:
+                computed.append((len(misses), time.perf_counter() - started))
+
+        started = time.perf_counter()
+        results = self._cache.resolve(model_id, texts, timed_compute)
+        misses, compute_seconds = computed[0] if computed else (0, 0.0)
+        self.instrumentation.record(
+            "cache",
+            self._model_label,
+            time.perf_counter() - started - compute_seconds,
+            texts=len(texts),
+            hits=len(texts) - misses,
+            misses=misses,
+        )
+        return results
+
+    @property
+    def _model_label(self) -> str:
+        """
+        The model name and backend, identifying the analyzer in instrumentation events.
+        """
+        return f"{self.model_name}/{self.backend}"
+
+    def _stage(self, stage: str, **attributes):
+        """
+        Times a stage of the analysis for the instrumentation callbacks (see `Instrumentation.stage`).
+        A shared no-op while no callback is registered.
+        """
+        instrumentation = self.instrumentation
+        return instrumentation.stage(stage, self._model_label if instrumentation.enabled else "", **attributes)
+
+    def _map_sentiment_result(self, prediction):
+        """
+        Maps the prediction of one text to `Sentiments`. Implemented by the language analyzers.
+        """
+        raise NotImplementedError
+
+    def _score_texts(self, texts: List[str]) -> list:
+        """
+        Analyzes the texts one at a time through `analyze`, micro-batched when enabled.
+        """
+        return [self._map_sentiment_result(self.analyze(text)[0]) for text in texts]
+
+    def _predict_texts(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        pretokenized: Optional[PretokenizedBatch] = None,
+    ) -> list:
+        """
+        Analyzes the texts as a batch through `_predict`. With `_label_fields` set, the
+        `Sentiments` of the whole batch are built at once (see `Sentiments.from_probabilities`).
+        The encodings of the texts are taken from `pretokenized` when given.
+        """
+        encodings = None if pretokenized is None else pretokenized.select(texts)
+        if not self._label_fields:
+            if encodings is not None:
+                predictions = self._predict_bucketed(texts, batch_size or self._default_batch_size, encodings)
+            else:
+                predictions = self._predict(texts, batch_size)
+            with self._stage("map", texts=len(texts)):
+                return [self._map_sentiment_result(prediction) for prediction in predictions]
+        labels, probabilities = self._batch_probabilities(texts, batch_size, encodings)
+        with self._stage("map", texts=len(texts)):
+            return Sentiments.from_probabilities(labels, probabilities)
+
+    def _batch_probabilities(
+        self, texts: List[str], batch_size: Optional[int] = None, encodings: Optional[dict] = None
+    ):
+        """
+        Returns the probabilities of a batch for `Sentiments.from_probabilities` and
+        `SentimentBatch.from_probabilities`: straight from the model on the length-bucketed
+        path, otherwise collected from the pipeline's predictions.
+        """
+        if batch_size is not None or encodings is not None or self.pipeline is None:
+            probabilities = self._predict_proba(texts, batch_size or self._default_batch_size, encodings)
+            return self.proba_labels, probabilities
+        return self._probabilities(self._predict(texts))
+
+    def _probabilities(self, predictions: list):
+        """
+        Collects the label scores of the predictions into a matrix.
+
+        Args:
+            predictions (list): The label/score dicts per text, as returned by `_predict`.
+        Returns:
+            tuple: The `Sentiments` field of every column and the probabilities, one row per text.
+        """
+        labels = list(self._label_fields)
+        columns = {label: index for index, label in enumerate(labels)}
+        probabilities = np.zeros((len(predictions), len(labels)))
+        for row, prediction in enumerate(predictions):
+            for item in prediction:
+                probabilities[row, columns[item["label"]]] = item["score"]
+        return [self._label_fields[label] for label in labels], probabilities
+
+    def _analyze_texts(
+        self, texts: Union[List[str], PretokenizedBatch], batch_size: Optional[int] = None
+    ) -> list:
+        """
+        Analyzes a batch of texts, or of pretokenized texts, through the cache when one is set.
+        """
+        if isinstance(texts, PretokenizedBatch):
+            self._check_pretokenized(texts)
+            compute = partial(self._predict_texts, batch_size=batch_size, pretokenized=texts)
+            return self._cached_results(list(texts.texts), compute)
+        return self._cached_results(list(texts), partial(self._predict_texts, batch_size=batch_size))
+
+    def _analyze_columns(
+        self, texts: Union[List[str], PretokenizedBatch], batch_size: Optional[int] = None
+    ) -> SentimentBatch:
+        """
+        Analyzes a batch of texts into a `SentimentBatch`, reading the probabilities straight
+        from the predictions instead of building a `Sentiments` object per text.
+        """
+        if self._cache is not None:
+            return SentimentBatch.from_sentiments(self._analyze_texts(texts, batch_size))
+
+        if isinstance(texts, PretokenizedBatch):
+            self._check_pretokenized(texts)
+            probabilities = self._batch_probabilities(list(texts.texts), batch_size, texts.encodings)
+        else:
+            probabilities = self._batch_probabilities(list(texts), batch_size)
+        with self._stage("map", texts=len(probabilities[1])):
+            return SentimentBatch.from_probabilities(*probabilities)
+
+    def pretokenize(self, texts: List[str]) -> PretokenizedBatch:
+        """
+        Tokenizes a batch of texts once with the fast tokenizer's batch encoding.
+
+        The result can be passed to `analyze_batch` and `predict_proba` of every analyzer
+        using the same tokenizer instead of the texts. With `tokenization_cache` set, the
+        encodings are cached, keyed by the tokenizer and the text, and reused by later calls
+        and by the length-bucketed batch path.
+
+        Args:
+            texts (list): The texts to tokenize.
+        Returns:
+            PretokenizedBatch: The texts with their truncated, unpadded `input_ids` and `attention_mask`.
+        """
+        texts = list(texts)
+        if not all(texts):
+            raise ValueError("Missing text to analyze")
+        tokenizer = self.tokenizer
+        return PretokenizedBatch(tokenizer_id(tokenizer), texts, self._encode(texts, tokenizer))
+
+    def _encode(self, texts: List[str], tokenizer=None) -> dict:
+        """
+        Returns the truncated, unpadded encodings of the texts, through the tokenization cache when set.
+        """
+        tokenizer = tokenizer or self.tokenizer
+        cache = self.tokenization_cache
+        with self._stage("tokenize", texts=len(texts), cached=cache is not None):
+            if cache is not None:
+                return cache.encode(tokenizer, texts)
+            return dict(tokenizer(texts, truncation=True))
+
+    def _check_pretokenized(self, batch: PretokenizedBatch):
+        if batch.tokenizer_id != tokenizer_id(self.tokenizer):
+            raise ValueError(
+                f"The texts were tokenized by {batch.tokenizer_id}, not by the tokenizer of {self.model_name}"
+            )
+
+    @property
+    def proba_labels(self) -> List[str]:
+        """
+        The labels of the `predict_proba` columns, in order, as `Sentiments` field names.
+        """
+        if not self._label_fields:
+            raise NotImplementedError(f"{type(self).__name__} does not define its label order")
+        return list(self._label_fields.values())
+
+    def predict_proba(
+        self, texts: Union[List[str], PretokenizedBatch], batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Returns the label probabilities of the texts as a matrix, without the pipeline's
+        post-processing and without building a result object per text.
+
+        The texts are tokenized once and run through the model directly in length buckets
+        (see `_predict_bucketed`), under `torch.inference_mode()` with the torch backend.
+        Cached results are not used, as the cache stores `Sentiments`.
+
+        Args:
+            texts (list): The texts to analyze, or a `PretokenizedBatch` of them.
+            batch_size (int, optional): The number of texts per forward pass.
+        Returns:
+            np.ndarray: The probabilities, one row per text and one column per label in
+                        `proba_labels` order.
+        """
+        encodings = None
+        if isinstance(texts, PretokenizedBatch):
+            self._check_pretokenized(texts)
+            texts, encodings = list(texts.texts), texts.encodings
+        else:
+            texts = list(texts)
+            if not all(texts):
+                raise ValueError("Missing text to analyze")
+        labels = self.proba_labels
+        if not texts:
+            return np.zeros((0, len(labels)))
+        return self._predict_proba(texts, batch_size or self._default_batch_size, encodings)
+
+    def _predict_proba(self, texts: List[str], batch_size: int, encodings: Optional[dict] = None) -> np.ndarray:
+        """
+        Predicts the probabilities of the texts in length buckets, in `proba_labels` order.
+        """
+        return self._predict_model_proba(texts, batch_size, encodings)[:, self._proba_columns()]
+
+    def _proba_columns(self) -> List[int]:
+        """
+        Returns the model's output column of every label in `proba_labels` order.
+        """
+        label_ids = {label: label_id for label_id, label in self.config.id2label.items()}
+        return [label_ids[label] for label in self._label_fields]
+
+    def analyze_documents(
+        self,
+        texts: List[str],
+        aggregation: str = "mean",
+        window: Optional[int] = None,
+        stride: int = 64,
+        batch_size: Optional[int] = None,
+    ) -> List[Sentiments]:
+        """
+        Analyzes long documents, e.g. full articles, instead of only their first `window` tokens.
+
+        Every document is split into overlapping token windows, the windows of all documents
+        are run together in length-bucketed batches, and the window probabilities are
+        combined per document (see `aggregate_windows`). Results are not cached.
+
+        Args:
+            texts (list): The documents to analyze.
+            aggregation (str): "mean" weights the windows by their token length,
+                               "max" takes the window with the most confident prediction.
+            window (int, optional): The tokens per window, including the special tokens.
+                                    Defaults to the longest input of the model.
+            stride (int): The number of tokens shared by consecutive windows.
+            batch_size (int, optional): The number of windows per forward pass.
+        Returns:
+            list: The `Sentiments` per document, in input order.
+        """
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"Unsupported aggregation: {aggregation}. Supported aggregations: {', '.join(AGGREGATIONS)}")
+        texts = list(texts)
+        if not all(texts):
+            raise ValueError("Missing text to analyze")
+        if not texts:
+            return []
+
+        tokenizer = self.tokenizer
+        window = window or min(tokenizer.model_max_length, self.config.max_position_embeddings)
+        if not 0 <= stride < window:
+            raise ValueError("stride must be at least 0 and smaller than window")
+
+        encodings = dict(
+            tokenizer(
+                texts,
+                truncation=True,
+                max_length=window,
+                stride=stride,
+                return_overflowing_tokens=True,
+            )
+        )
+        documents = np.asarray(encodings.pop("overflow_to_sample_mapping"))
+        lengths = np.array([len(input_ids) for input_ids in encodings["input_ids"]])
+        probabilities = self._predict_encoded(encodings, batch_size or self._default_batch_size)
+        probabilities = aggregate_windows(
+            probabilities[:, self._proba_columns()], lengths, documents, len(texts), aggregation
+        )
+        return Sentiments.from_probabilities(self.proba_labels, probabilities)
+
+    def analyze_stream(
+        self,
+        texts: Iterable[str],
+        chunk_size: int = 256,
+        batch_size: Optional[int] = 32,
+        skip_invalid: bool = True,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> Iterator[Sentiments]:
         """
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
-        self.pipeline = pipeline(
-            "sentiment-analysis",
-            model=self.model,
-            tokenizer=self.tokenizer,
-            top_k=None,  # Ensures all sentiment labels are returned
+        Analyzes an iterable of texts lazily, chunk by chunk, yielding the results as they
+        are produced. Memory is bounded by `chunk_size`, so any number of texts can be streamed.
+
+        Args:
+            texts (Iterable[str]): The texts to analyze, e.g. a generator over an export.
+            chunk_size (int): The number of texts analyzed at a time.
+            batch_size (int, optional): The batch size within a chunk, see `analyze_batch`.
+            skip_invalid (bool): Whether to skip non-string and blank texts instead of raising.
+            on_error (Callable, optional): Called with the index, item and error of every skipped
+                                           text. Without it a warning is logged.
+        Returns:
+            Iterator[Sentiments]: The results of the valid texts, in input order.
+        """
+        return stream_sentiments(
+            texts,
+            partial(self._analyze_texts, batch_size=batch_size),
+            chunk_size=chunk_size,
+            skip_invalid=skip_invalid,
+            on_error=on_error,
         )
 
+    def enable_micro_batching(self, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        """
+        Routes concurrent `analyze` calls through a micro-batcher.
+
+        Requests coming from many threads are queued and run as one padded batch
+        once `max_batch_size` requests are waiting or `max_wait_ms` has elapsed.
+        Callers keep using `analyze`/`analyze_text` unchanged.
+
+        Args:
+            max_batch_size (int): The maximum number of texts in one forward pass.
+            max_wait_ms (float): The maximum time a request waits for the batch to fill up.
+        """
+        batcher = MicroBatcher(
+            self._predict_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name=f"micro-batcher-{type(self).__name__}",
+        )
+        with self._lock:
+            previous, self._batcher = self._batcher, batcher
+        if previous is not None:
+            previous.close()
+
+    def disable_micro_batching(self):
+        """
+        Stops the micro-batcher after flushing the pending requests.
+        """
+        with self._lock:
+            previous, self._batcher = self._batcher, None
+        if previous is not None:
+            previous.close()
+
+    def configure_async_batching(
+        self, max_batch_size: int = 32, max_wait_ms: float = 5.0, max_queue_size: int = 1024
+    ):
+        """
+        Sets how `analyze_text_async`/`analyze_batch_async` coalesce concurrent awaiters.
+        Must be called before the first async call, or after `close_async`.
+
+        Args:
+            max_batch_size (int): The maximum number of texts in one forward pass.
+            max_wait_ms (float): The maximum time a request waits for the batch to fill up.
+            max_queue_size (int): The maximum number of pending texts; further awaiters wait
+                                  for room, which applies backpressure to the callers.
+        """
+        batcher = AsyncBatcher(
+            partial(self._analyze_texts, batch_size=self._default_batch_size),
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+            name=f"async-batcher-{type(self).__name__}",
+        )
+        with self._lock:
+            if self._async_batcher is not None and self._async_batcher.started:
+                raise RuntimeError("Async batching is already running; call close_async first")
+            self._async_batcher = batcher
+
+    async def close_async(self):
+        """
+        Stops the async batcher and its executor thread. A later async call starts a new one.
+        """
+        with self._lock:
+            batcher, self._async_batcher = self._async_batcher, None
+        if batcher is not None:
+            await batcher.close()
+
+    def _get_async_batcher(self) -> AsyncBatcher:
+        if self._async_batcher is None:
+            self.configure_async_batching()
+        return self._async_batcher
+
+    async def analyze_text_async(self, text: str) -> Sentiments:
+        """
+        Analyzes a text without blocking the event loop.
+
+        Concurrent awaiters are coalesced into shared batches that run on a dedicated
+        executor thread (see `configure_async_batching`). Cached texts are served from the cache.
+
+        Args:
+            text (str): The text to analyze.
+        Returns:
+            Sentiments: The sentiment of the text.
+        """
+        if not text:
+            raise ValueError("Missing text to analyze")
+        return await self._get_async_batcher().submit(text)
+
+    async def analyze_batch_async(self, texts: List[str]) -> List[Sentiments]:
+        """
+        Analyzes a batch of texts without blocking the event loop. The texts share the
+        batches of concurrent `analyze_text_async` calls.
+
+        Args:
+            texts (list): The texts to analyze.
+        Returns:
+            list: The `Sentiments` per text, in input order.
+        """
+        if not all(texts):
+            raise ValueError("Missing text to analyze")
+        batcher = self._get_async_batcher()
+        return list(await asyncio.gather(*(batcher.submit(text) for text in texts)))
+
+    def _predict_batch(self, texts: list):
+        """
+        Runs the model on a list of texts as one padded batch.
+
+        Args:
+            texts (list): The texts to analyze.
+        Returns:
+            list: The sentiment predictions per text, in input order.
+        """
+        text_pipeline = self.pipeline
+        if text_pipeline is None:
+            return self._predict_bucketed(texts, len(texts))
+        with self._stage("pipeline", texts=len(texts), batch_size=len(texts)):
+            return text_pipeline(texts, batch_size=len(texts))
+
+    def _predict(self, texts: List[str], batch_size: Optional[int] = None) -> list:
+        """
+        Predicts the sentiment of a list of texts.
+
+        Without `batch_size` the texts are passed straight to the pipeline. With `batch_size`,
+        or with an ONNX backend, the texts are run through the length-bucketed path
+        (see `_predict_bucketed`).
+
+        Args:
+            texts (list): The texts to analyze.
+            batch_size (int, optional): The number of texts per forward pass.
+        Returns:
+            list: The sentiment predictions per text, in input order.
+        """
+        if batch_size is None:
+            text_pipeline = self.pipeline
+            if text_pipeline is not None:
+                with self._stage("pipeline", texts=len(texts)):
+                    return text_pipeline(texts)
+            batch_size = self._default_batch_size
+        return self._predict_bucketed(texts, batch_size)
+
+    def _forward(self, features: dict) -> np.ndarray:
+        """
+        Runs the model on one batch of tokenized texts.
+
+        Args:
+            features (dict): The unpadded tokenizer outputs of the batch.
+        Returns:
+            np.ndarray: The label probabilities per text, in the model's label order.
+        """
+        loaded = self._loaded_model()
+        with self._stage("forward", batch_size=len(features["input_ids"])) as stage:
+            if loaded.onnx is not None:
+                batch = loaded.tokenizer.pad(features, return_tensors="np")
+                stage.set(padded_tokens=batch["input_ids"].size)
+                return loaded.onnx.predict_proba(batch)
+
+            import torch
+
+            batch = loaded.tokenizer.pad(features, return_tensors="pt").to(loaded.model.device)
+            stage.set(padded_tokens=batch["input_ids"].numel())
+            with torch.inference_mode():
+                logits = loaded.model(**batch).logits
+                return torch.softmax(logits, dim=-1).cpu().numpy()
+
+    def _predict_model_proba(
+        self, texts: List[str], batch_size: int, encodings: Optional[dict] = None
+    ) -> np.ndarray:
+        """
+        Predicts the label probabilities of a list of texts in length buckets.
+
+        The texts are tokenized once (see `_encode`) and sorted by token length, so each
+        batch of `batch_size` texts is padded only up to its own longest item instead of
+        the longest item of the whole input.
+
+        Args:
+            texts (list): The texts to analyze.
+            batch_size (int): The number of texts per forward pass.
+            encodings (dict, optional): The unpadded encodings of the texts, when pretokenized.
+        Returns:
+            np.ndarray: The probabilities per text in input order, in the model's label order.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if not texts:
+            return np.zeros((0, len(self.config.id2label)))
+        if encodings is None:
+            encodings = self._encode(list(texts))
+        return self._predict_encoded(encodings, batch_size)
+
+    def _predict_encoded(self, encodings: dict, batch_size: int) -> np.ndarray:
+        """
+        Runs the model on unpadded encodings in length buckets.
+
+        Args:
+            encodings (dict): The token lists per tokenizer output, one list per input.
+            batch_size (int): The number of inputs per forward pass.
+        Returns:
+            np.ndarray: The probabilities per input in input order, in the model's label order.
+        """
+        input_ids = encodings["input_ids"]
+        probabilities = np.zeros((len(input_ids), len(self.config.id2label)))
+        order = sorted(range(len(input_ids)), key=lambda index: len(input_ids[index]))
+
+        for start in range(0, len(order), batch_size):
+            indices = order[start : start + batch_size]
+            features = {key: [values[index] for index in indices] for key, values in encodings.items()}
+            probabilities[indices] = self._forward(features)
+        return probabilities
+
+    def _predict_bucketed(self, texts: List[str], batch_size: int, encodings: Optional[dict] = None) -> list:
+        """
+        Predicts the sentiment of a list of texts in length buckets (see `_predict_model_proba`).
+        The predictions are returned in input order, in the same label/score format as the pipeline.
+
+        Args:
+            texts (list): The texts to analyze.
+            batch_size (int): The number of texts per forward pass.
+            encodings (dict, optional): The unpadded encodings of the texts, when pretokenized.
+        Returns:
+            list: The sentiment predictions per text, in input order.
+        """
+        id2label = self.config.id2label
+        return [
+            [{"label": id2label[label_id], "score": score} for label_id, score in enumerate(row)]
+            for row in self._predict_model_proba(texts, batch_size, encodings).tolist()
+        ]
+
     def analyze(self, text: str):
         """
         Analyzes the sentiment of a given text.
@@ -62,5 +779,15 @@ class SentimentAnalyzerSingleton:
         if not text:
             raise ValueError("Missing text to analyze")
 
+        batcher = self._batcher
+        if batcher is not None:
+            # Same shape as the pipeline's result for a single text
+            return [batcher.submit(text).result()]
+
+        text_pipeline = self.pipeline
+        if text_pipeline is None:
+            return self._predict_bucketed([text], 1)
+
         # Run sentiment analysis using the pipeline
-        return self.pipeline(text)
+        with self._stage("pipeline", texts=1):
+            return text_pipeline(text)
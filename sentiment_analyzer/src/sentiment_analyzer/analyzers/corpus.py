@@ -0,0 +1,146 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
+from typing import Iterable, Iterator, List, Optional
+
+from sentiment_analyzer.analyzers.streaming import ErrorCallback, _report_invalid, _validate_text
+from sentiment_analyzer.factory.sentiment_factory import SentimentAnalyzerFactory
+from sentiment_analyzer.models.sentiments import Sentiments
+
+# The analyzer of the current worker process, loaded once by `_init_worker`
+_worker_analyzer = None
+
+
+def _init_worker(language: str, backend: str, num_threads: int):
+    """
+    Loads the analyzer once per worker process and pins its intra-op thread count.
+    """
+    global _worker_analyzer
+
+    import torch
+
+    torch.set_num_threads(num_threads)
+
+    analyzer_cls = SentimentAnalyzerFactory.get_analyzer_class(language)
+    _worker_analyzer = analyzer_cls() if language == "eng" else analyzer_cls(backend=backend)
+
+
+def _analyze_chunk(texts: List[str], batch_size: Optional[int]) -> List[Sentiments]:
+    if batch_size is None:
+        return _worker_analyzer.analyze_batch(texts)
+    return _worker_analyzer.analyze_batch(texts, batch_size=batch_size)
+
+
+def _valid_texts(
+    texts: Iterable[str], skip_invalid: bool, on_error: Optional[ErrorCallback]
+) -> Iterator[str]:
+    """
+    Yields the valid texts, reporting or raising on the invalid ones (see `stream_sentiments`).
+    """
+    for index, text in enumerate(texts):
+        try:
+            yield _validate_text(text)
+        except (TypeError, ValueError) as error:
+            if not skip_invalid:
+                raise
+            _report_invalid(index, text, error, on_error)
+
+
+def _chunks(texts: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    iterator = iter(texts)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def analyze_corpus(
+    texts: Iterable[str],
+    language: str,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+    batch_size: Optional[int] = 32,
+    threads_per_worker: Optional[int] = None,
+    backend: str = "torch",
+    skip_invalid: bool = True,
+    on_error: Optional[ErrorCallback] = None,
+) -> Iterator[Sentiments]:
+    """
+    Analyzes a large corpus on a pool of worker processes, for offline backfills.
+
+    Every worker loads the model once and runs with `threads_per_worker` intra-op threads,
+    so the cores are shared by the processes instead of contended by torch's thread pools.
+    The texts are read lazily in chunks of `chunk_size` and at most two chunks per worker
+    are in flight, so memory stays bounded for any corpus size. The results are yielded
+    in input order as soon as their chunk is done.
+
+    The worker processes are started with the "spawn" method, so scripts calling this
+    function must guard their entry point with `if __name__ == "__main__":`.
+
+    Texts that are not strings or are blank are dropped before they reach the workers, and
+    reported with their input index like in `stream_sentiments`, so every yielded result
+    belongs to the next valid text. An unsupported language or a `chunk_size` below 1
+    raises a ValueError when called, before any worker is started.
+
+    Args:
+        texts (Iterable[str]): The texts to analyze, e.g. a generator over a database cursor.
+        language (str): 'hun', 'dan' or 'eng'.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int): The number of texts sent to a worker at a time.
+        batch_size (int, optional): The batch size of `analyze_batch` within a chunk
+                                    (ignored for 'eng'). None uses the pipeline directly.
+        threads_per_worker (int, optional): The torch thread count of each worker.
+                                            Defaults to the CPUs divided by the workers.
+        backend (str): The inference backend of the transformer analyzers.
+        skip_invalid (bool): Whether to skip invalid texts. When False, the first invalid
+                             text raises its error.
+        on_error (Callable, optional): Called with the input index, the item and the error
+                                       for every skipped text. Without it a warning is logged.
+    Returns:
+        Iterator[Sentiments]: The results in input order.
+    """
+    if language not in SentimentAnalyzerFactory._registry:
+        raise ValueError(f"Unsupported language: {language}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    cpu_count = os.cpu_count() or 1
+    workers = workers or cpu_count
+    threads_per_worker = threads_per_worker or max(1, cpu_count // workers)
+    if language == "eng":
+        batch_size = None
+    valid_texts = _valid_texts(texts, skip_invalid, on_error)
+    return _analyze_corpus(
+        valid_texts, language, workers, chunk_size, batch_size, threads_per_worker, backend
+    )
+
+
+def _analyze_corpus(
+    texts: Iterable[str],
+    language: str,
+    workers: int,
+    chunk_size: int,
+    batch_size: Optional[int],
+    threads_per_worker: int,
+    backend: str,
+) -> Iterator[Sentiments]:
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(language, backend, threads_per_worker),
+    )
+    pending: deque = deque()
+    try:
+        for chunk in _chunks(texts, chunk_size):
+            pending.append(executor.submit(_analyze_chunk, chunk, batch_size))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # Also reached when the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
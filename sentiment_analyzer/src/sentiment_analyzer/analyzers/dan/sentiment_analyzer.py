@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Optional, Union
 
 from sentiment_analyzer.analyzers.base_analyzer import SentimentAnalyzerSingleton
+from sentiment_analyzer.analyzers.tokenization import PretokenizedBatch
+from sentiment_analyzer.models.sentiment_batch import SentimentBatch
 from sentiment_analyzer.models.sentiments import Sentiments
 
 
@@ -12,13 +14,12 @@ class DanishSentimentAnalyzer(SentimentAnalyzerSingleton):
     is used for Danish sentiment analysis.
     """
 
-    _instance = None
+    _label_fields = {"negativ": "negative", "neutral": "neutral", "positiv": "positive"}
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls, "larskjeldgaard/senda")
-            # cls._instance = super().__new__(cls, "NbAiLab/nb-bert-base-sentiment")
-        return cls._instance
+    def __new__(cls, backend: str = "torch"):
+        # The base class keeps one instance per model name and backend
+        # return super().__new__(cls, "NbAiLab/nb-bert-base-sentiment", backend)
+        return super().__new__(cls, "larskjeldgaard/senda", backend)
 
     def _map_sentiment_result(self, prediction) -> Sentiments:
         sentiment_results = {
@@ -35,12 +36,23 @@ class DanishSentimentAnalyzer(SentimentAnalyzerSingleton):
         """
         Analyzes the sentiment of a given Danish text.
         """
-        sentiment_prediction = self.analyze(text)
-        return self._map_sentiment_result(sentiment_prediction[0])
-
-    def analyze_batch(self, texts: List[str]) -> List[Sentiments]:
+        return self._cached_results([text], self._score_texts)[0]
+
+    def analyze_batch(
+        self,
+        texts: Union[List[str], PretokenizedBatch],
+        batch_size: Optional[int] = None,
+        as_columns: bool = False,
+    ) -> Union[List[Sentiments], SentimentBatch]:
         """
         Analyzes a batch of Danish texts.
+
+        With `batch_size` the texts are tokenized once, sorted into length buckets
+        and run `batch_size` texts at a time. Only the texts missing from the result
+        cache are analyzed. With `as_columns` the results are returned as a columnar
+        `SentimentBatch`. The texts can be passed as a `PretokenizedBatch` (see `pretokenize`)
+        to skip their tokenization.
         """
-        predictions = self.pipeline(texts)
-        return [self._map_sentiment_result(prediction) for prediction in predictions]
\ No newline at end of file
+        if as_columns:
+            return self._analyze_columns(texts, batch_size)
+        return self._analyze_texts(texts, batch_size)
\ No newline at end of file
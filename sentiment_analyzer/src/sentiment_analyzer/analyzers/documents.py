@@ -0,0 +1,44 @@
+import numpy as np
+
+# The ways `aggregate_windows` combines the windows of a document
+AGGREGATIONS = ("mean", "max")
+
+
+def aggregate_windows(
+    probabilities: np.ndarray,
+    lengths: np.ndarray,
+    documents: np.ndarray,
+    count: int,
+    aggregation: str = "mean",
+) -> np.ndarray:
+    """
+    Combines the label probabilities of the token windows of documents into one row per document.
+
+    Args:
+        probabilities (np.ndarray): The probabilities per window, one column per label.
+        lengths (np.ndarray): The number of tokens of every window.
+        documents (np.ndarray): The index of the document of every window.
+        count (int): The number of documents; every document has at least one window.
+        aggregation (str): "mean" averages the windows weighted by their token length,
+                           "max" takes the window whose top label has the highest probability.
+    Returns:
+        np.ndarray: The probabilities per document, in document order.
+    """
+    if aggregation == "mean":
+        weights = lengths.astype(np.float64)
+        sums = np.zeros((count, probabilities.shape[1]))
+        np.add.at(sums, documents, probabilities * weights[:, None])
+        totals = np.bincount(documents, weights=weights, minlength=count)
+        return sums / totals[:, None]
+
+    if aggregation == "max":
+        # Sorted by document, then by decreasing confidence: the first window of each document wins
+        order = np.lexsort((-probabilities.max(axis=1), documents))
+        sorted_documents = documents[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = sorted_documents[1:] != sorted_documents[:-1]
+        result = np.zeros((count, probabilities.shape[1]))
+        result[sorted_documents[first]] = probabilities[order[first]]
+        return result
+
+    raise ValueError(f"Unsupported aggregation: {aggregation}. Supported aggregations: {', '.join(AGGREGATIONS)}")
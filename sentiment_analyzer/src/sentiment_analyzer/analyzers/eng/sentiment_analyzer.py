@@ -1,9 +1,11 @@
+import asyncio
 import threading
-from typing import List
-
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
+from typing import Iterable, Iterator, List, Optional, Union
 
+from sentiment_analyzer.analyzers.async_batcher import AsyncBatcher
+from sentiment_analyzer.analyzers.streaming import ErrorCallback, stream_sentiments
+from sentiment_analyzer.cache.result_cache import BaseSentimentCache
+from sentiment_analyzer.models.sentiment_batch import SentimentBatch
 from sentiment_analyzer.models.sentiments import Sentiments
 
 
@@ -15,6 +17,7 @@ class EnglishSentimentAnalyzer:
 
     _instance = None
     _lock = threading.Lock()
+    model_name = "vader"
 
     def __new__(cls):
         with cls._lock:
@@ -24,12 +27,47 @@ class EnglishSentimentAnalyzer:
         return cls._instance
 
     def _initialize(self):
+        # Imported on the first use, so importing the analyzers does not load NLTK
+        import nltk
+        from nltk.sentiment import SentimentIntensityAnalyzer
+
         try:
             nltk.data.find("sentiment/vader_lexicon.zip")
         except LookupError:
             nltk.download("vader_lexicon")
 
         self.sid = SentimentIntensityAnalyzer()
+        # VADER's rules and lexicon ship with NLTK
+        self.model_version = f"nltk-{nltk.__version__}"
+        # Serves repeated texts without scoring when set
+        self._cache: Optional[BaseSentimentCache] = None
+        # Coalesces concurrent `analyze_text_async` calls, created on first use
+        self._async_batcher: Optional[AsyncBatcher] = None
+
+    def release(self):
+        """
+        Removes this analyzer from the singleton cache; the next construction loads VADER again.
+        """
+        with self._lock:
+            if type(self)._instance is self:
+                type(self)._instance = None
+
+    def set_cache(self, cache: Optional[BaseSentimentCache]):
+        """
+        Puts an in-memory or persistent result cache in front of `analyze_text`
+        and `analyze_batch`. None disables caching.
+        """
+        self._cache = cache
+
+    def _score_texts(self, texts: List[str]) -> List[Sentiments]:
+        return [self._map_sentiment_result(self.sid.polarity_scores(text)) for text in texts]
+
+    def _cached_results(self, texts: List[str]) -> List[Sentiments]:
+        if self._cache is None:
+            return self._score_texts(texts)
+        return self._cache.resolve(
+            f"{self.model_name}@{self.model_version}", texts, self._score_texts
+        )
 
     def _map_sentiment_result(self, results: dict) -> Sentiments:
         # Determine compound label based on compound score thresholds
@@ -53,12 +91,75 @@ class EnglishSentimentAnalyzer:
         if not text:
             raise ValueError("Missing text to analyze")
 
-        results = self.sid.polarity_scores(text)
-        return self._map_sentiment_result(results)
+        return self._cached_results([text])[0]
+
+    def analyze_batch(
+        self, texts: List[str], as_columns: bool = False
+    ) -> Union[List[Sentiments], SentimentBatch]:
+        """
+        Analyzes the non-empty texts of a batch. With `as_columns` the results are returned
+        as a columnar `SentimentBatch`.
+        """
+        texts = [text for text in texts if text]
+        if not as_columns:
+            return self._cached_results(texts)
+        if self._cache is not None:
+            return SentimentBatch.from_sentiments(self._cached_results(texts))
+        return SentimentBatch.from_vader([self.sid.polarity_scores(text) for text in texts])
+
+    def analyze_stream(
+        self,
+        texts: Iterable[str],
+        chunk_size: int = 256,
+        skip_invalid: bool = True,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> Iterator[Sentiments]:
+        """
+        Analyzes an iterable of texts lazily, chunk by chunk, yielding the results as they
+        are produced. Skipped texts are reported to `on_error`, or logged without it.
+        """
+        return stream_sentiments(
+            texts, self._cached_results, chunk_size, skip_invalid, on_error
+        )
+
+    def configure_async_batching(
+        self, max_batch_size: int = 256, max_wait_ms: float = 2.0, max_queue_size: int = 4096
+    ):
+        """
+        Sets how `analyze_text_async`/`analyze_batch_async` coalesce concurrent awaiters.
+        Must be called before the first async call, or after `close_async`.
+        """
+        batcher = AsyncBatcher(
+            self._cached_results,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+            name="async-batcher-EnglishSentimentAnalyzer",
+        )
+        with self._lock:
+            if self._async_batcher is not None and self._async_batcher.started:
+                raise RuntimeError("Async batching is already running; call close_async first")
+            self._async_batcher = batcher
+
+    async def close_async(self):
+        with self._lock:
+            batcher, self._async_batcher = self._async_batcher, None
+        if batcher is not None:
+            await batcher.close()
+
+    def _get_async_batcher(self) -> AsyncBatcher:
+        if self._async_batcher is None:
+            self.configure_async_batching()
+        return self._async_batcher
+
+    async def analyze_text_async(self, text: str) -> Sentiments:
+        """
+        Analyzes a text on the async batcher's executor thread, without blocking the event loop.
+        """
+        if not text:
+            raise ValueError("Missing text to analyze")
+        return await self._get_async_batcher().submit(text)
 
-    def analyze_batch(self, texts: List[str]) -> List[Sentiments]:
-        return [
-            self._map_sentiment_result(self.sid.polarity_scores(text))
-            for text in texts
-            if text
-        ]
\ No newline at end of file
+    async def analyze_batch_async(self, texts: List[str]) -> List[Sentiments]:
+        batcher = self._get_async_batcher()
+        return list(await asyncio.gather(*(batcher.submit(text) for text in texts if text)))
\ No newline at end of file
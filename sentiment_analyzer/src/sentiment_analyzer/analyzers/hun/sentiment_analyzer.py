@@ -1,8 +1,10 @@
-from typing import List
+from typing import List, Optional, Union
 
 from sentiment_analyzer.analyzers.base_analyzer import (
     SentimentAnalyzerSingleton,
 )
+from sentiment_analyzer.analyzers.tokenization import PretokenizedBatch
+from sentiment_analyzer.models.sentiment_batch import SentimentBatch
 from sentiment_analyzer.models.sentiments import (
     LABEL_MAPPING_ROBERTA,
     Sentiments,
@@ -20,48 +22,61 @@ class HungarianSentimentAnalyzer(SentimentAnalyzerSingleton):
     is used for Hungarian sentiment analysis.
     """
 
-    _instance = None  # Singleton instance
+    _label_fields = LABEL_MAPPING_ROBERTA
 
-    def __new__(cls):
+    def __new__(cls, backend: str = "torch"):
         """
-        Creates and returns the singleton instance.
+        Creates and returns the singleton instance for the backend.
         The model is loaded only once when the first instance is created.
 
+        Args:
+            backend (str): "torch", "onnx" or "onnx-int8" (ONNX Runtime on the int8 quantized model).
         Returns:
             HungarianSentimentAnalyzer: The singleton instance of the sentiment analyzer.
         """
-        if cls._instance is None:
-            # If no instance exists, create one using the base class's __new__ method
-            cls._instance = super().__new__(
-                cls, model_name
-            )
-        return cls._instance
+        # The base class keeps one instance per model name and backend
+        return super().__new__(cls, model_name, backend)
+
+    def _map_sentiment_result(self, prediction) -> Sentiments:
+        sentiment_results = {
+            LABEL_MAPPING_ROBERTA[item["label"]]: round(item["score"], 4)
+            for item in prediction
+        }
+        return Sentiments(**sentiment_results)
 
     def analyze_text(self, text: str) -> Sentiments:
         """
         Analyzes the sentiment of a given text by calling the base class's `analyze` method
         to perform sentiment analysis, processes the results, and returns them in the `Sentiments` format.
+        Texts already in the result cache (see `set_cache`) are not analyzed again.
 
         Args:
             text (str): The Hungarian text to analyze for sentiment.
         Returns:
             Sentiments: A `Sentiments` object containing the processed sentiment results.
         """
-        sentiment_prediction = self.analyze(text)
-        sentiment_results = {
-            LABEL_MAPPING_ROBERTA[item["label"]]: round(item["score"], 4)
-            for item in sentiment_prediction[0]
-        }
-        return Sentiments(**sentiment_results)
+        return self._cached_results([text], self._score_texts)[0]
+
+    def analyze_batch(
+        self,
+        texts: Union[List[str], PretokenizedBatch],
+        batch_size: Optional[int] = None,
+        as_columns: bool = False,
+    ) -> Union[List[Sentiments], SentimentBatch]:
+        """
+        Analyzes the sentiment of a batch of Hungarian texts.
 
-    def analyze_batch(self, texts: List[str]) -> List[Sentiments]:
-        predictions = self.pipeline(texts)
-        return [
-            Sentiments(
-                **{
-                    LABEL_MAPPING_ROBERTA[item["label"]]: round(item["score"], 4)
-                    for item in prediction
-                }
-            )
-            for prediction in predictions
-        ]
+        Args:
+            texts (list): The Hungarian texts to analyze, or a `PretokenizedBatch` of them
+                          (see `pretokenize`), which skips their tokenization.
+            batch_size (int, optional): When set, the texts are tokenized once, sorted into
+                                        length buckets and run `batch_size` texts at a time.
+                                        Only the texts missing from the result cache are analyzed.
+            as_columns (bool): Whether to return the results as a columnar `SentimentBatch`
+                               instead of a list, for large batches.
+        Returns:
+            list: The `Sentiments` per text, in input order, or a `SentimentBatch`.
+        """
+        if as_columns:
+            return self._analyze_columns(texts, batch_size)
+        return self._analyze_texts(texts, batch_size)
@@ -0,0 +1,219 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageEvent:
+    """
+    The timing of one stage of an analyzer call, passed to the instrumentation callbacks.
+
+    Stages: "cache" (result cache lookup, without the scoring of the misses), "tokenize",
+    "forward" (padding and the model on one batch), "pipeline" (the Hugging Face pipeline,
+    which tokenizes and runs the model itself) and "map" (building the `Sentiments`).
+    """
+
+    stage: str
+    model: str  # The model name and backend of the analyzer
+    seconds: float
+    start_time_ns: int  # Wall-clock start in nanoseconds since the epoch, for span exporters
+    attributes: Dict[str, Any] = field(default_factory=dict)  # e.g. texts, padded_tokens, hits
+
+
+StageCallback = Callable[[StageEvent], None]
+
+
+class _NullStage:
+    """
+    The stage returned while no callback is registered: entering, updating and leaving it does nothing.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+    def set(self, **attributes):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """
+    Times a stage and reports it to the callbacks when it is left, also when it raised.
+    """
+
+    __slots__ = ("_instrumentation", "_stage", "_model", "_attributes", "_started", "_start_time_ns")
+
+    def __init__(self, instrumentation: "Instrumentation", stage: str, model: str, attributes: Dict[str, Any]):
+        self._instrumentation = instrumentation
+        self._stage = stage
+        self._model = model
+        self._attributes = attributes
+
+    def __enter__(self):
+        self._start_time_ns = time.time_ns()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        seconds = time.perf_counter() - self._started
+        if exc_type is not None:
+            self._attributes["error"] = exc_type.__name__
+        self._instrumentation.emit(
+            StageEvent(self._stage, self._model, seconds, self._start_time_ns, self._attributes)
+        )
+        return False
+
+    def set(self, **attributes):
+        """
+        Adds attributes known only inside the stage, e.g. the padded token count.
+        """
+        self._attributes.update(attributes)
+
+
+class Instrumentation:
+    """
+    Reports per-stage timings of the analyzers to pluggable callbacks.
+
+    Without callbacks, `stage` returns a shared no-op object, so the instrumented code only pays
+    for one method call per stage and batch. Callbacks run synchronously on the calling thread
+    and must be fast and thread-safe; a failing callback is logged and does not fail the analysis.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks: Tuple[StageCallback, ...] = ()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._callbacks)
+
+    def add_callback(self, callback: StageCallback):
+        """
+        Args:
+            callback (Callable): Called with a `StageEvent` at the end of every stage.
+        """
+        with self._lock:
+            self._callbacks = self._callbacks + (callback,)
+
+    def remove_callback(self, callback: StageCallback):
+        with self._lock:
+            self._callbacks = tuple(item for item in self._callbacks if item != callback)
+
+    def stage(self, stage: str, model: str, **attributes):
+        """
+        Returns a context manager timing a stage.
+
+        Args:
+            stage (str): The stage name, see `StageEvent`.
+            model (str): The model name and backend of the analyzer.
+            **attributes: Attributes of the event, e.g. the number of texts.
+        Returns:
+            A context manager whose `set(**attributes)` adds attributes while the stage runs.
+        """
+        if not self._callbacks:
+            return _NULL_STAGE
+        return _Stage(self, stage, model, attributes)
+
+    def record(self, stage: str, model: str, seconds: float, **attributes):
+        """
+        Reports a stage timed by the caller, e.g. the cache lookups around the scoring of the misses.
+        """
+        if not self._callbacks:
+            return
+        start_time_ns = time.time_ns() - int(seconds * 1e9)
+        self.emit(StageEvent(stage, model, seconds, start_time_ns, attributes))
+
+    def emit(self, event: StageEvent):
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Instrumentation callback %r failed", callback)
+
+
+class LoggingCallback:
+    """
+    Logs every stage event, e.g. `Instrumentation.add_callback(LoggingCallback(level=logging.INFO))`.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.logger = logger or logging.getLogger("sentiment_analyzer.instrumentation")
+        self.level = level
+
+    def __call__(self, event: StageEvent):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level,
+                "%s %s %.3fms %s",
+                event.model,
+                event.stage,
+                event.seconds * 1000,
+                event.attributes,
+            )
+
+
+class StageMetrics:
+    """
+    Prometheus-style counters per model and stage: the number of events, the total and maximum
+    seconds, and the sum of every numeric attribute (texts, padded tokens, cache hits, ...).
+    Export `snapshot()` to a metrics system periodically.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def __call__(self, event: StageEvent):
+        with self._lock:
+            counters = self._counters.setdefault(
+                (event.model, event.stage), {"count": 0, "seconds": 0.0, "max_seconds": 0.0}
+            )
+            counters["count"] += 1
+            counters["seconds"] += event.seconds
+            counters["max_seconds"] = max(counters["max_seconds"], event.seconds)
+            for name, value in event.attributes.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    counters[name] = counters.get(name, 0) + value
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """
+        Returns:
+            dict: A copy of the counters per (model, stage).
+        """
+        with self._lock:
+            return {key: dict(counters) for key, counters in self._counters.items()}
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+class SpanCallback:
+    """
+    Reports every stage as a finished span of an OpenTelemetry-like tracer: any object whose
+    `start_span(name, start_time=..., attributes=...)` returns a span with `end(end_time=...)`,
+    such as `opentelemetry.trace.get_tracer(__name__)`.
+    """
+
+    def __init__(self, tracer, prefix: str = "sentiment"):
+        self.tracer = tracer
+        self.prefix = prefix
+
+    def __call__(self, event: StageEvent):
+        span = self.tracer.start_span(
+            f"{self.prefix}.{event.stage}",
+            start_time=event.start_time_ns,
+            attributes={"model": event.model, **event.attributes},
+        )
+        span.end(end_time=event.start_time_ns + int(event.seconds * 1e9))
@@ -0,0 +1,141 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Tuple
+
+# Marks the end of the request queue when the batcher is closed
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Collects concurrent single-item requests into batches.
+
+    Requests submitted from many threads are queued and flushed as one batch
+    once `max_batch_size` items are waiting or `max_wait_ms` has elapsed since
+    the first item of the batch arrived. Each caller receives its own result
+    through a `Future`.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "micro-batcher",
+    ):
+        """
+        Starts the background worker that flushes the batches.
+
+        Args:
+            batch_fn (Callable): Function that maps a list of items to a list of results
+                                 of the same length and order.
+            max_batch_size (int): The maximum number of items flushed in one batch.
+            max_wait_ms (float): The maximum time to wait for a batch to fill up, in milliseconds.
+            name (str): The name of the worker thread.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._batch_fn = batch_fn
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item: Any) -> Future:
+        """
+        Queues an item for the next batch.
+
+        Args:
+            item: The item to process.
+        Returns:
+            Future: A future resolved with the result for this item.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Micro-batcher is closed")
+            self._queue.put((item, future))
+        return future
+
+    def close(self) -> None:
+        """
+        Stops accepting new items, flushes the pending ones and stops the worker.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join()
+
+    def _collect(self) -> Tuple[List[Tuple[Any, Future]], bool]:
+        """
+        Blocks until the first item arrives, then gathers more items until the batch
+        is full or the wait time is over.
+
+        Returns:
+            tuple: The collected requests and whether the batcher was stopped.
+        """
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                request = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if request is _STOP:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            batch, stopped = self._collect()
+
+            # Drop the requests whose callers cancelled their futures meanwhile
+            batch = [
+                (item, future)
+                for item, future in batch
+                if future.set_running_or_notify_cancel()
+            ]
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[Any, Future]]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            results = self._batch_fn(items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"Batch function returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
@@ -0,0 +1,146 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+def model_nbytes(model) -> int:
+    """
+    Approximates the resident size of a PyTorch model as the bytes of its parameters and buffers.
+
+    Args:
+        model (torch.nn.Module): The model to measure.
+    Returns:
+        int: The size in bytes.
+    """
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+@dataclass
+class ModelRegistryStats:
+    """
+    The metrics of a `ModelRegistry`.
+    """
+
+    loads: int = 0  # Number of model loads, including reloads after an eviction
+    reloads: int = 0  # Number of loads of a model that had been evicted before
+    evictions: int = 0
+    load_seconds: float = 0.0  # Total time spent loading models
+    resident_bytes: int = 0
+    max_bytes: Optional[int] = None
+    models: Dict[str, int] = field(default_factory=dict)  # Resident bytes per loaded model
+
+
+@dataclass
+class _Entry:
+    name: str
+    nbytes: int
+
+
+class ModelRegistry:
+    """
+    Tracks the loaded models and keeps their total size within a memory budget.
+
+    Analyzers report every load with `record_load` and every use with `touch`. When the
+    models exceed `max_bytes`, the least recently used ones are evicted by calling their
+    `_evict()` method, which drops the weights; an evicted analyzer reloads its model on
+    next use. The sizes are approximations (parameter and buffer bytes of the models).
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_bytes (int, optional): The memory budget in bytes. None means no limit.
+        """
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Any, _Entry]" = OrderedDict()
+        self._evicted = set()  # type: ignore
+        self._stats = ModelRegistryStats()
+        self.set_budget(max_bytes)
+
+    def set_budget(self, max_bytes: Optional[int]):
+        """
+        Sets the memory budget and evicts models until the loaded ones fit in it.
+
+        Args:
+            max_bytes (int, optional): The memory budget in bytes. None means no limit.
+        """
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        with self._lock:
+            self._stats.max_bytes = max_bytes
+            self._enforce_budget(keep=None)
+
+    def record_load(self, owner, name: str, nbytes: int, seconds: float):
+        """
+        Registers a freshly loaded model as the most recently used one and evicts the least
+        recently used models over the budget. The new model itself is never evicted.
+
+        Args:
+            owner: The analyzer holding the model; must implement `_evict()`.
+            name (str): The name of the model in the metrics.
+            nbytes (int): The approximate resident size of the model.
+            seconds (float): The time the load took.
+        """
+        with self._lock:
+            previous = self._entries.pop(owner, None)
+            if previous is not None:
+                self._stats.resident_bytes -= previous.nbytes
+            self._entries[owner] = _Entry(name, nbytes)
+            self._stats.resident_bytes += nbytes
+            self._stats.loads += 1
+            self._stats.load_seconds += seconds
+            if owner in self._evicted:
+                self._evicted.discard(owner)
+                self._stats.reloads += 1
+            self._enforce_budget(keep=owner)
+
+    def touch(self, owner):
+        """
+        Marks the model of an analyzer as the most recently used one.
+        """
+        with self._lock:
+            if owner in self._entries:
+                self._entries.move_to_end(owner)
+
+    def discard(self, owner):
+        """
+        Forgets an analyzer without evicting it, e.g. when it is released.
+        """
+        with self._lock:
+            entry = self._entries.pop(owner, None)
+            if entry is not None:
+                self._stats.resident_bytes -= entry.nbytes
+            self._evicted.discard(owner)
+
+    def _enforce_budget(self, keep):
+        max_bytes = self._stats.max_bytes
+        if max_bytes is None:
+            return
+        for owner in list(self._entries):
+            if self._stats.resident_bytes <= max_bytes:
+                break
+            if owner is keep:
+                continue
+            entry = self._entries.pop(owner)
+            self._stats.resident_bytes -= entry.nbytes
+            self._stats.evictions += 1
+            self._evicted.add(owner)
+            owner._evict()
+
+    @property
+    def stats(self) -> ModelRegistryStats:
+        with self._lock:
+            return ModelRegistryStats(
+                loads=self._stats.loads,
+                reloads=self._stats.reloads,
+                evictions=self._stats.evictions,
+                load_seconds=self._stats.load_seconds,
+                resident_bytes=self._stats.resident_bytes,
+                max_bytes=self._stats.max_bytes,
+                models={entry.name: entry.nbytes for entry in self._entries.values()},
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,34 @@
+import hashlib
+import os
+
+
+def resolve_model_version(model_name: str, config) -> str:
+    """
+    Identifies the revision of a loaded model, so cached results of an older
+    revision are not reused.
+
+    Args:
+        model_name (str): The Hugging Face model name or local model directory.
+        config: The configuration of the loaded model.
+    Returns:
+        str: The Hub commit hash of the model, or a fingerprint of the local model files.
+    """
+    commit_hash = getattr(config, "_commit_hash", None)
+    if commit_hash:
+        return commit_hash
+
+    model_dir = model_name
+    if not os.path.isdir(model_dir):
+        from transformers.utils import cached_file
+
+        model_dir = os.path.dirname(cached_file(model_name, "config.json"))
+        # Hub downloads live in .../snapshots/<commit hash>/
+        if os.path.basename(os.path.dirname(model_dir)) == "snapshots":
+            return os.path.basename(model_dir)
+
+    files = sorted(
+        (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+        for entry in os.scandir(model_dir)
+        if entry.is_file()
+    )
+    return hashlib.sha256(repr(files).encode("utf-8")).hexdigest()[:12]
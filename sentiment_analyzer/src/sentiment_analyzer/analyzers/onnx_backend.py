@@ -0,0 +1,140 @@
+import inspect
+import os
+import re
+import threading
+
+import numpy as np
+
+_DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sentiment_analyzer", "onnx")
+_EXPORT_LOCK = threading.Lock()
+# Bumped when the exported graph changes, so artifacts of an older export are not reused
+_EXPORT_FORMAT = 2
+
+
+def _onnx_cache_dir() -> str:
+    return os.environ.get("SENTIMENT_ANALYZER_ONNX_CACHE", _DEFAULT_CACHE_DIR)
+
+
+def export_onnx_model(model_name: str, model_version: str, quantize: bool = False) -> str:
+    """
+    Exports a sequence classification model to ONNX and caches the artifact on disk.
+
+    The artifact lives under `$SENTIMENT_ANALYZER_ONNX_CACHE` (default `~/.cache/sentiment_analyzer/onnx`)
+    in a directory named after the model and its revision, so a new model revision is exported again.
+
+    Args:
+        model_name (str): The Hugging Face model name or local model directory.
+        model_version (str): The revision of the model (see `resolve_model_version`).
+        quantize (bool): Whether to apply int8 dynamic quantization to the exported model.
+    Returns:
+        str: The path of the ONNX model file.
+    """
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    export_dir = os.path.join(
+        _onnx_cache_dir(), re.sub(r"[^\w.-]+", "--", model_name.strip("/")), model_version
+    )
+    model_path = os.path.join(export_dir, f"model.v{_EXPORT_FORMAT}.onnx")
+    quantized_path = os.path.join(export_dir, f"model.v{_EXPORT_FORMAT}.int8.onnx")
+    target_path = quantized_path if quantize else model_path
+
+    with _EXPORT_LOCK:
+        if os.path.exists(target_path):
+            return target_path
+
+        os.makedirs(export_dir, exist_ok=True)
+        if not os.path.exists(model_path):
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+            model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            model.eval()
+
+            sample = tokenizer(
+                ["Rövid szöveg.", "Ez egy kicsit hosszabb példa mondat."],
+                padding=True,
+                return_tensors="pt",
+            )
+            # The inputs are passed positionally, so they follow `model.forward` rather
+            # than the tokenizer (BERT tokenizers put token_type_ids before attention_mask)
+            forward_parameters = inspect.signature(model.forward).parameters
+            input_names = [name for name in forward_parameters if name in sample]
+            export_options = {}
+            # Recent torch versions default to the dynamo exporter; the TorchScript
+            # exporter handles the dynamic batch and sequence axes of these models
+            if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+                export_options["dynamo"] = False
+
+            # Written to a temporary file first, so other processes never load a partial model
+            partial_path = f"{model_path}.{os.getpid()}.tmp"
+            torch.onnx.export(
+                model,
+                tuple(sample[name] for name in input_names),
+                partial_path,
+                input_names=input_names,
+                output_names=["logits"],
+                dynamic_axes={
+                    **{name: {0: "batch", 1: "sequence"} for name in input_names},
+                    "logits": {0: "batch"},
+                },
+                opset_version=17,
+                **export_options,
+            )
+            os.replace(partial_path, model_path)
+
+        if quantize:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            partial_path = f"{quantized_path}.{os.getpid()}.tmp"
+            quantize_dynamic(model_path, partial_path, weight_type=QuantType.QInt8)
+            os.replace(partial_path, quantized_path)
+
+    return target_path
+
+
+class OnnxSequenceClassifier:
+    """
+    Runs an exported sequence classification model with ONNX Runtime on CPU.
+    """
+
+    def __init__(self, model_name: str, model_version: str, quantize: bool = False):
+        """
+        Exports the model on first use and opens an inference session on the artifact.
+
+        Args:
+            model_name (str): The Hugging Face model name or local model directory.
+            model_version (str): The revision of the model.
+            quantize (bool): Whether to run the int8 dynamically quantized model.
+        """
+        try:
+            import onnxruntime
+        except ImportError as exc:
+            raise RuntimeError("The ONNX backend requires the 'onnxruntime' package") from exc
+
+        self.model_path = export_onnx_model(model_name, model_version, quantize=quantize)
+        import torch
+
+        # Follow torch's intra-op thread count, so a worker pinned with
+        # `torch.set_num_threads` does not start a full ONNX Runtime thread pool
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = torch.get_num_threads()
+        self.session = onnxruntime.InferenceSession(
+            self.model_path, options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [item.name for item in self.session.get_inputs()]
+
+    def predict_proba(self, features: dict) -> np.ndarray:
+        """
+        Returns the label probabilities of a padded batch.
+
+        Args:
+            features (dict): The padded tokenizer outputs as NumPy arrays.
+        Returns:
+            np.ndarray: The probabilities per text and label, in the model's label order.
+        """
+        logits = self.session.run(
+            ["logits"],
+            {name: np.asarray(features[name], dtype=np.int64) for name in self.input_names},
+        )[0]
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        probabilities = np.exp(logits)
+        return probabilities / probabilities.sum(axis=-1, keepdims=True)
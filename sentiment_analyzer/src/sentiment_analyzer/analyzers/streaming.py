@@ -0,0 +1,79 @@
+import logging
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from sentiment_analyzer.models.sentiments import Sentiments
+
+logger = logging.getLogger(__name__)
+
+# Called with the input index, the invalid item and the error
+ErrorCallback = Callable[[int, Any, Exception], None]
+
+
+def _validate_text(text) -> str:
+    if not isinstance(text, str):
+        raise TypeError("Text to analyze must be a string")
+    if not text.strip():
+        raise ValueError("Missing text to analyze")
+    return text
+
+
+def _report_invalid(index: int, item, error: Exception, on_error: Optional[ErrorCallback]):
+    if on_error is not None:
+        on_error(index, item, error)
+    else:
+        logger.warning("Skipped invalid text at index %d: %s", index, error)
+
+
+def stream_sentiments(
+    texts: Iterable[str],
+    score_texts: Callable[[List[str]], List[Sentiments]],
+    chunk_size: int = 256,
+    skip_invalid: bool = True,
+    on_error: Optional[ErrorCallback] = None,
+) -> Iterator[Sentiments]:
+    """
+    Scores an iterable of texts chunk by chunk and yields the results as they are produced.
+
+    The iterable is consumed lazily and only one chunk of texts and results is held at a
+    time, so memory is bounded by `chunk_size` rather than by the number of texts.
+
+    Args:
+        texts (Iterable[str]): The texts to analyze. May be a generator of any length.
+        score_texts (Callable): Function mapping a list of valid texts to their `Sentiments`.
+        chunk_size (int): The number of texts scored at a time. A value below 1 raises a
+                          ValueError when called, before iteration starts.
+        skip_invalid (bool): Whether to skip texts that are not strings or are blank.
+                             When False, the first invalid text raises its error.
+        on_error (Callable, optional): Called with the input index, the item and the error
+                                       for every skipped text. Without it a warning is logged.
+    Returns:
+        Iterator[Sentiments]: The results of the valid texts, in input order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return _stream(texts, score_texts, chunk_size, skip_invalid, on_error)
+
+
+def _stream(
+    texts: Iterable[str],
+    score_texts: Callable[[List[str]], List[Sentiments]],
+    chunk_size: int,
+    skip_invalid: bool,
+    on_error: Optional[ErrorCallback],
+) -> Iterator[Sentiments]:
+    chunk: List[str] = []
+    for index, text in enumerate(texts):
+        try:
+            chunk.append(_validate_text(text))
+        except (TypeError, ValueError) as error:
+            if not skip_invalid:
+                raise
+            _report_invalid(index, text, error, on_error)
+            continue
+
+        if len(chunk) == chunk_size:
+            yield from score_texts(chunk)
+            chunk = []
+
+    if chunk:
+        yield from score_texts(chunk)
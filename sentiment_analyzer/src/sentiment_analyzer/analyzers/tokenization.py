@@ -0,0 +1,163 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+def tokenizer_id(tokenizer) -> str:
+    """
+    Identifies a tokenizer in the tokenization cache: the same vocabulary and truncation
+    length give the same encodings, whichever model the tokenizer was loaded for.
+
+    Args:
+        tokenizer: A Hugging Face tokenizer.
+    Returns:
+        str: The tokenizer class, name or path, vocabulary size and maximum length.
+    """
+    return (
+        f"{type(tokenizer).__name__}:{tokenizer.name_or_path}"
+        f":{len(tokenizer)}:{tokenizer.model_max_length}"
+    )
+
+
+def _text_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class PretokenizedBatch:
+    """
+    A batch of texts with their truncated, unpadded encodings from one tokenizer,
+    as returned by `SentimentAnalyzerSingleton.pretokenize`.
+
+    It can be passed to `analyze_batch` and `predict_proba` of any analyzer that uses
+    the same tokenizer instead of the texts, so the texts are not tokenized again.
+    """
+
+    def __init__(self, tokenizer_id: str, texts: List[str], encodings: Dict[str, List[List[int]]]):
+        """
+        Args:
+            tokenizer_id (str): The `tokenizer_id` of the tokenizer that encoded the texts.
+            texts (list): The texts, used by the result cache.
+            encodings (dict): The token lists per tokenizer output (e.g. `input_ids`,
+                              `attention_mask`), one list per text.
+        """
+        self.tokenizer_id = tokenizer_id
+        self.texts = texts
+        self.encodings = encodings
+        self._rows: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @property
+    def input_ids(self) -> List[List[int]]:
+        return self.encodings["input_ids"]
+
+    @property
+    def attention_mask(self) -> List[List[int]]:
+        return self.encodings["attention_mask"]
+
+    def select(self, texts: List[str]) -> Dict[str, List[List[int]]]:
+        """
+        Returns the encodings of some of the texts of the batch, in the given order.
+
+        Args:
+            texts (list): Texts of the batch, e.g. the result cache misses.
+        Returns:
+            dict: The token lists per tokenizer output.
+        """
+        if self._rows is None:
+            self._rows = {text: row for row, text in enumerate(self.texts)}
+        rows = [self._rows[text] for text in texts]
+        return {key: [values[row] for row in rows] for key, values in self.encodings.items()}
+
+
+@dataclass
+class TokenizationCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class TokenizationCache:
+    """
+    A thread-safe LRU cache of text encodings, keyed by the tokenizer id and the hash of the text.
+
+    Models that share a tokenizer share the cached encodings, so a text scored by several
+    models (e.g. sentiment and a later NER pass) is tokenized once. The missing texts of a
+    batch are encoded together with the fast tokenizer's batch encoding.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        """
+        Args:
+            max_entries (int): The maximum number of cached encodings.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, bytes], Dict[str, List[int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = TokenizationCacheStats()
+
+    def encode(self, tokenizer, texts: List[str]) -> Dict[str, List[List[int]]]:
+        """
+        Returns the truncated, unpadded encodings of the texts, tokenizing only the texts
+        missing from the cache.
+
+        Args:
+            tokenizer: A Hugging Face tokenizer.
+            texts (list): The texts to encode.
+        Returns:
+            dict: The token lists per tokenizer output, one list per text in input order.
+        """
+        name = tokenizer_id(tokenizer)
+        keys = [(name, _text_hash(text)) for text in texts]
+
+        with self._lock:
+            found = [self._entries.get(key) for key in keys]
+            for key, entry in zip(keys, found):
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+
+        missing: "OrderedDict[Tuple[str, bytes], str]" = OrderedDict()
+        for key, text, entry in zip(keys, texts, found):
+            if entry is None:
+                missing.setdefault(key, text)
+
+        if missing:
+            encoded = tokenizer(list(missing.values()), truncation=True)
+            computed = {
+                key: {output: values[row] for output, values in encoded.items()}
+                for row, key in enumerate(missing)
+            }
+            with self._lock:
+                self._stats.misses += len(computed)
+                for key, entry in computed.items():
+                    self._entries[key] = entry
+                    self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._stats.evictions += 1
+            found = [entry if entry is not None else computed[key] for key, entry in zip(keys, found)]
+
+        if not found:
+            return {}
+        return {output: [entry[output] for entry in found] for output in found[0]}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> TokenizationCacheStats:
+        with self._lock:
+            return TokenizationCacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                size=len(self._entries),
+            )
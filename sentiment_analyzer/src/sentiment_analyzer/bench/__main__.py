@@ -0,0 +1,120 @@
+"""
+Benchmarks the sentiment backends and writes the results as JSON.
+
+For every backend it measures the cold-load time and the peak RSS, and for every text-length
+distribution and batch size the throughput and the p50/p95/p99 call latency. The corpora are
+synthetic and the Hugging Face hub is used offline, so the models must be in the local cache or
+given with --model-path. With --baseline, the run is compared with an earlier result file and the
+exit status is 1 when a metric got worse by more than --threshold.
+
+Usage:
+    python -m sentiment_analyzer.bench --backends vader hun dan:onnx finbert --output bench.json
+    python -m sentiment_analyzer.bench --backends hun --model-path hun=/models/hun --baseline bench.json
+"""
+import argparse
+import json
+import os
+import sys
+
+from sentiment_analyzer.bench.compare import compare_results
+from sentiment_analyzer.bench.corpora import DISTRIBUTIONS
+from sentiment_analyzer.bench.runner import BACKENDS, parse_backend, run_benchmarks
+
+
+def _model_paths(values) -> dict:
+    paths = {}
+    for value in values:
+        backend, separator, path = value.partition("=")
+        if not separator or backend not in BACKENDS:
+            raise argparse.ArgumentTypeError(f"Expected BACKEND=PATH, got {value}")
+        paths[backend] = path
+    return paths
+
+
+def _print_results(results: dict):
+    for result in results["results"]:
+        name = f"{result['backend']}:{result['engine']}" if result["engine"] else result["backend"]
+        if "error" in result:
+            print(f"{name:<18} skipped: {result['error']}")
+            continue
+        peak = result["peak_rss_bytes"]
+        print(
+            f"{name:<18} cold load {result['cold_load_seconds']:7.2f}s"
+            f"  peak RSS {'n/a' if peak is None else f'{peak / 1024 ** 2:.0f} MiB'}"
+        )
+        for measurement in result["measurements"]:
+            latency = measurement["latency_ms"]
+            print(
+                f"  {measurement['distribution']:<7} batch {measurement['batch_size']:>4}"
+                f"  {measurement['texts_per_second']:10.1f} texts/s"
+                f"  p50 {latency['p50']:9.2f}ms  p95 {latency['p95']:9.2f}ms  p99 {latency['p99']:9.2f}ms"
+            )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m sentiment_analyzer.bench",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["vader", "hun", "dan", "finbert"],
+        help="Backends as NAME or NAME:ENGINE, e.g. hun:onnx. Names: " + ", ".join(BACKENDS),
+    )
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--distributions", nargs="+", choices=sorted(DISTRIBUTIONS), default=["short", "long"])
+    parser.add_argument("--size", type=int, default=256, help="Texts per corpus")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--threads", type=int, default=None, help="torch intra-op threads")
+    parser.add_argument("--model-path", nargs="*", default=[], metavar="BACKEND=PATH")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare with the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Tolerated relative regression")
+    parser.add_argument("--in-process", action="store_true", help="Run all backends in this process")
+    parser.add_argument("--allow-download", action="store_true", help="Let the models be downloaded")
+    args = parser.parse_args(argv)
+
+    try:
+        model_paths = _model_paths(args.model_path)
+        for spec in args.backends:
+            parse_backend(spec)
+    except (argparse.ArgumentTypeError, ValueError) as exc:
+        parser.error(str(exc))
+    if any(batch_size < 1 for batch_size in args.batch_sizes) or args.size < 1:
+        parser.error("--batch-sizes and --size must be at least 1")
+    if not args.allow_download:
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+    results = run_benchmarks(
+        args.backends,
+        batch_sizes=args.batch_sizes,
+        distributions=args.distributions,
+        size=args.size,
+        seed=args.seed,
+        model_paths=model_paths,
+        threads=args.threads,
+        isolate=not args.in_process,
+    )
+    _print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare_results(baseline, results, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
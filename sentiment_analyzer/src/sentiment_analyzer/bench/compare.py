@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+# The compared metrics, with whether a higher value is better
+MEASUREMENT_METRICS = {
+    "texts_per_second": True,
+    "latency_ms.p50": False,
+    "latency_ms.p95": False,
+}
+BACKEND_METRICS = {
+    "cold_load_seconds": False,
+    "peak_rss_bytes": False,
+}
+
+
+@dataclass
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """
+        The relative change from the baseline, e.g. -0.2 for 20% fewer texts per second.
+        """
+        return self.current / self.baseline - 1
+
+    def __str__(self) -> str:
+        return f"{self.name} {self.metric}: {self.baseline:.4g} -> {self.current:.4g} ({self.change:+.1%})"
+
+
+def _metric(record: dict, metric: str):
+    for key in metric.split("."):
+        record = record.get(key) if isinstance(record, dict) else None
+    return record
+
+
+def _backend_name(result: dict) -> str:
+    return f"{result['backend']}:{result['engine']}" if result["engine"] else result["backend"]
+
+
+def _records(results: dict) -> Iterator[Tuple[str, dict, Dict[str, bool]]]:
+    for result in results["results"]:
+        if "error" in result:
+            continue
+        name = _backend_name(result)
+        yield name, result, BACKEND_METRICS
+        for measurement in result["measurements"]:
+            yield (
+                f"{name} {measurement['distribution']} batch={measurement['batch_size']}",
+                measurement,
+                MEASUREMENT_METRICS,
+            )
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.1) -> List[Regression]:
+    """
+    Compares two benchmark runs and returns the metrics that got worse by more than the threshold.
+
+    Only the backends, distributions and batch sizes measured in both runs are compared, and
+    results of different machines are compared as they are: run the baseline on the same host.
+
+    Args:
+        baseline (dict): The results of the reference run, as written by the CLI.
+        current (dict): The results of the new run.
+        threshold (float): The tolerated relative change, e.g. 0.1 for 10%.
+    Returns:
+        List[Regression]: The regressions, in the order of the current results.
+    """
+    if baseline.get("version") != current.get("version"):
+        raise ValueError("The benchmark results have different versions and cannot be compared")
+
+    reference = {name: record for name, record, _ in _records(baseline)}
+    regressions = []
+    for name, record, metrics in _records(current):
+        if name not in reference:
+            continue
+        for metric, higher_is_better in metrics.items():
+            before, after = _metric(reference[name], metric), _metric(record, metric)
+            if not before or after is None:
+                continue
+            change = after / before - 1
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(Regression(name, metric, before, after))
+    return regressions
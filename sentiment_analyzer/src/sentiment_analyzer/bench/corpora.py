@@ -0,0 +1,77 @@
+import random
+from typing import Dict, List
+
+# Words per language, with some sentiment-bearing ones, so VADER has real work to do
+WORDS = {
+    "eng": (
+        "the market company results growth government election budget report energy prices team "
+        "season film city court decision profit loss strike good great excellent happy strong "
+        "bad terrible weak poor disappointing not very really"
+    ).split(),
+    "hun": (
+        "a piac cég eredmények növekedés kormány választás költségvetés jelentés energia árak "
+        "csapat szezon film város bíróság döntés nyereség veszteség sztrájk jó kiváló erős boldog "
+        "rossz szörnyű gyenge csalódás nem nagyon"
+    ).split(),
+    "dan": (
+        "markedet selskabet resultater vækst regeringen valg budget rapport energi priser holdet "
+        "sæson film byen retten beslutning overskud tab strejke god fantastisk stærk glad "
+        "dårlig forfærdelig svag skuffende ikke meget"
+    ).split(),
+}
+
+# The number of words per text of each distribution, drawn uniformly from the range
+DISTRIBUTIONS = {
+    "short": (5, 15),  # headlines
+    "medium": (30, 80),  # leads and short posts
+    "long": (200, 400),  # articles, mostly longer than the models' 512-token limit
+    "mixed": (3, 400),  # log-normal lengths, mostly short with a long tail
+}
+
+
+def _length(rng: random.Random, distribution: str) -> int:
+    low, high = DISTRIBUTIONS[distribution]
+    if distribution == "mixed":
+        return min(high, max(low, int(rng.lognormvariate(3.0, 0.9))))
+    return rng.randint(low, high)
+
+
+def make_corpus(language: str, distribution: str, size: int, seed: int = 7) -> List[str]:
+    """
+    Generates a reproducible synthetic corpus, so benchmarks need no data files or network.
+
+    Args:
+        language (str): 'eng', 'hun' or 'dan'; selects the vocabulary.
+        distribution (str): The text-length distribution, a key of `DISTRIBUTIONS`.
+        size (int): The number of texts.
+        seed (int): The random seed; the same arguments give the same corpus.
+    Returns:
+        List[str]: The texts, made of sentences of 4 to 16 words.
+    """
+    if language not in WORDS:
+        raise ValueError(f"Unsupported language: {language}")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unsupported distribution: {distribution}")
+
+    rng = random.Random(f"{language}:{distribution}:{seed}")
+    words = WORDS[language]
+    texts = []
+    for _ in range(size):
+        remaining = _length(rng, distribution)
+        sentences = []
+        while remaining > 0:
+            count = min(remaining, rng.randint(4, 16))
+            sentence = " ".join(rng.choice(words) for _ in range(count))
+            sentences.append(sentence[0].upper() + sentence[1:] + rng.choice(".!."))
+            remaining -= count
+        texts.append(" ".join(sentences))
+    return texts
+
+
+def corpus_stats(texts: List[str]) -> Dict[str, float]:
+    """
+    Returns:
+        dict: The mean and maximum number of words per text, recorded with the results.
+    """
+    lengths = [len(text.split()) for text in texts]
+    return {"mean_words": sum(lengths) / len(lengths), "max_words": max(lengths)}
@@ -0,0 +1,257 @@
+import datetime
+import importlib.metadata
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from sentiment_analyzer.bench.corpora import corpus_stats, make_corpus
+
+# The version of the result file layout, checked by `compare_results`
+RESULTS_VERSION = 1
+
+# The benchmarked backends with the language of their corpora
+BACKENDS = {
+    "vader": "eng",
+    "hun": "hun",
+    "dan": "dan",
+    "finbert": "eng",
+}
+ENGINES = ("torch", "onnx", "onnx-int8")
+# The packages whose versions are recorded with the results
+_PACKAGES = ("sentiment_analyzer", "sentiment_analyzer_finbert", "torch", "transformers", "onnxruntime", "nltk")
+
+ScoreFunction = Callable[[List[str], int], list]
+
+
+def parse_backend(spec: str) -> Dict[str, str]:
+    """
+    Parses a backend argument such as "hun", "hun:onnx" or "finbert:onnx-int8".
+
+    Args:
+        spec (str): The backend name, optionally followed by ":" and the inference engine.
+    Returns:
+        dict: The backend name and engine; VADER has no engine.
+    """
+    name, _, engine = spec.partition(":")
+    if name not in BACKENDS:
+        raise ValueError(f"Unsupported backend: {name}. Supported backends: {', '.join(BACKENDS)}")
+    if name == "vader":
+        if engine:
+            raise ValueError("The vader backend has no inference engine")
+        return {"backend": name, "engine": ""}
+    engine = engine or "torch"
+    if engine not in ENGINES:
+        raise ValueError(f"Unsupported engine: {engine}. Supported engines: {', '.join(ENGINES)}")
+    return {"backend": name, "engine": engine}
+
+
+def _load_backend(backend: str, engine: str, model_path: Optional[str]) -> ScoreFunction:
+    """
+    Loads a backend and returns a function scoring a batch of texts with a batch size.
+    """
+    if backend == "vader":
+        from sentiment_analyzer.analyzers.eng.sentiment_analyzer import EnglishSentimentAnalyzer
+
+        analyzer = EnglishSentimentAnalyzer()
+        return lambda texts, batch_size: analyzer.analyze_batch(texts)
+
+    if backend == "finbert":
+        # A separate package, benchmarked when it is installed
+        from sentiment_analyzer_finbert import SentimentAnalyzer
+
+        analyzer = SentimentAnalyzer(model_id=model_path, backend=engine)
+        return lambda texts, batch_size: analyzer.analyze_batch(texts)
+
+    from sentiment_analyzer.analyzers.base_analyzer import SentimentAnalyzerSingleton
+    from sentiment_analyzer.factory.sentiment_factory import SentimentAnalyzerFactory
+
+    analyzer_class = SentimentAnalyzerFactory.get_analyzer_class(BACKENDS[backend])
+    if model_path is None:
+        analyzer = analyzer_class(backend=engine)
+    else:
+        # A local copy of the model, e.g. a test fixture
+        analyzer = SentimentAnalyzerSingleton.__new__(analyzer_class, model_path, engine)
+    return lambda texts, batch_size: analyzer.analyze_batch(texts, batch_size=batch_size)
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    """
+    Args:
+        latencies (list): The call latencies in seconds.
+    Returns:
+        dict: The p50, p95 and p99 latencies in milliseconds.
+    """
+    p50, p95, p99 = np.percentile(np.asarray(latencies) * 1000, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
+
+
+def benchmark_backend(
+    backend: str,
+    engine: str = "",
+    model_path: Optional[str] = None,
+    batch_sizes: Iterable[int] = (1, 8, 32),
+    distributions: Iterable[str] = ("short", "long"),
+    size: int = 256,
+    seed: int = 7,
+    threads: Optional[int] = None,
+) -> dict:
+    """
+    Benchmarks one backend in the current process.
+
+    The cold-load time is the time to construct the analyzer and score a first text, so it
+    includes lazy loading. Every batch size is warmed up once before it is measured.
+
+    Args:
+        backend (str): 'vader', 'hun', 'dan' or 'finbert'.
+        engine (str): The inference engine of the transformer backends.
+        model_path (str, optional): A local model directory instead of the default model.
+        batch_sizes (Iterable[int]): The number of texts per call.
+        distributions (Iterable[str]): The text-length distributions of the corpora.
+        size (int): The number of texts per corpus.
+        seed (int): The corpus seed.
+        threads (int, optional): The torch intra-op thread count.
+    Returns:
+        dict: The backend, its cold-load time and peak RSS, and one measurement per
+              distribution and batch size.
+    """
+    if threads is not None:
+        import torch
+
+        torch.set_num_threads(threads)
+
+    language = BACKENDS[backend]
+    started = time.perf_counter()
+    score = _load_backend(backend, engine, model_path)
+    score(make_corpus(language, "short", 1, seed), 1)
+    cold_load_seconds = time.perf_counter() - started
+
+    measurements = []
+    for distribution in distributions:
+        texts = make_corpus(language, distribution, size, seed)
+        for batch_size in batch_sizes:
+            score(texts[:batch_size], batch_size)
+            latencies = []
+            started = time.perf_counter()
+            for start in range(0, len(texts), batch_size):
+                call_started = time.perf_counter()
+                score(texts[start : start + batch_size], batch_size)
+                latencies.append(time.perf_counter() - call_started)
+            elapsed = time.perf_counter() - started
+            measurements.append(
+                {
+                    "distribution": distribution,
+                    "batch_size": batch_size,
+                    "texts": len(texts),
+                    **corpus_stats(texts),
+                    "seconds": elapsed,
+                    "texts_per_second": len(texts) / elapsed,
+                    "latency_ms": percentiles(latencies),
+                }
+            )
+
+    return {
+        "backend": backend,
+        "engine": engine,
+        "cold_load_seconds": cold_load_seconds,
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "measurements": measurements,
+    }
+
+
+def _benchmark_isolated(kwargs: dict) -> dict:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(benchmark_backend, **kwargs).result()
+
+
+def _environment() -> dict:
+    versions = {}
+    for package in _PACKAGES:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "packages": versions,
+    }
+
+
+def run_benchmarks(
+    backends: Iterable[str],
+    batch_sizes: Iterable[int] = (1, 8, 32),
+    distributions: Iterable[str] = ("short", "long"),
+    size: int = 256,
+    seed: int = 7,
+    model_paths: Optional[Dict[str, str]] = None,
+    threads: Optional[int] = None,
+    isolate: bool = True,
+) -> dict:
+    """
+    Benchmarks the backends and returns the results in the layout written by the CLI.
+
+    With `isolate`, every backend runs in a fresh process, so its cold-load time and peak RSS
+    are not affected by the backends before it. A backend that cannot be loaded (e.g. the
+    finbert package is not installed or the model is not available offline) is reported with
+    its error instead of failing the run.
+
+    Args:
+        backends (Iterable[str]): Backend specs, see `parse_backend`.
+        batch_sizes (Iterable[int]): The number of texts per call.
+        distributions (Iterable[str]): The text-length distributions of the corpora.
+        size (int): The number of texts per corpus.
+        seed (int): The corpus seed.
+        model_paths (dict, optional): Local model directories per backend name.
+        threads (int, optional): The torch intra-op thread count.
+        isolate (bool): Whether to run every backend in its own process.
+    Returns:
+        dict: The environment, the configuration and the results per backend.
+    """
+    batch_sizes = list(batch_sizes)
+    distributions = list(distributions)
+    model_paths = model_paths or {}
+    config = {
+        "batch_sizes": batch_sizes,
+        "distributions": distributions,
+        "size": size,
+        "seed": seed,
+        "threads": threads,
+    }
+
+    results = []
+    for spec in backends:
+        kwargs = {
+            **parse_backend(spec),
+            **config,
+        }
+        kwargs["model_path"] = model_paths.get(kwargs["backend"])
+        try:
+            results.append(_benchmark_isolated(kwargs) if isolate else benchmark_backend(**kwargs))
+        except Exception as exc:
+            results.append({"backend": kwargs["backend"], "engine": kwargs["engine"], "error": repr(exc)})
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "environment": _environment(),
+        "config": config,
+        "results": results,
+    }
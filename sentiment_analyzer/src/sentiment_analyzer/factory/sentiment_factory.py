@@ -1,6 +1,7 @@
-from sentiment_analyzer.analyzers.dan.sentiment_analyzer import DanishSentimentAnalyzer
-from sentiment_analyzer.analyzers.eng.sentiment_analyzer import EnglishSentimentAnalyzer
-from sentiment_analyzer.analyzers.hun.sentiment_analyzer import HungarianSentimentAnalyzer
+import gc
+import importlib
+import threading
+from typing import Iterable, Optional
 
 
 class SentimentAnalyzerFactory:
@@ -9,17 +10,40 @@ class SentimentAnalyzerFactory:
 
     This class is used to get the appropriate sentiment analyzer instance based on the specified language.
     It supports English (eng), Danish (dan), and Hungarian (hun) analyzers.
+
+    The analyzers are loaded lazily: importing the factory loads no model, and an analyzer's module
+    and model are only loaded by the first `get_analyzer` call for its language.
     """
-    _analyzers = {
-        "hun": HungarianSentimentAnalyzer(),
-        "dan": DanishSentimentAnalyzer(),
-        "eng": EnglishSentimentAnalyzer(),
+
+    # The analyzer class of each language as (module, class name), imported on first use
+    _registry = {
+        "hun": ("sentiment_analyzer.analyzers.hun.sentiment_analyzer", "HungarianSentimentAnalyzer"),
+        "dan": ("sentiment_analyzer.analyzers.dan.sentiment_analyzer", "DanishSentimentAnalyzer"),
+        "eng": ("sentiment_analyzer.analyzers.eng.sentiment_analyzer", "EnglishSentimentAnalyzer"),
     }
+    # The loaded analyzers per language
+    _analyzers = {}  # type: ignore
+    _lock = threading.RLock()
+
+    @staticmethod
+    def get_analyzer_class(language: str):
+        """
+        Imports and returns the analyzer class of a language without loading its model.
+
+        Args:
+            language (str): The language code, 'hun', 'dan' or 'eng'.
+        Returns:
+            type: The language-specific sentiment analyzer class.
+        """
+        if language not in SentimentAnalyzerFactory._registry:
+            raise ValueError(f"Unsupported language: {language}")
+        module_name, class_name = SentimentAnalyzerFactory._registry[language]
+        return getattr(importlib.import_module(module_name), class_name)
 
     @staticmethod
     def get_analyzer(language: str):
         """
-        Retrieves the sentiment analyzer for the specified language.
+        Retrieves the sentiment analyzer for the specified language, loading it on first use.
 
         Args:
             language (str): The language code for which the sentiment analyzer is requested.
@@ -27,6 +51,55 @@ class SentimentAnalyzerFactory:
         Returns:
             SentimentAnalyzer: The language-specific sentiment analyzer instance.
         """
-        if language not in SentimentAnalyzerFactory._analyzers:
+        analyzer = SentimentAnalyzerFactory._analyzers.get(language)
+        if analyzer is not None:
+            return analyzer
+
+        with SentimentAnalyzerFactory._lock:
+            if language not in SentimentAnalyzerFactory._analyzers:
+                analyzer_class = SentimentAnalyzerFactory.get_analyzer_class(language)
+                SentimentAnalyzerFactory._analyzers[language] = analyzer_class()
+            return SentimentAnalyzerFactory._analyzers[language]
+
+    @staticmethod
+    def preload(languages: Optional[Iterable[str]] = None):
+        """
+        Loads the analyzers up front, e.g. to warm up a service before it takes traffic.
+
+        Args:
+            languages (Iterable[str], optional): The languages to load. None loads all of them.
+        """
+        for language in SentimentAnalyzerFactory._registry if languages is None else languages:
+            SentimentAnalyzerFactory.get_analyzer(language)
+
+    @staticmethod
+    def unload(language: str) -> bool:
+        """
+        Releases the analyzer of a language so its model can be freed.
+        The next `get_analyzer` call for the language loads it again.
+
+        Args:
+            language (str): The language code of the analyzer to release.
+        Returns:
+            bool: Whether the analyzer was loaded.
+        """
+        if language not in SentimentAnalyzerFactory._registry:
             raise ValueError(f"Unsupported language: {language}")
-        return SentimentAnalyzerFactory._analyzers[language]
\ No newline at end of file
+
+        with SentimentAnalyzerFactory._lock:
+            analyzer = SentimentAnalyzerFactory._analyzers.pop(language, None)
+        if analyzer is None:
+            return False
+
+        analyzer.release()
+        del analyzer
+        gc.collect()
+        return True
+
+    @staticmethod
+    def loaded_languages() -> list:
+        """
+        Returns:
+            list: The languages whose analyzers are currently loaded.
+        """
+        return list(SentimentAnalyzerFactory._analyzers)
@@ -0,0 +1,298 @@
+import math
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from sentiment_analyzer.models.sentiments import Sentiments
+
+# The sentiment labels, indexed by their code in `SentimentBatch.label_codes`
+LABELS = ("negative", "neutral", "positive")
+_LABEL_CODES = {label: code for code, label in enumerate(LABELS)}
+
+# The probability fields in the candidate order of `Sentiments.get_max_sentiment`,
+# so ties resolve to the same label, and the label code of each
+_CANDIDATE_FIELDS = ("very_negative", "negative", "neutral", "positive", "very_positive")
+_CANDIDATE_CODES = np.array([0, 0, 1, 2, 2], dtype=np.int8)
+
+
+def round_like_python(
+    values: np.ndarray, ndigits: int = 4, exact: Optional[Callable[[int], float]] = None
+) -> np.ndarray:
+    """
+    Rounds an array to the same floats as Python's `round` does value by value.
+
+    NumPy rounds the values scaled by 10**ndigits, and the scaling error can flip a value
+    lying within that error of a half to the other side. Those rare values are rounded
+    with Python's `round` instead.
+
+    Args:
+        values (np.ndarray): The values to round.
+        ndigits (int): The number of decimals.
+        exact (Callable, optional): Returns the Python-computed value at an index, for
+                                    values that are themselves approximations (e.g. NumPy's
+                                    `tanh`). By default the value itself is used.
+    Returns:
+        np.ndarray: The rounded values.
+    """
+    scale = 10.0**ndigits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    near_half = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+    for index in np.flatnonzero(near_half):
+        value = exact(index) if exact is not None else float(values.flat[index])
+        rounded.flat[index] = round(value, ndigits)
+    return rounded
+
+
+def score_probabilities(
+    fields: Sequence[str], probabilities: np.ndarray
+) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes what `Sentiments` derives from the probabilities of a model, for a whole batch:
+    the rounded probabilities, the compound scores, the label codes and the sentiment values.
+    The results are identical to `Sentiments.__post_init__`.
+
+    Args:
+        fields (Sequence[str]): The `Sentiments` field of every probability column.
+        probabilities (np.ndarray): The probabilities, one row per text.
+    Returns:
+        tuple: The rounded columns of all five probability fields by name (zeros for the
+               fields the model does not predict), the compound scores, the label codes
+               and the probabilities of the labels.
+    """
+    probabilities = np.asarray(probabilities, dtype=np.float64).reshape(-1, len(fields))
+    zeros = np.zeros(len(probabilities))
+    rounded = {
+        field: round_like_python(np.ascontiguousarray(probabilities[:, index]))
+        for index, field in enumerate(fields)
+    }
+    columns = {field: rounded.get(field, zeros) for field in _CANDIDATE_FIELDS}
+
+    difference = columns["positive"] - columns["negative"]
+    compound = round_like_python(
+        np.tanh(difference), exact=lambda index: math.tanh(difference[index])
+    )
+    # argmax picks the first of equal values, as max() does in `get_max_sentiment`
+    candidates = np.stack(list(columns.values()), axis=1)
+    winners = np.argmax(candidates, axis=1) if len(candidates) else np.zeros(0, dtype=np.int64)
+    values = candidates[np.arange(len(candidates)), winners]
+    return columns, compound, _CANDIDATE_CODES[winners], values
+
+
+class SentimentBatch:
+    """
+    The results of a batch of texts stored as columns instead of one `Sentiments` per text.
+
+    The scores are contiguous float32 arrays and the labels are int8 codes into `LABELS`,
+    so a large batch costs a few arrays instead of millions of small objects. Indexing or
+    iterating builds the `Sentiments` of a row on demand, equal to the one `analyze_batch`
+    returns without `as_columns`. The very negative/positive columns are only present
+    for models that predict them.
+    """
+
+    def __init__(
+        self,
+        negative: np.ndarray,
+        neutral: np.ndarray,
+        positive: np.ndarray,
+        compound: np.ndarray,
+        label_codes: np.ndarray,
+        very_negative: Optional[np.ndarray] = None,
+        very_positive: Optional[np.ndarray] = None,
+        compound_provided: bool = False,
+    ):
+        """
+        Args:
+            negative, neutral, positive (np.ndarray): The rounded class probabilities.
+            compound (np.ndarray): The compound scores.
+            label_codes (np.ndarray): The sentiment label of every row as an index into `LABELS`.
+            very_negative, very_positive (np.ndarray, optional): The probabilities of the
+                                                                 five-class models.
+            compound_provided (bool): Whether the compound scores come from the model (VADER)
+                                      and decide the labels, instead of being derived from
+                                      the probabilities.
+        """
+        self.negative = np.ascontiguousarray(negative, dtype=np.float32)
+        self.neutral = np.ascontiguousarray(neutral, dtype=np.float32)
+        self.positive = np.ascontiguousarray(positive, dtype=np.float32)
+        self.compound = np.ascontiguousarray(compound, dtype=np.float32)
+        self.label_codes = np.ascontiguousarray(label_codes, dtype=np.int8)
+        self.very_negative = (
+            None if very_negative is None else np.ascontiguousarray(very_negative, dtype=np.float32)
+        )
+        self.very_positive = (
+            None if very_positive is None else np.ascontiguousarray(very_positive, dtype=np.float32)
+        )
+        self.compound_provided = compound_provided
+
+    @classmethod
+    def from_probabilities(cls, fields: Sequence[str], probabilities: np.ndarray) -> "SentimentBatch":
+        """
+        Builds the batch from the class probabilities of a transformer model, computing
+        the compound scores and labels of all rows at once.
+
+        Args:
+            fields (Sequence[str]): The `Sentiments` field of every probability column,
+                                    e.g. ("negative", "neutral", "positive").
+            probabilities (np.ndarray): The probabilities, one row per text.
+        Returns:
+            SentimentBatch: The results.
+        """
+        columns, compound, label_codes, _ = score_probabilities(fields, probabilities)
+        return cls(
+            negative=columns["negative"],
+            neutral=columns["neutral"],
+            positive=columns["positive"],
+            compound=compound,
+            label_codes=label_codes,
+            very_negative=columns["very_negative"] if "very_negative" in fields else None,
+            very_positive=columns["very_positive"] if "very_positive" in fields else None,
+        )
+
+    @classmethod
+    def from_vader(cls, scores: List[dict]) -> "SentimentBatch":
+        """
+        Builds the batch from VADER `polarity_scores` results.
+
+        Args:
+            scores (list): The `polarity_scores` dict of every text.
+        Returns:
+            SentimentBatch: The results.
+        """
+        values = np.array(
+            [[score["neg"], score["neu"], score["pos"], score["compound"]] for score in scores],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        compound = np.round(values[:, 3], 4)
+        label_codes = np.where(
+            compound >= 0.05,
+            _LABEL_CODES["positive"],
+            np.where(compound <= -0.05, _LABEL_CODES["negative"], _LABEL_CODES["neutral"]),
+        )
+        return cls(
+            negative=values[:, 0],
+            neutral=values[:, 1],
+            positive=values[:, 2],
+            compound=compound,
+            label_codes=label_codes,
+            compound_provided=True,
+        )
+
+    @classmethod
+    def from_sentiments(cls, results: List[Sentiments]) -> "SentimentBatch":
+        """
+        Builds the batch from `Sentiments` objects, e.g. results served by a result cache.
+
+        Args:
+            results (list): The `Sentiments` of every text, all from the same analyzer.
+        Returns:
+            SentimentBatch: The results.
+        """
+        five_classes = any(result.very_negative or result.very_positive for result in results)
+        return cls(
+            negative=np.array([result.negative for result in results]),
+            neutral=np.array([result.neutral for result in results]),
+            positive=np.array([result.positive for result in results]),
+            compound=np.array([result.compound for result in results]),
+            label_codes=np.array([_LABEL_CODES[result.sentiment_label] for result in results]),
+            very_negative=np.array([result.very_negative for result in results]) if five_classes else None,
+            very_positive=np.array([result.very_positive for result in results]) if five_classes else None,
+            # Sentiments only sets the compound label when the model provided the compound score
+            compound_provided=bool(results) and results[0].compound_label != "",
+        )
+
+    def __len__(self) -> int:
+        return len(self.label_codes)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Sentiments, "SentimentBatch"]:
+        """
+        Returns the `Sentiments` of a row, or a batch viewing a slice of the rows.
+        """
+        if isinstance(index, slice):
+            return SentimentBatch(
+                negative=self.negative[index],
+                neutral=self.neutral[index],
+                positive=self.positive[index],
+                compound=self.compound[index],
+                label_codes=self.label_codes[index],
+                very_negative=None if self.very_negative is None else self.very_negative[index],
+                very_positive=None if self.very_positive is None else self.very_positive[index],
+                compound_provided=self.compound_provided,
+            )
+
+        row = range(len(self))[index]
+        values = {
+            "negative": float(self.negative[row]),
+            "neutral": float(self.neutral[row]),
+            "positive": float(self.positive[row]),
+        }
+        if self.very_negative is not None:
+            values["very_negative"] = float(self.very_negative[row])
+            values["very_positive"] = float(self.very_positive[row])
+        if self.compound_provided:
+            values["compound"] = float(self.compound[row])
+        # Sentiments rounds the float32 values back to the original 4 decimals
+        return Sentiments(**values)
+
+    def __iter__(self) -> Iterator[Sentiments]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def to_sentiments(self) -> List[Sentiments]:
+        return list(self)
+
+    @property
+    def labels(self) -> np.ndarray:
+        """
+        The sentiment label of every row as strings.
+        """
+        return np.array(LABELS)[self.label_codes]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Returns the score columns and the label codes by name, without copying them.
+        """
+        columns = {"negative": self.negative}
+        if self.very_negative is not None:
+            columns["very_negative"] = self.very_negative
+        columns.update(neutral=self.neutral, positive=self.positive)
+        if self.very_positive is not None:
+            columns["very_positive"] = self.very_positive
+        columns.update(compound=self.compound, label_code=self.label_codes)
+        return columns
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Returns the rows as a NumPy structured array with one field per column.
+        """
+        columns = self.columns()
+        rows = np.empty(len(self), dtype=[(name, column.dtype) for name, column in columns.items()])
+        for name, column in columns.items():
+            rows[name] = column
+        return rows
+
+    def to_arrow(self):
+        """
+        Returns the columns as a `pyarrow.Table`; the labels become a dictionary column
+        over the label codes. Requires `pyarrow`.
+        """
+        import pyarrow as pa
+
+        columns = self.columns()
+        label_codes = columns.pop("label_code")
+        arrays = {name: pa.array(column) for name, column in columns.items()}
+        arrays["label"] = pa.DictionaryArray.from_arrays(pa.array(label_codes), pa.array(LABELS))
+        return pa.table(arrays)
+
+    def to_pandas(self):
+        """
+        Returns the columns as a `pandas.DataFrame`; the labels become a categorical column
+        over the label codes. Requires `pandas`.
+        """
+        import pandas as pd
+
+        columns = self.columns()
+        label_codes = columns.pop("label_code")
+        frame = pd.DataFrame(columns, copy=False)
+        frame["label"] = pd.Categorical.from_codes(label_codes, categories=LABELS)
+        return frame
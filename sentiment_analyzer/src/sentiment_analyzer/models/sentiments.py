@@ -1,6 +1,6 @@
 import math
 from dataclasses import asdict, dataclass, field
-from typing import Optional
+from typing import List, Optional, Sequence
 
 
 LABEL_MAPPING_ROBERTA = {
@@ -27,6 +27,52 @@ class Sentiments:
     sentiment_label: str = field(default="")
     sentiment_value: float = field(default=0.0)
 
+    @classmethod
+    def from_probabilities(cls, fields: Sequence[str], probabilities) -> List["Sentiments"]:
+        """
+        Builds the `Sentiments` of a whole batch from the class probabilities of a model.
+
+        The rounding, compound scores and labels are computed for all rows at once with NumPy
+        (see `score_probabilities`) and the instances are filled in directly, skipping the
+        per-instance work of `__post_init__`. The results are identical to constructing them
+        one by one.
+
+        Args:
+            fields (Sequence[str]): The field of every probability column,
+                                    e.g. ("negative", "neutral", "positive").
+            probabilities: The probabilities as an array or nested list, one row per text.
+        Returns:
+            list: The `Sentiments` per row.
+        """
+        from sentiment_analyzer.models.sentiment_batch import LABELS, score_probabilities
+
+        columns, compound, label_codes, values = score_probabilities(fields, probabilities)
+
+        results = []
+        # Converted to Python floats in chunks, so the temporary lists stay small
+        for start in range(0, len(compound), 4096):
+            chunk = slice(start, start + 4096)
+            rows = zip(
+                *(column[chunk].tolist() for column in columns.values()),
+                compound[chunk].tolist(),
+                label_codes[chunk].tolist(),
+                values[chunk].tolist(),
+            )
+            for very_negative, negative, neutral, positive, very_positive, score, code, value in rows:
+                # Assigned in field order, like `__init__`, so the instances share their key layout
+                result = cls.__new__(cls)
+                result.negative = negative
+                result.very_negative = very_negative
+                result.neutral = neutral
+                result.positive = positive
+                result.very_positive = very_positive
+                result.compound = score
+                result.compound_label = ""
+                result.sentiment_label = LABELS[code]
+                result.sentiment_value = value
+                results.append(result)
+        return results
+
     def asdict(self) -> dict:
         return asdict(self)
 
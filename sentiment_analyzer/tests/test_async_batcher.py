@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+import pytest
+
+from sentiment_analyzer.analyzers.async_batcher import AsyncBatcher
+
+
+def test_async_batcher_coalesces_awaiters_without_blocking_the_loop():
+    batch_sizes = []
+
+    def batch_fn(items):
+        batch_sizes.append(len(items))
+        time.sleep(0.02)  # Blocking inference, run off the event loop
+        return [item * 2 for item in items]
+
+    async def main():
+        batcher = AsyncBatcher(batch_fn, max_batch_size=32, max_wait_ms=5, max_queue_size=64)
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker = asyncio.ensure_future(heartbeat())
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(300)))
+        ticker.cancel()
+        await batcher.close()
+        return results, ticks
+
+    results, ticks = asyncio.run(main())
+
+    assert results == [i * 2 for i in range(300)]
+    assert sum(batch_sizes) == 300
+    assert max(batch_sizes) <= 32
+    assert len(batch_sizes) < 30
+    assert ticks > len(batch_sizes)
+
+
+def test_async_batcher_propagates_errors_to_every_awaiter():
+    def batch_fn(items):
+        raise RuntimeError("model failure")
+
+    async def main():
+        batcher = AsyncBatcher(batch_fn, max_wait_ms=0)
+        try:
+            return await asyncio.gather(
+                batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+            )
+        finally:
+            await batcher.close()
+
+    errors = asyncio.run(main())
+
+    assert [str(error) for error in errors] == ["model failure", "model failure"]
+
+
+def test_async_batcher_rebinds_to_a_new_event_loop_and_rejects_after_close():
+    batcher = AsyncBatcher(lambda items: items, max_wait_ms=0)
+
+    assert asyncio.run(batcher.submit("first")) == "first"
+    assert asyncio.run(batcher.submit("second")) == "second"
+
+    asyncio.run(batcher.close())
+    with pytest.raises(RuntimeError, match="Async batcher is closed"):
+        asyncio.run(batcher.submit("third"))
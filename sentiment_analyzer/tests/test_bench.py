@@ -0,0 +1,49 @@
+import copy
+
+import pytest
+
+from sentiment_analyzer.bench.compare import compare_results
+from sentiment_analyzer.bench.corpora import DISTRIBUTIONS, make_corpus
+from sentiment_analyzer.bench.runner import parse_backend, run_benchmarks
+
+
+def test_corpora_are_reproducible_and_follow_the_distribution():
+    for distribution, (low, high) in DISTRIBUTIONS.items():
+        texts = make_corpus("hun", distribution, 50, seed=3)
+
+        assert texts == make_corpus("hun", distribution, 50, seed=3)
+        assert all(low <= len(text.split()) <= high for text in texts)
+    assert make_corpus("dan", "short", 5) != make_corpus("dan", "short", 5, seed=8)
+
+
+def test_parse_backend():
+    assert parse_backend("hun") == {"backend": "hun", "engine": "torch"}
+    assert parse_backend("finbert:onnx-int8") == {"backend": "finbert", "engine": "onnx-int8"}
+    with pytest.raises(ValueError):
+        parse_backend("vader:onnx")
+    with pytest.raises(ValueError):
+        parse_backend("spa")
+
+
+def test_run_and_compare():
+    results = run_benchmarks(
+        ["vader", "finbert"],
+        batch_sizes=[1, 4],
+        distributions=["short"],
+        size=8,
+        model_paths={"finbert": "/nonexistent/model"},
+        isolate=False,
+    )
+
+    vader, finbert = results["results"]
+    assert [(item["batch_size"], item["texts"]) for item in vader["measurements"]] == [(1, 8), (4, 8)]
+    assert vader["cold_load_seconds"] > 0
+    assert set(vader["measurements"][0]["latency_ms"]) == {"p50", "p95", "p99"}
+    assert "error" in finbert
+
+    assert compare_results(results, results) == []
+    slower = copy.deepcopy(results)
+    slower["results"][0]["measurements"][1]["texts_per_second"] /= 2
+    regressions = compare_results(results, slower, threshold=0.1)
+    assert [(item.name, item.metric) for item in regressions] == [("vader short batch=4", "texts_per_second")]
+    assert regressions[0].change == pytest.approx(-0.5)
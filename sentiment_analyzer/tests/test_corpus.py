@@ -0,0 +1,46 @@
+import pytest
+
+from sentiment_analyzer.analyzers.corpus import _chunks, analyze_corpus
+from sentiment_analyzer.analyzers.eng.sentiment_analyzer import EnglishSentimentAnalyzer
+
+
+def test_chunks_reads_the_iterable_lazily():
+    chunks = _chunks((str(number) for number in range(5)), 2)
+
+    assert next(chunks) == ["0", "1"]
+    assert list(chunks) == [["2", "3"], ["4"]]
+
+
+def test_analyze_corpus_rejects_unknown_language():
+    with pytest.raises(ValueError, match="Unsupported language"):
+        analyze_corpus(["text"], language="xyz")
+
+
+def test_analyze_corpus_yields_results_in_input_order():
+    texts = [f"This is {'a great' if number % 2 else 'an awful'} day number {number}" for number in range(23)]
+
+    results = list(analyze_corpus(iter(texts), language="eng", workers=2, chunk_size=4))
+
+    expected = EnglishSentimentAnalyzer().analyze_batch(texts)
+    assert [result.compound for result in results] == [result.compound for result in expected]
+
+
+def test_analyze_corpus_reports_skipped_texts_by_input_index():
+    texts = ["A great day.", "", "An awful day.", None, "   ", "Just a day."]
+    errors = []
+
+    results = list(
+        analyze_corpus(
+            texts,
+            language="eng",
+            workers=1,
+            chunk_size=2,
+            on_error=lambda index, item, error: errors.append((index, type(error))),
+        )
+    )
+
+    expected = EnglishSentimentAnalyzer().analyze_batch(["A great day.", "An awful day.", "Just a day."])
+    assert [result.compound for result in results] == [result.compound for result in expected]
+    assert errors == [(1, ValueError), (3, TypeError), (4, ValueError)]
+    with pytest.raises(ValueError, match="Missing text"):
+        list(analyze_corpus(texts, language="eng", workers=1, skip_invalid=False))
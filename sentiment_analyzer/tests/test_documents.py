@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from sentiment_analyzer.analyzers.documents import aggregate_windows
+
+# Three windows of document 0 and one window of document 1, not grouped by document
+PROBABILITIES = np.array([[0.6, 0.3, 0.1], [0.2, 0.2, 0.6], [0.1, 0.8, 0.1], [0.3, 0.3, 0.4]])
+LENGTHS = np.array([10, 30, 10, 5])
+DOCUMENTS = np.array([0, 1, 0, 0])
+
+
+def test_mean_weights_the_windows_by_token_count():
+    result = aggregate_windows(PROBABILITIES, LENGTHS, DOCUMENTS, 2, "mean")
+
+    assert np.allclose(result[0], [0.34, 0.5, 0.16])
+    assert np.allclose(result[1], [0.2, 0.2, 0.6])
+    assert np.allclose(result.sum(axis=1), 1.0)
+
+
+def test_max_takes_the_most_confident_window():
+    result = aggregate_windows(PROBABILITIES, LENGTHS, DOCUMENTS, 2, "max")
+
+    assert result.tolist() == [[0.1, 0.8, 0.1], [0.2, 0.2, 0.6]]
+
+
+def test_unknown_aggregation_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported aggregation: median"):
+        aggregate_windows(PROBABILITIES, LENGTHS, DOCUMENTS, 2, "median")
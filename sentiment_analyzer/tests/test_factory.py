@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from sentiment_analyzer.factory.sentiment_factory import SentimentAnalyzerFactory
+
+
+def test_importing_the_factory_loads_no_model():
+    code = (
+        "import sys\n"
+        "import sentiment_analyzer.factory.sentiment_factory\n"
+        "print(sorted(name for name in ('torch', 'transformers', 'nltk') if name in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_get_analyzer_loads_once_and_unload_releases():
+    SentimentAnalyzerFactory.unload("eng")
+
+    SentimentAnalyzerFactory.preload(["eng"])
+    analyzer = SentimentAnalyzerFactory.get_analyzer("eng")
+
+    assert "eng" in SentimentAnalyzerFactory.loaded_languages()
+    assert SentimentAnalyzerFactory.get_analyzer("eng") is analyzer
+    assert SentimentAnalyzerFactory.unload("eng") is True
+    assert SentimentAnalyzerFactory.unload("eng") is False
+    assert SentimentAnalyzerFactory.get_analyzer("eng") is not analyzer
+
+
+def test_unsupported_language_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported language"):
+        SentimentAnalyzerFactory.get_analyzer("xyz")
+    with pytest.raises(ValueError, match="Unsupported language"):
+        SentimentAnalyzerFactory.unload("xyz")
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("torch", "transformers", "nltk", "onnxruntime")
+# Generous, so slow CI machines pass; importing torch and transformers alone takes several seconds
+BUDGET_SECONDS = 2.0
+
+
+def import_times(statement):
+    """
+    Runs `statement` in a fresh interpreter under `python -X importtime`.
+
+    Returns:
+        dict: The cumulative import time in seconds of every imported module.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "sentiment_analyzer",
+        "sentiment_analyzer.factory.sentiment_factory",
+        "sentiment_analyzer.analyzers.hun.sentiment_analyzer",
+        "sentiment_analyzer.analyzers.dan.sentiment_analyzer",
+        "sentiment_analyzer.analyzers.eng.sentiment_analyzer",
+        "sentiment_analyzer.analyzers.corpus",
+    ],
+)
+def test_importing_loads_no_heavy_dependency(module):
+    times = import_times(f"import {module}")
+
+    assert module in times
+    assert [name for name in HEAVY_MODULES if name in times] == []
+    assert times[module] < BUDGET_SECONDS
+
+
+def test_package_exports_resolve_lazily():
+    import sentiment_analyzer
+
+    assert sentiment_analyzer.Sentiments.__name__ == "Sentiments"
+    assert "SentimentAnalyzerFactory" in sentiment_analyzer.__all__
+    with pytest.raises(AttributeError):
+        sentiment_analyzer.missing
@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from sentiment_analyzer.analyzers.base_analyzer import SentimentAnalyzerSingleton
+from sentiment_analyzer.analyzers.dan.sentiment_analyzer import DanishSentimentAnalyzer
+from sentiment_analyzer.analyzers.instrumentation import Instrumentation, SpanCallback, StageMetrics
+from sentiment_analyzer.cache.result_cache import SentimentCache
+
+
+class _StubAnalyzer(DanishSentimentAnalyzer):
+    """
+    A Danish analyzer with fixed probabilities, so no model has to be loaded.
+    """
+
+    def __new__(cls):
+        analyzer = object.__new__(cls)
+        analyzer.model_name, analyzer.backend, analyzer.model_version = "stub", "torch", "1"
+        analyzer.config = SimpleNamespace(id2label={0: "negativ", 1: "neutral", 2: "positiv"})
+        analyzer._cache = None
+        return analyzer
+
+    @property
+    def pipeline(self):
+        return None
+
+    def _predict_model_proba(self, texts, batch_size, encodings=None):
+        return np.tile([0.1, 0.2, 0.7], (len(texts), 1))
+
+
+@pytest.fixture
+def metrics():
+    metrics = StageMetrics()
+    SentimentAnalyzerSingleton.instrumentation.add_callback(metrics)
+    yield metrics
+    SentimentAnalyzerSingleton.instrumentation.remove_callback(metrics)
+
+
+def test_stages_are_reported_with_cache_hits(metrics):
+    analyzer = _StubAnalyzer()
+    analyzer.set_cache(SentimentCache())
+
+    analyzer.analyze_batch(["a", "b", "a"], batch_size=8)
+    analyzer.analyze_batch(["a", "c"], batch_size=8)
+
+    snapshot = metrics.snapshot()
+    assert snapshot[("stub/torch", "cache")]["hits"] == 2
+    assert snapshot[("stub/torch", "cache")]["misses"] == 3
+    assert snapshot[("stub/torch", "map")]["count"] == 2
+    assert snapshot[("stub/torch", "map")]["texts"] == 3
+
+
+def test_disabled_instrumentation_reports_nothing():
+    instrumentation = Instrumentation()
+    events = []
+
+    with instrumentation.stage("forward", "model", batch_size=2) as stage:
+        stage.set(padded_tokens=10)
+    instrumentation.add_callback(events.append)
+    instrumentation.remove_callback(events.append)
+    instrumentation.record("cache", "model", 0.1, hits=1)
+
+    assert not instrumentation.enabled
+    assert events == []
+
+
+def test_failing_stage_is_reported_and_callback_errors_are_contained():
+    instrumentation = Instrumentation()
+    events = []
+    instrumentation.add_callback(lambda event: 1 / 0)
+    instrumentation.add_callback(events.append)
+
+    with pytest.raises(KeyError):
+        with instrumentation.stage("tokenize", "model", texts=3):
+            raise KeyError("input_ids")
+
+    [event] = events
+    assert (event.stage, event.model, event.attributes) == ("tokenize", "model", {"texts": 3, "error": "KeyError"})
+    assert event.seconds >= 0
+
+
+def test_span_callback_ends_spans_at_the_stage_end():
+    spans = []
+
+    class _Span:
+        def __init__(self, name, start_time, attributes):
+            self.record = {"name": name, "start": start_time, "attributes": attributes}
+            spans.append(self.record)
+
+        def end(self, end_time):
+            self.record["end"] = end_time
+
+    instrumentation = Instrumentation()
+    instrumentation.add_callback(SpanCallback(SimpleNamespace(start_span=_Span)))
+    instrumentation.record("forward", "model", 0.5, batch_size=4)
+
+    [span] = spans
+    assert span["name"] == "sentiment.forward"
+    assert span["attributes"] == {"model": "model", "batch_size": 4}
+    assert span["end"] - span["start"] == 500_000_000
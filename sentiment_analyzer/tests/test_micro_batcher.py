@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from sentiment_analyzer.analyzers.micro_batcher import MicroBatcher
+
+
+def test_micro_batcher_groups_concurrent_requests():
+    batch_sizes = []
+
+    def batch_fn(items):
+        batch_sizes.append(len(items))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=4, max_wait_ms=50)
+    results = [None] * 8
+
+    def worker(index):
+        results[index] = batcher.submit(index).result()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert results == [i * 2 for i in range(8)]
+    assert sum(batch_sizes) == 8
+    assert max(batch_sizes) <= 4
+    assert len(batch_sizes) < 8
+
+
+def test_micro_batcher_propagates_errors_to_every_caller():
+    def batch_fn(items):
+        raise RuntimeError("model failure")
+
+    batcher = MicroBatcher(batch_fn, max_wait_ms=0)
+    future = batcher.submit("text")
+
+    with pytest.raises(RuntimeError, match="model failure"):
+        future.result()
+    batcher.close()
+
+
+def test_micro_batcher_rejects_requests_after_close():
+    batcher = MicroBatcher(lambda items: items)
+    batcher.close()
+
+    with pytest.raises(RuntimeError, match="Micro-batcher is closed"):
+        batcher.submit("text")
@@ -0,0 +1,57 @@
+import pytest
+
+from sentiment_analyzer.analyzers.model_registry import ModelRegistry
+
+
+class _Owner:
+    def __init__(self):
+        self.evicted = 0
+
+    def _evict(self):
+        self.evicted += 1
+
+
+def test_registry_evicts_least_recently_used_models_over_budget():
+    registry = ModelRegistry(max_bytes=250)
+    first, second, third = _Owner(), _Owner(), _Owner()
+
+    registry.record_load(first, "first", 100, 1.0)
+    registry.record_load(second, "second", 100, 1.0)
+    registry.touch(first)
+    registry.record_load(third, "third", 100, 1.0)
+
+    assert (first.evicted, second.evicted, third.evicted) == (0, 1, 0)
+    assert registry.stats.models == {"first": 100, "third": 100}
+    assert registry.stats.resident_bytes == 200
+    assert registry.stats.evictions == 1
+
+
+def test_registry_counts_reloads_and_keeps_the_new_model_even_over_budget():
+    registry = ModelRegistry(max_bytes=150)
+    first, second = _Owner(), _Owner()
+
+    registry.record_load(first, "first", 100, 0.5)
+    registry.record_load(second, "second", 200, 1.5)
+    registry.record_load(first, "first", 100, 0.5)
+
+    stats = registry.stats
+    assert second.evicted == 1
+    assert stats.models == {"first": 100}
+    assert (stats.loads, stats.reloads, stats.evictions) == (3, 1, 2)
+    assert stats.load_seconds == 2.5
+
+
+def test_registry_shrinking_the_budget_evicts_and_discard_forgets():
+    registry = ModelRegistry()
+    first, second = _Owner(), _Owner()
+    registry.record_load(first, "first", 100, 0.1)
+    registry.record_load(second, "second", 100, 0.1)
+
+    registry.set_budget(100)
+    registry.discard(second)
+
+    assert first.evicted == 1
+    assert len(registry) == 0
+    assert registry.stats.resident_bytes == 0
+    with pytest.raises(ValueError):
+        registry.set_budget(0)
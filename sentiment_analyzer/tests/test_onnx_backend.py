@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+from sentiment_analyzer.analyzers.base_analyzer import SentimentAnalyzerSingleton
+from sentiment_analyzer.analyzers.dan.sentiment_analyzer import DanishSentimentAnalyzer
+
+WORDS = "det var en god dag dårlig nyhed firmaet tabte vandt meget".split()
+TEXTS = [
+    "Det var en god dag.",
+    "Dårlig nyhed.",
+    "Firmaet tabte meget, det var en meget dårlig dag for firmaet.",
+    "God",
+    "Firmaet vandt.",
+    "Det var en god nyhed, firmaet vandt meget " * 2,
+]
+
+
+class _TinyAnalyzer(DanishSentimentAnalyzer):
+    """
+    A Danish analyzer on a small randomly initialized BERT, which has token_type_ids like senda.
+    """
+
+    def __new__(cls, model_name, backend="torch"):
+        return SentimentAnalyzerSingleton.__new__(cls, model_name, backend)
+
+
+@pytest.fixture(scope="module")
+def tiny_bert(tmp_path_factory):
+    path = tmp_path_factory.mktemp("tiny-bert")
+    vocab = path / "vocab.txt"
+    vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", ",", "."] + WORDS), encoding="utf-8")
+    tokenizer = transformers.BertTokenizerFast(vocab_file=str(vocab))
+    tokenizer.model_max_length = 64
+    config = transformers.BertConfig(
+        vocab_size=len(tokenizer),
+        hidden_size=16,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=32,
+        max_position_embeddings=64,
+        type_vocab_size=2,
+        # Large initial weights, so the texts get clearly different probabilities
+        initializer_range=0.5,
+        id2label={0: "positiv", 1: "negativ", 2: "neutral"},
+        label2id={"positiv": 0, "negativ": 1, "neutral": 2},
+    )
+    torch.manual_seed(0)
+    transformers.BertForSequenceClassification(config).save_pretrained(path)
+    tokenizer.save_pretrained(path)
+    return str(path)
+
+
+@pytest.mark.parametrize("backend, tolerance", [("onnx", 1e-4), ("onnx-int8", 0.05)])
+def test_onnx_backends_match_torch(tiny_bert, tmp_path, monkeypatch, backend, tolerance):
+    monkeypatch.setenv("SENTIMENT_ANALYZER_ONNX_CACHE", str(tmp_path))
+    reference = _TinyAnalyzer(tiny_bert)
+    analyzer = _TinyAnalyzer(tiny_bert, backend=backend)
+    try:
+        # One batch, so the shorter texts are padded
+        expected = reference.predict_proba(TEXTS, batch_size=len(TEXTS))
+        probabilities = analyzer.predict_proba(TEXTS, batch_size=len(TEXTS))
+    finally:
+        reference.release()
+        analyzer.release()
+
+    # A random model still scores different texts differently
+    assert np.ptp(expected, axis=0).max() > 1e-3
+    assert np.allclose(probabilities, expected, atol=tolerance)
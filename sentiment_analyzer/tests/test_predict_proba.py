@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from sentiment_analyzer.analyzers.dan.sentiment_analyzer import DanishSentimentAnalyzer
+from sentiment_analyzer.models.sentiments import Sentiments
+
+
+class _StubAnalyzer(DanishSentimentAnalyzer):
+    """
+    A Danish analyzer whose model returns fixed probabilities in its own label order
+    (positive first), so no model has to be loaded.
+    """
+
+    def __new__(cls):
+        analyzer = object.__new__(cls)
+        analyzer.config = SimpleNamespace(id2label={0: "positiv", 1: "negativ", 2: "neutral"})
+        analyzer._cache = None
+        return analyzer
+
+    @property
+    def pipeline(self):
+        return None
+
+    def _predict_model_proba(self, texts, batch_size, encodings=None):
+        return np.array([[0.7, 0.1, 0.2] if "good" in text else [0.1, 0.6, 0.3] for text in texts])
+
+
+def test_predict_proba_returns_columns_in_label_order():
+    analyzer = _StubAnalyzer()
+
+    probabilities = analyzer.predict_proba(["good day", "bad day"])
+
+    assert analyzer.proba_labels == ["negative", "neutral", "positive"]
+    assert probabilities.tolist() == [[0.1, 0.2, 0.7], [0.6, 0.3, 0.1]]
+    assert analyzer.predict_proba([]).shape == (0, 3)
+    with pytest.raises(ValueError):
+        analyzer.predict_proba(["good day", ""])
+
+
+def test_batches_are_built_from_the_probabilities():
+    analyzer = _StubAnalyzer()
+
+    assert analyzer.analyze_batch(["good day", "bad day"], batch_size=8) == [
+        Sentiments(negative=0.1, neutral=0.2, positive=0.7),
+        Sentiments(negative=0.6, neutral=0.3, positive=0.1),
+    ]
+    assert analyzer.analyze_batch(["good day"], as_columns=True).labels.tolist() == ["positive"]
+
+
+class _StubForwardAnalyzer(_StubAnalyzer):
+    """
+    Scores every input as [token count, first token id, 0] and records the token counts
+    of each forward pass.
+    """
+
+    def __new__(cls):
+        analyzer = super().__new__(cls)
+        analyzer.batches = []
+        return analyzer
+
+    def _forward(self, features):
+        self.batches.append([len(input_ids) for input_ids in features["input_ids"]])
+        return np.array([[len(input_ids), input_ids[0], 0] for input_ids in features["input_ids"]])
+
+
+def test_predict_encoded_returns_inputs_in_input_order():
+    analyzer = _StubForwardAnalyzer()
+    lengths = [5, 1, 4, 2, 6, 3, 1]
+    input_ids = [[index] * length for index, length in enumerate(lengths)]
+    encodings = {"input_ids": input_ids, "attention_mask": [[1] * len(ids) for ids in input_ids]}
+
+    probabilities = analyzer._predict_encoded(encodings, batch_size=3)
+
+    assert probabilities.tolist() == [[length, index, 0] for index, length in enumerate(lengths)]
+    # Each batch holds the next inputs by token length
+    assert analyzer.batches == [[1, 1, 2], [3, 4, 5], [6]]
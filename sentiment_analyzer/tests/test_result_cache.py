@@ -0,0 +1,56 @@
+import time
+
+from sentiment_analyzer.cache.result_cache import SentimentCache, make_cache_key
+from sentiment_analyzer.models.sentiments import Sentiments
+
+
+def _compute(calls):
+    def compute(texts):
+        calls.append(list(texts))
+        return [Sentiments(positive=len(text) / 100) for text in texts]
+
+    return compute
+
+
+def test_cache_key_ignores_whitespace_but_not_model():
+    assert make_cache_key("model", "  Good   news ") == make_cache_key("model", "Good news")
+    assert make_cache_key("model", "Good news") != make_cache_key("other", "Good news")
+
+
+def test_resolve_only_computes_unique_misses_in_input_order():
+    cache = SentimentCache()
+    calls = []
+
+    first = cache.resolve("model", ["a", "bb", "a"], _compute(calls))
+    second = cache.resolve("model", ["ccc", "bb", "a"], _compute(calls))
+
+    assert calls == [["a", "bb"], ["ccc"]]
+    assert [result.positive for result in first] == [0.01, 0.02, 0.01]
+    assert [result.positive for result in second] == [0.03, 0.02, 0.01]
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 4
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = SentimentCache(max_size=2)
+    calls = []
+
+    cache.resolve("model", ["a", "b"], _compute(calls))
+    cache.resolve("model", ["a"], _compute(calls))
+    cache.resolve("model", ["c"], _compute(calls))
+    cache.resolve("model", ["a", "b"], _compute(calls))
+
+    assert calls[-1] == ["b"]
+    assert cache.stats.evictions == 2
+    assert len(cache) == 2
+
+
+def test_cache_expires_entries_after_ttl():
+    cache = SentimentCache(ttl=0.01)
+    calls = []
+
+    cache.resolve("model", ["a"], _compute(calls))
+    time.sleep(0.02)
+    cache.resolve("model", ["a"], _compute(calls))
+
+    assert calls == [["a"], ["a"]]
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from sentiment_analyzer.analyzers.eng.sentiment_analyzer import EnglishSentimentAnalyzer
+from sentiment_analyzer.models.sentiment_batch import LABELS, SentimentBatch
+from sentiment_analyzer.models.sentiments import LABEL_MAPPING_ROBERTA, Sentiments
+
+FIVE_CLASS_FIELDS = list(LABEL_MAPPING_ROBERTA.values())
+
+
+def test_from_probabilities_rows_match_sentiments():
+    rng = np.random.default_rng(3)
+    probabilities = rng.dirichlet(np.ones(5), size=200)
+    # A tie between two classes after rounding resolves like `Sentiments`
+    probabilities[0] = [0.1, 0.4, 0.1, 0.4, 0.0]
+
+    batch = SentimentBatch.from_probabilities(FIVE_CLASS_FIELDS, probabilities)
+
+    expected = [
+        Sentiments(**{field: round(float(value), 4) for field, value in zip(FIVE_CLASS_FIELDS, row)})
+        for row in probabilities
+    ]
+    assert batch.to_sentiments() == expected
+    assert batch.labels.tolist() == [result.sentiment_label for result in expected]
+    assert batch.compound.dtype == np.float32 and batch.label_codes.dtype == np.int8
+
+
+def test_english_columns_match_batch_results():
+    analyzer = EnglishSentimentAnalyzer()
+    texts = ["A great day.", "", "An awful, terrible day.", "Just a day."]
+
+    batch = analyzer.analyze_batch(texts, as_columns=True)
+
+    assert len(batch) == 3
+    assert list(batch) == analyzer.analyze_batch(texts)
+    assert batch[-1] == analyzer.analyze_text("Just a day.")
+    assert batch[1:].labels.tolist() == ["negative", "neutral"]
+
+
+def test_from_sentiments_round_trips_and_exports():
+    results = [
+        Sentiments(negative=0.1, neutral=0.2, positive=0.7, compound=0.6),
+        Sentiments(negative=0.5, neutral=0.4, positive=0.1, compound=-0.3),
+    ]
+
+    batch = SentimentBatch.from_sentiments(results)
+    rows = batch.to_numpy()
+
+    assert batch.to_sentiments() == results
+    assert rows.dtype.names == ("negative", "neutral", "positive", "compound", "label_code")
+    assert [LABELS[code] for code in rows["label_code"]] == ["positive", "negative"]
+
+
+def test_pandas_and_arrow_exports():
+    pd = pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+    batch = SentimentBatch.from_probabilities(
+        ["negative", "neutral", "positive"], [[0.7, 0.2, 0.1], [0.1, 0.1, 0.8]]
+    )
+
+    frame = batch.to_pandas()
+    table = batch.to_arrow()
+
+    assert frame["label"].tolist() == ["negative", "positive"]
+    assert isinstance(frame["label"].dtype, pd.CategoricalDtype)
+    assert table.column("label").to_pylist() == ["negative", "positive"]
+    assert table.schema.field("positive").type == pa.float32()
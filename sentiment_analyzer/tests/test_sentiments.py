@@ -0,0 +1,36 @@
+import numpy as np
+
+from sentiment_analyzer.models.sentiment_batch import round_like_python
+from sentiment_analyzer.models.sentiments import LABEL_MAPPING_ROBERTA, Sentiments
+
+
+def test_round_like_python_matches_round_near_halves():
+    rng = np.random.default_rng(5)
+    values = np.concatenate(
+        [
+            rng.random(20000),
+            (rng.integers(0, 10000, 20000) + 0.5) / 10000,  # decimal halves
+            np.nextafter((np.arange(1000) + 0.5) / 10000, 1.0),
+        ]
+    )
+
+    assert round_like_python(values).tolist() == [round(value, 4) for value in values.tolist()]
+
+
+def test_from_probabilities_matches_constructing_one_by_one():
+    rng = np.random.default_rng(9)
+    fields = list(LABEL_MAPPING_ROBERTA.values())
+    probabilities = rng.dirichlet(np.ones(5), size=5000)
+    probabilities[:500, 3] = (rng.integers(0, 10000, 500) + 0.5) / 10000
+    probabilities[500] = [0.0, 0.3, 0.1, 0.3, 0.3]
+
+    results = Sentiments.from_probabilities(fields, probabilities)
+
+    assert results == [
+        Sentiments(**{field: round(value, 4) for field, value in zip(fields, row)})
+        for row in probabilities.tolist()
+    ]
+    assert results[500].sentiment_label == "negative"
+    assert Sentiments.from_probabilities(["negative", "neutral", "positive"], [[0.2, 0.1, 0.7]]) == [
+        Sentiments(negative=0.2, neutral=0.1, positive=0.7)
+    ]
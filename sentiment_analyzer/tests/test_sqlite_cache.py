@@ -0,0 +1,45 @@
+from sentiment_analyzer.cache.sqlite_cache import (
+    SqliteSentimentCache,
+    decode_sentiments,
+    encode_sentiments,
+)
+from sentiment_analyzer.models.sentiments import Sentiments
+
+
+def test_encoding_round_trips_derived_fields():
+    transformer_result = Sentiments(very_negative=0.05, negative=0.1, neutral=0.15, positive=0.6, very_positive=0.1)
+    vader_result = Sentiments(negative=0.1, neutral=0.3, positive=0.6, compound=-0.2)
+
+    assert decode_sentiments(encode_sentiments(transformer_result)) == transformer_result
+    assert decode_sentiments(encode_sentiments(vader_result)) == vader_result
+
+
+def test_results_persist_across_cache_instances(tmp_path):
+    path = str(tmp_path / "sentiments.db")
+    calls = []
+
+    def compute(texts):
+        calls.append(list(texts))
+        return [Sentiments(positive=0.9, neutral=0.1) for _ in texts]
+
+    first = SqliteSentimentCache(path).resolve("model@1", ["Good news", "Bad news"], compute)
+    reopened = SqliteSentimentCache(path)
+    second = reopened.resolve("model@1", ["Good news", "Bad news"], compute)
+    reopened.resolve("model@2", ["Good news"], compute)
+
+    assert second == first
+    assert calls == [["Good news", "Bad news"], ["Good news"]]
+    assert reopened.stats.hits == 2
+    assert len(reopened) == 3
+
+
+def test_prune_deletes_expired_results(tmp_path):
+    cache = SqliteSentimentCache(str(tmp_path / "sentiments.db"), ttl=60)
+    cache.set("00" * 32, Sentiments(positive=1.0))
+
+    with cache._connection() as connection:
+        connection.execute("UPDATE sentiments SET created_at = created_at - 120")
+
+    assert cache.get("00" * 32) is None
+    assert cache.prune() == 1
+    assert len(cache) == 0
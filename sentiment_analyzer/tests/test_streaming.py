@@ -0,0 +1,26 @@
+import pytest
+
+from sentiment_analyzer.analyzers.eng.sentiment_analyzer import EnglishSentimentAnalyzer
+from sentiment_analyzer.analyzers.streaming import stream_sentiments
+
+
+def test_analyze_stream_reports_skipped_texts_and_keeps_order():
+    analyzer = EnglishSentimentAnalyzer()
+    errors = []
+
+    results = list(
+        analyzer.analyze_stream(
+            iter(["A great day.", "", "An awful day.", 42, "Just a day."]),
+            chunk_size=2,
+            on_error=lambda index, item, error: errors.append(index),
+        )
+    )
+
+    expected = analyzer.analyze_batch(["A great day.", "An awful day.", "Just a day."])
+    assert [result.compound for result in results] == [result.compound for result in expected]
+    assert errors == [1, 3]
+
+
+def test_stream_sentiments_rejects_invalid_chunk_size_when_called():
+    with pytest.raises(ValueError, match="chunk_size"):
+        stream_sentiments(["A great day."], lambda texts: [], chunk_size=0)
@@ -0,0 +1,57 @@
+import pytest
+
+from sentiment_analyzer.analyzers.tokenization import TokenizationCache, tokenizer_id
+
+
+class _Tokenizer:
+    """
+    Encodes every character as a token and records the texts it was called with.
+    """
+
+    name_or_path = "char-tokenizer"
+    model_max_length = 8
+
+    def __init__(self):
+        self.calls = []
+
+    def __len__(self):
+        return 256
+
+    def __call__(self, texts, truncation=False):
+        self.calls.append(list(texts))
+        ids = [[ord(char) for char in text][: self.model_max_length] for text in texts]
+        return {"input_ids": ids, "attention_mask": [[1] * len(row) for row in ids]}
+
+
+def test_cache_tokenizes_only_missing_texts_once():
+    cache = TokenizationCache()
+    tokenizer = _Tokenizer()
+
+    first = cache.encode(tokenizer, ["ab", "cd", "ab"])
+    second = cache.encode(tokenizer, ["cd", "ef"])
+
+    assert tokenizer.calls == [["ab", "cd"], ["ef"]]
+    assert first["input_ids"] == [[97, 98], [99, 100], [97, 98]]
+    assert second["attention_mask"] == [[1, 1], [1, 1]]
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (1, 3, 3)
+
+
+def test_cache_is_keyed_by_tokenizer_and_evicts_least_recently_used():
+    cache = TokenizationCache(max_entries=2)
+    tokenizer, other = _Tokenizer(), _Tokenizer()
+    other.model_max_length = 1
+
+    cache.encode(tokenizer, ["ab", "cd"])
+    cache.encode(tokenizer, ["ab"])
+    assert cache.encode(other, ["ab"])["input_ids"] == [[97]]
+    cache.encode(tokenizer, ["ab", "cd"])
+
+    assert tokenizer_id(tokenizer) != tokenizer_id(other)
+    assert tokenizer.calls == [["ab", "cd"], ["cd"]]
+    assert cache.stats.evictions == 2
+
+
+def test_cache_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        TokenizationCache(max_entries=0)
@@ -0,0 +1,75 @@
+"""
+Throughput and parity of the vectorized VADER engine against NLTK's polarity_scores.
+
+The script scores the same synthetic review sentences with NLTK one text at a time and
+with `VectorizedVader` in batches, reports the throughput of both and exits with status 1
+when any score differs.
+
+Usage:
+    python benchmarks/bench_vader.py --size 20000 --batch-size 512
+"""
+import argparse
+import random
+import sys
+import time
+
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+from sentiment_analyzer_eng.analyzers.vader_engine import VectorizedVader
+
+SUBJECTS = ["The movie", "The service", "This phone", "The hotel", "Our meal", "The update"]
+VERDICTS = [
+    "was good",
+    "was not good",
+    "was VERY good",
+    "was extremely bad",
+    "is hardly worth it",
+    "was never so great",
+    "is okay",
+    "was a total disaster",
+    "isn't terrible",
+    "was kind of boring",
+]
+ENDINGS = ["", ", but the staff was rude", ", and I loved it", " :)", " :(", "!!", "??"]
+
+
+def make_texts(size: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(SUBJECTS)} {rng.choice(VERDICTS)}{rng.choice(ENDINGS)}."
+        for _ in range(size)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    texts = make_texts(args.size, args.seed)
+    vader = SentimentIntensityAnalyzer()
+    engine = VectorizedVader(vader.lexicon, vader.polarity_scores)
+
+    start = time.perf_counter()
+    expected = [vader.polarity_scores(text) for text in texts]
+    nltk_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = []
+    for offset in range(0, len(texts), args.batch_size):
+        results.extend(engine.polarity_scores(texts[offset : offset + args.batch_size]))
+    engine_elapsed = time.perf_counter() - start
+
+    mismatches = sum(result != reference for result, reference in zip(results, expected))
+    print(f"nltk       {len(texts) / nltk_elapsed:9.1f} texts/s")
+    print(
+        f"vectorized {len(texts) / engine_elapsed:9.1f} texts/s"
+        f"  speedup {nltk_elapsed / engine_elapsed:.1f}x  mismatches {mismatches}"
+    )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,18 @@
 __all__ = [
+    "ArticleSentiments",
     "SentimentAnalyzer",
     "SentimentAnalyzerFactory",
+    "SentimentCache",
     "Sentiments",
+    "SqliteSentimentCache",
 ]
 
 
 def __getattr__(name: str):
+    if name == "ArticleSentiments":
+        from sentiment_analyzer_eng.models.sentiments import ArticleSentiments
+
+        return ArticleSentiments
     if name == "SentimentAnalyzer":
         from sentiment_analyzer_eng.analyzers.sentiment_analyzer import SentimentAnalyzer
 
@@ -16,8 +23,16 @@ def __getattr__(name: str):
         )
 
         return SentimentAnalyzerFactory
+    if name == "SentimentCache":
+        from sentiment_analyzer_eng.cache.result_cache import SentimentCache
+
+        return SentimentCache
     if name == "Sentiments":
         from sentiment_analyzer_eng.models.sentiments import Sentiments
 
         return Sentiments
+    if name == "SqliteSentimentCache":
+        from sentiment_analyzer_eng.cache.sqlite_cache import SqliteSentimentCache
+
+        return SqliteSentimentCache
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
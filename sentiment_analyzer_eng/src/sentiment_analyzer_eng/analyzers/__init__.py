@@ -1,3 +1,9 @@
-from sentiment_analyzer_eng.analyzers.sentiment_analyzer import SentimentAnalyzer
-
 __all__ = ["SentimentAnalyzer"]
+
+
+def __getattr__(name: str):
+    if name == "SentimentAnalyzer":
+        from sentiment_analyzer_eng.analyzers.sentiment_analyzer import SentimentAnalyzer
+
+        return SentimentAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,80 @@
+import re
+
+from sentiment_analyzer_eng.models.sentiments import Sentiments
+
+# A run of sentence-final punctuation with its closing quotes or brackets,
+# followed by whitespace, or a line break
+_BOUNDARY = re.compile(r"[.!?]+[\"'”’)\]]*(?=\s)|\n")
+_LAST_WORD = re.compile(r"(\S+)\.$")
+
+# Words whose trailing period does not end a sentence
+_ABBREVIATIONS = frozenset(
+    {
+        "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "vs", "etc",
+        "inc", "ltd", "co", "corp", "no", "fig", "jan", "feb", "mar", "apr",
+        "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec", "e.g", "i.e",
+        "u.s", "u.k",
+    }
+)
+
+
+def _is_abbreviation(text: str) -> bool:
+    match = _LAST_WORD.search(text)
+    if match is None:
+        return False
+    word = match.group(1).lower().lstrip("\"'“‘([")
+    return word in _ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+def split_sentences(text: str) -> list[tuple[int, int]]:
+    """
+    Splits a text into sentences at sentence-final punctuation followed by
+    whitespace and at line breaks, keeping common abbreviations ("Mr.",
+    "U.S.") and initials inside their sentence. Returns the start and end
+    offsets of every non-blank sentence, without surrounding whitespace.
+    """
+    spans: list[tuple[int, int]] = []
+    start = 0
+    for match in _BOUNDARY.finditer(text):
+        end = match.end()
+        if match.group() != "\n" and _is_abbreviation(text[start:end]):
+            continue
+        spans.extend(_strip_span(text, start, end))
+        start = end
+    spans.extend(_strip_span(text, start, len(text)))
+    return spans
+
+
+def _strip_span(text: str, start: int, end: int) -> list[tuple[int, int]]:
+    sentence = text[start:end]
+    stripped = sentence.strip()
+    if not stripped:
+        return []
+    start += len(sentence) - len(sentence.lstrip())
+    return [(start, start + len(stripped))]
+
+
+def aggregate_sentences(
+    sentences: list[str], sentiments: list[Sentiments]
+) -> Sentiments:
+    """
+    Combines the sentence scores of an article into one result: the negative,
+    neutral, positive and compound scores are averaged with the sentences
+    weighted by their word count, so a long sentence counts more than a short
+    one and the compound score does not saturate with the article length as
+    VADER's whole-text score does.
+    """
+    weights = [len(sentence.split()) for sentence in sentences]
+    total = sum(weights)
+    if not total:
+        return Sentiments()
+
+    def mean(scores: list[float]) -> float:
+        return sum(weight * score for weight, score in zip(weights, scores)) / total
+
+    return Sentiments(
+        negative=mean([result.negative for result in sentiments]),
+        neutral=mean([result.neutral for result in sentiments]),
+        positive=mean([result.positive for result in sentiments]),
+        compound=mean([result.compound for result in sentiments]),
+    )
@@ -0,0 +1,148 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+
+class AsyncBatcher:
+    """
+    Coalesces concurrent awaiters on an event loop into shared batches.
+
+    Items are put on a bounded queue, so callers wait for room once `max_queue_size`
+    items are pending (backpressure). A worker task collects up to `max_batch_size`
+    items, waiting at most `max_wait_ms` after the first one, and runs the batch on a
+    dedicated single-thread executor, so inference never blocks the event loop and
+    never competes with other jobs of the loop's default executor.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[Any]], list[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 1024,
+        name: str = "async-batcher",
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_queue_size = max_queue_size
+        self._batch_fn = batch_fn
+        self._queue: asyncio.Queue | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker: asyncio.Task | None = None
+        self._closed = False
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queues an item for the next batch and waits for its result.
+        """
+        if self._closed:
+            raise RuntimeError("Async batcher is closed")
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._bind(loop)
+
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Starts the queue and the worker task on the event loop of the first caller.
+
+        A batcher whose loop was closed (e.g. after `asyncio.run` returned) is rebound
+        to the new loop; using it from two running loops at once is an error.
+        """
+        if self._loop is not None and not self._loop.is_closed():
+            raise RuntimeError("Async batcher is bound to a different event loop")
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = loop.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Stops the worker, fails the pending items and shuts the executor down.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Async batcher is closed"))
+        self._executor.shutdown(wait=False)
+
+    async def _collect(self) -> list[tuple[Any, asyncio.Future]]:
+        """
+        Waits for the first item, then gathers more items until the batch is full
+        or the wait time is over.
+        """
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if self._queue.empty():
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+
+            # Drop the requests whose callers were cancelled meanwhile
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            items = [item for item, _ in batch]
+            try:
+                results = await self._loop.run_in_executor(self._executor, self._batch_fn, items)
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"Batch function returned {len(results)} results for {len(items)} items"
+                    )
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    @property
+    def started(self) -> bool:
+        return self._worker is not None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
@@ -1,26 +1,69 @@
+import asyncio
+import logging
 import threading
-from typing import Iterable
+import time
+from collections.abc import Callable, Iterable, Iterator
 
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
+from sentiment_analyzer_eng.analyzers.articles import aggregate_sentences, split_sentences
+from sentiment_analyzer_eng.analyzers.async_batcher import AsyncBatcher
+from sentiment_analyzer_eng.analyzers.instrumentation import Instrumentation
+from sentiment_analyzer_eng.cache.result_cache import BaseSentimentCache
+from sentiment_analyzer_eng.models.sentiments import (
+    ArticleSentiments,
+    SentenceSentiments,
+    Sentiments,
+)
 
-from sentiment_analyzer_eng.models.sentiments import Sentiments
+logger = logging.getLogger(__name__)
 
 
 class _VaderBackend:
     name = "vader"
 
-    def __init__(self) -> None:
+    def __init__(self, instrumentation: Instrumentation | None = None) -> None:
+        self._instrumentation = instrumentation or Instrumentation()
+        # Imported here, so importing the package does not load NLTK
+        import nltk
+        from nltk.sentiment import SentimentIntensityAnalyzer
+
         try:
             nltk.data.find("sentiment/vader_lexicon.zip")
         except LookupError:
             nltk.download("vader_lexicon", quiet=True)
 
         self._analyzer = SentimentIntensityAnalyzer()
+        # VADER's rules and lexicon ship with NLTK
+        self.model_version = f"nltk-{nltk.__version__}"
+
+        try:
+            from sentiment_analyzer_eng.analyzers.vader_engine import VectorizedVader
+        except ImportError:  # NumPy is optional
+            self._engine = None
+        else:
+            self._engine = VectorizedVader(
+                self._analyzer.lexicon, self._analyzer.polarity_scores
+            )
 
     def analyze_text(self, text: str) -> Sentiments:
         return Sentiments.from_vader(self._analyzer.polarity_scores(text))
 
+    def analyze_batch(self, texts: list[str]) -> list[Sentiments]:
+        instrumentation = self._instrumentation
+        label = self.name if instrumentation.enabled else ""
+        vectorized = self._engine is not None and len(texts) > 1
+        with instrumentation.stage(
+            "score",
+            label,
+            texts=len(texts),
+            engine="numpy" if vectorized else "nltk",
+        ):
+            if vectorized:
+                scores = self._engine.polarity_scores(texts)
+            else:
+                scores = [self._analyzer.polarity_scores(text) for text in texts]
+        with instrumentation.stage("map", label, texts=len(texts)):
+            return [Sentiments.from_vader(item) for item in scores]
+
 
 class SentimentAnalyzer:
     """
@@ -35,6 +78,8 @@ class SentimentAnalyzer:
     _supported_models = {
         "vader": _VaderBackend,
     }
+    # Reports per-stage timings of all analyzers to the callbacks registered on it
+    instrumentation = Instrumentation()
 
     def __new__(cls, model: str = "vader"):
         with cls._lock:
@@ -52,9 +97,19 @@ class SentimentAnalyzer:
                 f"Unsupported model: {model}. Supported models: {supported}"
             )
         self.model = model
-        self._backend = backend_cls()
+        self._backend = backend_cls(self.instrumentation)
+        self._cache: BaseSentimentCache | None = None
+        self._async_batcher: AsyncBatcher | None = None
 
-    def _score_text(self, text: str) -> Sentiments:
+    def set_cache(self, cache: BaseSentimentCache | None) -> None:
+        """
+        Puts an in-memory or persistent result cache in front of `analyze_text`
+        and `analyze_batch`. Results are keyed by the model name and version.
+        Passing None disables caching.
+        """
+        self._cache = cache
+
+    def _normalize_text(self, text: str) -> str:
         if not isinstance(text, str):
             raise TypeError("Text to analyze must be a string")
 
@@ -62,19 +117,231 @@ class SentimentAnalyzer:
         if not normalized_text:
             raise ValueError("Missing text to analyze")
 
-        return self._backend.analyze_text(normalized_text)
+        return normalized_text
+
+    def _normalize_texts(
+        self, texts: Iterable[object], skip_invalid: bool
+    ) -> list[str]:
+        instrumentation = self.instrumentation
+        with instrumentation.stage(
+            "normalize", self.model if instrumentation.enabled else ""
+        ) as stage:
+            normalized_texts: list[str] = []
+            invalid = 0
+            for text in texts:
+                try:
+                    normalized_texts.append(self._normalize_text(text))
+                except (TypeError, ValueError):
+                    if not skip_invalid:
+                        raise
+                    invalid += 1
+            stage.set(texts=len(normalized_texts), invalid=invalid)
+        return normalized_texts
+
+    def _score_texts(self, texts: list[str]) -> list[Sentiments]:
+        if self._cache is None:
+            return self._backend.analyze_batch(texts)
+        model_id = f"{self.model}@{self._backend.model_version}"
+        if not self.instrumentation.enabled:
+            return self._cache.resolve(model_id, texts, self._backend.analyze_batch)
+
+        # The cache stage is the lookup and storage time, without the scoring
+        computed: list[tuple[int, float]] = []
+
+        def timed_analyze_batch(misses: list[str]) -> list[Sentiments]:
+            started = time.perf_counter()
+            try:
+                return self._backend.analyze_batch(misses)
+            finally:
+                computed.append((len(misses), time.perf_counter() - started))
+
+        started = time.perf_counter()
+        results = self._cache.resolve(model_id, texts, timed_analyze_batch)
+        misses, compute_seconds = computed[0] if computed else (0, 0.0)
+        self.instrumentation.record(
+            "cache",
+            self.model,
+            time.perf_counter() - started - compute_seconds,
+            texts=len(texts),
+            hits=len(texts) - misses,
+            misses=misses,
+        )
+        return results
 
     def analyze_text(self, text: str) -> Sentiments:
-        return self._score_text(text)
+        return self._score_texts([self._normalize_text(text)])[0]
 
     def analyze_batch(self, texts: Iterable[str], *, skip_invalid: bool = True) -> list[Sentiments]:
-        results: list[Sentiments] = []
+        normalized_texts = self._normalize_texts(texts, skip_invalid)
+
+        if not normalized_texts:
+            return []
+
+        return self._score_texts(normalized_texts)
+
+    def analyze_article(
+        self, text: str, *, breakdown: bool = False
+    ) -> Sentiments | ArticleSentiments:
+        """
+        Analyzes a long text sentence by sentence instead of as one string.
+
+        The sentences are scored together as one batch, through the vectorized
+        engine when NumPy is installed, and averaged into the document score
+        weighted by their word count (see `aggregate_sentences`). With
+        `breakdown`, returns an `ArticleSentiments` that also holds the score
+        and offsets of every sentence. Results are not cached.
+        """
+        return self._score_articles([self._normalize_text(text)], breakdown)[0]
 
-        for text in texts:
+    def analyze_articles(
+        self,
+        texts: Iterable[str],
+        *,
+        breakdown: bool = False,
+        skip_invalid: bool = True,
+    ) -> list[Sentiments] | list[ArticleSentiments]:
+        """
+        Like `analyze_article` for many articles, with the sentences of all
+        articles scored in one batch.
+        """
+        normalized_texts = self._normalize_texts(texts, skip_invalid)
+
+        return self._score_articles(normalized_texts, breakdown)
+
+    def _score_articles(
+        self, texts: list[str], breakdown: bool
+    ) -> list[Sentiments] | list[ArticleSentiments]:
+        spans = [split_sentences(text) for text in texts]
+        sentences = [
+            text[start:end] for text, article in zip(texts, spans) for start, end in article
+        ]
+        scores = self._backend.analyze_batch(sentences) if sentences else []
+
+        results = []
+        offset = 0
+        for text, article in zip(texts, spans):
+            article_sentences = sentences[offset : offset + len(article)]
+            article_scores = scores[offset : offset + len(article)]
+            offset += len(article)
+
+            document = aggregate_sentences(article_sentences, article_scores)
+            if not breakdown:
+                results.append(document)
+                continue
+            results.append(
+                ArticleSentiments(
+                    sentiments=document,
+                    sentences=[
+                        SentenceSentiments(
+                            text=sentence, start=start, end=end, sentiments=result
+                        )
+                        for sentence, (start, end), result in zip(
+                            article_sentences, article, article_scores
+                        )
+                    ],
+                )
+            )
+        return results
+
+    def analyze_stream(
+        self,
+        texts: Iterable[object],
+        *,
+        chunk_size: int = 256,
+        skip_invalid: bool = True,
+        on_error: Callable[[int, object, Exception], None] | None = None,
+    ) -> Iterator[Sentiments]:
+        """
+        Analyzes any iterable lazily, chunk by chunk, and yields the results as
+        they are produced, so memory is bounded by `chunk_size` rather than by
+        the number of texts.
+
+        With `skip_invalid`, each invalid item is reported to `on_error` with
+        its input index, the item and the error, or logged as a warning when no
+        callback is given.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        return self._stream(texts, chunk_size, skip_invalid, on_error)
+
+    def _stream(
+        self,
+        texts: Iterable[object],
+        chunk_size: int,
+        skip_invalid: bool,
+        on_error: Callable[[int, object, Exception], None] | None,
+    ) -> Iterator[Sentiments]:
+        chunk: list[str] = []
+        for index, text in enumerate(texts):
             try:
-                results.append(self._score_text(text))
-            except (TypeError, ValueError):
+                chunk.append(self._normalize_text(text))
+            except (TypeError, ValueError) as exc:
                 if not skip_invalid:
                     raise
+                if on_error is None:
+                    logger.warning("Skipped invalid text at index %d: %s", index, exc)
+                else:
+                    on_error(index, text, exc)
+                continue
 
-        return results
+            if len(chunk) == chunk_size:
+                yield from self._score_texts(chunk)
+                chunk = []
+
+        if chunk:
+            yield from self._score_texts(chunk)
+
+    def configure_async_batching(
+        self,
+        *,
+        max_batch_size: int = 256,
+        max_wait_ms: float = 2.0,
+        max_queue_size: int = 4096,
+    ) -> None:
+        """
+        Sets how `analyze_text_async` and `analyze_batch_async` coalesce
+        concurrent awaiters into shared batches. At most `max_queue_size` texts
+        wait at a time; further awaiters wait for room (backpressure). Must be
+        called before the first async call, or after `close_async`.
+        """
+        batcher = AsyncBatcher(
+            self._score_texts,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+            name=f"async-batcher-{self.model}",
+        )
+        with self._lock:
+            if self._async_batcher is not None and self._async_batcher.started:
+                raise RuntimeError(
+                    "Async batching is already running; call close_async first"
+                )
+            self._async_batcher = batcher
+
+    async def close_async(self) -> None:
+        with self._lock:
+            batcher, self._async_batcher = self._async_batcher, None
+        if batcher is not None:
+            await batcher.close()
+
+    def _get_async_batcher(self) -> AsyncBatcher:
+        if self._async_batcher is None:
+            self.configure_async_batching()
+        return self._async_batcher
+
+    async def analyze_text_async(self, text: str) -> Sentiments:
+        """
+        Analyzes a text without blocking the event loop. Inference runs on a
+        dedicated executor thread, batched with concurrent awaiters.
+        """
+        return await self._get_async_batcher().submit(self._normalize_text(text))
+
+    async def analyze_batch_async(
+        self, texts: Iterable[str], *, skip_invalid: bool = True
+    ) -> list[Sentiments]:
+        normalized_texts = self._normalize_texts(texts, skip_invalid)
+
+        batcher = self._get_async_batcher()
+        return list(
+            await asyncio.gather(*(batcher.submit(text) for text in normalized_texts))
+        )
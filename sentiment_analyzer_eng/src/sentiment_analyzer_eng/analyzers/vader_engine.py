@@ -0,0 +1,340 @@
+import math
+import string
+from collections.abc import Callable
+
+import numpy as np
+from nltk.sentiment.vader import VaderConstants
+
+_C = VaderConstants
+_PUNCTUATION = frozenset(string.punctuation)
+_PUNC_LIST = frozenset(_C.PUNC_LIST)
+
+# Words whose role in VADER's rules is looked up by id
+_SPECIAL_WORDS = ("least", "at", "very", "but", "kind", "of", "never", "so", "this")
+
+# Adjacent word pairs that start a special-case idiom or a multi-word booster
+# ("kind of", "sort of", ...). Texts containing one are scored by NLTK itself.
+_RARE_BIGRAMS = frozenset(
+    tuple(phrase.split()[:2])
+    for phrase in (*_C.SPECIAL_CASE_IDIOMS, *_C.BOOSTER_DICT)
+    if " " in phrase
+)
+
+# Token ids of the words missing from the vocabulary
+_UNKNOWN = 0
+_UNKNOWN_NEGATED = 1  # contains "n't", which VADER treats as a negation
+
+
+def _strip_punctuation(token: str) -> str:
+    """
+    Removes one leading or trailing run of punctuation the way NLTK's
+    `SentiText` does: only when the run is one of VADER's punctuation marks
+    and the remaining word has no punctuation and at least two characters.
+    """
+    start = 0
+    while start < len(token) and token[start] in _PUNCTUATION:
+        start += 1
+    if start:
+        word = token[start:]
+        if token[:start] in _PUNC_LIST and len(word) > 1 and not _PUNCTUATION.intersection(word):
+            return word
+        return token
+
+    end = len(token)
+    while end > 0 and token[end - 1] in _PUNCTUATION:
+        end -= 1
+    word = token[:end]
+    if token[end:] in _PUNC_LIST and len(word) > 1 and not _PUNCTUATION.intersection(word):
+        return word
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits a text into VADER's words and emoticons, like NLTK's `SentiText`.
+    """
+    return [
+        _strip_punctuation(token) if token[0] in _PUNCTUATION or token[-1] in _PUNCTUATION else token
+        for token in text.split()
+        if len(token) > 1
+    ]
+
+
+class VectorizedVader:
+    """
+    Computes VADER polarity scores for a whole batch of texts with NumPy.
+
+    The lexicon, booster and negation lists are compiled once into a hashed
+    vocabulary and per-id lookup arrays. A batch is tokenized, mapped to ids and
+    scored with array operations over all of its tokens at once: lexicon
+    valences, ALL CAPS emphasis, the three-word booster/dampener and negation
+    window, the "never so/this" and "least" rules, the "but" shift and the
+    punctuation amplification. The results match NLTK's `polarity_scores`.
+
+    Texts with special-case idioms or multi-word boosters, which VADER checks
+    with string comparisons, are delegated to `fallback`.
+    """
+
+    def __init__(
+        self, lexicon: dict[str, float], fallback: Callable[[str], dict]
+    ) -> None:
+        words = list(
+            dict.fromkeys(
+                [
+                    *lexicon,
+                    *(word for word in _C.BOOSTER_DICT if " " not in word),
+                    *_C.NEGATE,
+                    *_SPECIAL_WORDS,
+                    *(word for bigram in _RARE_BIGRAMS for word in bigram),
+                ]
+            )
+        )
+        self._vocabulary = {word: index + 2 for index, word in enumerate(words)}
+        self._fallback = fallback
+
+        size = len(words) + 2
+        self._valence = np.zeros(size)
+        self._in_lexicon = np.zeros(size, dtype=bool)
+        self._booster = np.zeros(size)
+        self._is_booster = np.zeros(size, dtype=bool)
+        self._negated = np.zeros(size, dtype=bool)
+        self._negated[_UNKNOWN_NEGATED] = True
+        for word, index in self._vocabulary.items():
+            if word in lexicon:
+                self._valence[index] = lexicon[word]
+                self._in_lexicon[index] = True
+            if word in _C.BOOSTER_DICT:
+                self._booster[index] = _C.BOOSTER_DICT[word]
+                self._is_booster[index] = True
+            self._negated[index] = word in _C.NEGATE or "n't" in word
+
+        self._ids = {word: self._vocabulary[word] for word in _SPECIAL_WORDS}
+        self._rare_bigrams = np.array(
+            sorted(self._vocabulary[a] * size + self._vocabulary[b] for a, b in _RARE_BIGRAMS)
+        )
+        self._size = size
+
+    def polarity_scores(self, texts: list[str]) -> list[dict]:
+        """
+        Scores a batch of texts. Returns one dict per text with the same keys
+        and values as NLTK's `SentimentIntensityAnalyzer.polarity_scores`.
+        """
+        tokenized = [tokenize(text) for text in texts]
+        lengths = np.fromiter((len(tokens) for tokens in tokenized), dtype=np.int64, count=len(texts))
+        tokens = [token for text_tokens in tokenized for token in text_tokens]
+        if not tokens:
+            return [self._score(text, 0, 0.0, 0.0, 0.0, 0.0) for text in texts]
+
+        lookup = self._vocabulary.get
+        token_ids = np.fromiter(
+            (
+                lookup(word) or (_UNKNOWN_NEGATED if "n't" in word else _UNKNOWN)
+                for word in map(str.lower, tokens)
+            ),
+            dtype=np.int64,
+            count=len(tokens),
+        )
+        upper = np.fromiter(map(str.isupper, tokens), dtype=bool, count=len(tokens))
+
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        text_index = np.repeat(np.arange(len(texts)), lengths)
+        position = np.arange(len(tokens)) - starts[text_index]
+        last = position == lengths[text_index] - 1
+
+        # VADER scores a repeated token with the context of its first occurrence
+        first = np.arange(len(tokens))
+        for index, text_tokens in enumerate(tokenized):
+            if len(set(text_tokens)) < len(text_tokens):
+                seen: dict[str, int] = {}
+                offset = int(starts[index])
+                for local, token in enumerate(text_tokens):
+                    first[offset + local] = offset + seen.setdefault(token, local)
+
+        uppercase_count = np.bincount(text_index, weights=upper, minlength=len(texts))
+        cap_diff = ((lengths - uppercase_count) > 0) & ((lengths - uppercase_count) < lengths)
+
+        # Rare constructs are scored by NLTK, see the class docstring
+        pairs = token_ids[:-1] * self._size + token_ids[1:]
+        rare = np.isin(pairs, self._rare_bigrams) & ~last[:-1]
+        fallback = np.zeros(len(texts), dtype=bool)
+        fallback[text_index[:-1][rare]] = True
+
+        valence = self._valences(tokens, token_ids, upper, position, last, cap_diff[text_index])
+        valence = valence[first]
+
+        # "but" dampens the words before it and emphasizes the words after it
+        is_but = token_ids == self._ids["but"]
+        but_position = np.full(len(texts), -1)
+        for index in np.flatnonzero(is_but)[::-1]:
+            but_position[text_index[index]] = position[index]
+        text_but = but_position[text_index]
+        has_but = text_but >= 0
+        valence = np.where(has_but & (position < text_but), valence * 0.5, valence)
+        valence = np.where(has_but & (position > text_but), valence * 1.5, valence)
+
+        # Summed in token order, like NLTK's sequential loop
+        positive = np.bincount(
+            text_index, weights=np.where(valence > 0, valence + 1, 0.0), minlength=len(texts)
+        )
+        negative = np.bincount(
+            text_index, weights=np.where(valence < 0, valence - 1, 0.0), minlength=len(texts)
+        )
+        neutral = np.bincount(text_index, weights=valence == 0, minlength=len(texts))
+
+        values = valence.tolist()
+        results = []
+        for index, text in enumerate(texts):
+            if fallback[index]:
+                results.append(self._fallback(text))
+                continue
+            start = int(starts[index])
+            length = int(lengths[index])
+            # Python's own sum keeps the total identical to NLTK's
+            total = float(sum(values[start : start + length]))
+            results.append(
+                self._score(
+                    text,
+                    length,
+                    total,
+                    float(positive[index]),
+                    float(negative[index]),
+                    float(neutral[index]),
+                )
+            )
+        return results
+
+    def _valences(
+        self,
+        tokens: list[str],
+        token_ids: np.ndarray,
+        upper: np.ndarray,
+        position: np.ndarray,
+        last: np.ndarray,
+        cap_diff: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Returns the valence of every token from its lexicon value and the
+        booster, negation, "never" and "least" rules of its preceding words.
+        """
+        in_lexicon = self._in_lexicon[token_ids]
+        valence = np.where(in_lexicon, self._valence[token_ids], 0.0)
+        emphasized = in_lexicon & upper & cap_diff
+        valence = np.where(
+            emphasized,
+            np.where(valence > 0, valence + _C.C_INCR, valence - _C.C_INCR),
+            valence,
+        )
+
+        ids = self._ids
+        count = len(tokens)
+        indices = np.arange(count)
+
+        def previous(distance: int) -> np.ndarray:
+            return np.maximum(indices - distance, 0)
+
+        # Exact-case "never" and "so"/"this", as VADER compares them
+        never = np.zeros(count, dtype=bool)
+        so_this = np.zeros(count, dtype=bool)
+        for index in np.flatnonzero(np.isin(token_ids, (ids["never"], ids["so"], ids["this"]))):
+            token = tokens[index]
+            never[index] = token == "never"
+            so_this[index] = token in ("so", "this")
+
+        for distance, damping in ((1, 1.0), (2, 0.95), (3, 0.9)):
+            before = previous(distance)
+            before_ids = token_ids[before]
+            applies = in_lexicon & (position >= distance) & ~self._in_lexicon[before_ids]
+
+            scalar = self._booster[before_ids]
+            scalar = np.where(valence < 0, -scalar, scalar)
+            booster_caps = self._is_booster[before_ids] & upper[before] & cap_diff
+            scalar = np.where(
+                booster_caps,
+                np.where(valence > 0, scalar + _C.C_INCR, scalar - _C.C_INCR),
+                scalar,
+            )
+            if damping != 1.0:
+                scalar = scalar * damping
+            valence = np.where(applies, valence + scalar, valence)
+
+            negated = applies & self._negated[before_ids]
+            if distance == 1:
+                valence = np.where(negated, valence * _C.N_SCALAR, valence)
+            elif distance == 2:
+                never_so = applies & never[before] & so_this[previous(1)]
+                valence = np.where(
+                    never_so,
+                    valence * 1.5,
+                    np.where(negated, valence * _C.N_SCALAR, valence),
+                )
+            else:
+                never_so = applies & (
+                    (never[before] & so_this[previous(2)]) | so_this[previous(1)]
+                )
+                valence = np.where(
+                    never_so,
+                    valence * 1.25,
+                    np.where(negated, valence * _C.N_SCALAR, valence),
+                )
+
+        # "least" negates the next word unless preceded by "at" or "very"
+        one_before = token_ids[previous(1)]
+        two_before = token_ids[previous(2)]
+        after_least = (
+            in_lexicon
+            & (position >= 1)
+            & ~self._in_lexicon[one_before]
+            & (one_before == ids["least"])
+        )
+        negated_least = after_least & (
+            (position == 1) | ((two_before != ids["at"]) & (two_before != ids["very"]))
+        )
+        valence = np.where(negated_least, valence * _C.N_SCALAR, valence)
+
+        # Boosters and "kind" in "kind of" carry no valence themselves
+        next_ids = token_ids[np.minimum(indices + 1, count - 1)]
+        silent = self._is_booster[token_ids] | (
+            (token_ids == ids["kind"]) & (next_ids == ids["of"]) & ~last
+        )
+        return np.where(silent, 0.0, valence)
+
+    @staticmethod
+    def _score(
+        text: str,
+        length: int,
+        total: float,
+        positive: float,
+        negative: float,
+        neutral: float,
+    ) -> dict:
+        # The same arithmetic as NLTK's `score_valence`
+        if length:
+            exclamations = min(text.count("!"), 4)
+            questions = text.count("?")
+            amplifier = exclamations * 0.292
+            if questions > 1:
+                amplifier += questions * 0.18 if questions <= 3 else 0.96
+            if total > 0:
+                total += amplifier
+            elif total < 0:
+                total -= amplifier
+
+            compound = total / math.sqrt((total * total) + 15)
+            if positive > math.fabs(negative):
+                positive += amplifier
+            elif positive < math.fabs(negative):
+                negative -= amplifier
+
+            denominator = positive + math.fabs(negative) + neutral
+            pos = math.fabs(positive / denominator)
+            neg = math.fabs(negative / denominator)
+            neu = math.fabs(neutral / denominator)
+        else:
+            compound = pos = neg = neu = 0.0
+
+        return {
+            "neg": round(neg, 3),
+            "neu": round(neu, 3),
+            "pos": round(pos, 3),
+            "compound": round(compound, 4),
+        }
@@ -0,0 +1,177 @@
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections.abc import Iterable
+
+from sentiment_analyzer_eng.cache.result_cache import BaseSentimentCache, CacheStats
+from sentiment_analyzer_eng.models.sentiments import Sentiments
+
+_FLOAT_FIELDS = ("negative", "neutral", "positive", "compound", "sentiment_value")
+_LABEL_FIELDS = ("compound_label", "sentiment_label")
+_LABELS = ("", "negative", "neutral", "positive")
+_LABEL_CODES = {label: code for code, label in enumerate(_LABELS)}
+
+# One record: the float fields as doubles followed by one byte per label
+_RECORD = struct.Struct(f"<{len(_FLOAT_FIELDS)}d{len(_LABEL_FIELDS)}B")
+
+# SQLite's default limit on the number of host parameters in one statement
+_MAX_PARAMETERS = 999
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sentiments (
+    key BLOB PRIMARY KEY,
+    created_at REAL NOT NULL,
+    payload BLOB NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def encode_sentiments(sentiments: Sentiments) -> bytes:
+    """
+    Serializes `Sentiments` into a fixed-size binary record.
+    """
+    return _RECORD.pack(
+        *(getattr(sentiments, name) for name in _FLOAT_FIELDS),
+        *(_LABEL_CODES[getattr(sentiments, name)] for name in _LABEL_FIELDS),
+    )
+
+
+def decode_sentiments(payload: bytes) -> Sentiments:
+    """
+    Restores `Sentiments` from a record written by `encode_sentiments`.
+
+    The stored values are already derived, so `__post_init__` is not run again.
+    """
+    values = _RECORD.unpack(payload)
+    sentiments = Sentiments.__new__(Sentiments)
+    for name, value in zip(_FLOAT_FIELDS, values):
+        setattr(sentiments, name, value)
+    for name, code in zip(_LABEL_FIELDS, values[len(_FLOAT_FIELDS) :]):
+        setattr(sentiments, name, _LABELS[code])
+    return sentiments
+
+
+class SqliteSentimentCache(BaseSentimentCache):
+    """
+    A persistent analyzer result cache stored in an SQLite database.
+
+    The database runs in WAL mode, so several worker processes on one host can read
+    it concurrently while one of them writes. Results survive restarts; include the
+    model version in the model id (the analyzers do) so a new model does not reuse
+    the results of the old one.
+    """
+
+    def __init__(self, path: str, ttl: float | None = None, timeout: float = 30.0) -> None:
+        """
+        Args:
+            path (str): The path of the database file. Created if it does not exist.
+            ttl (float, optional): The number of seconds a result stays valid. None means no expiry.
+            timeout (float): The number of seconds to wait for a lock held by another process.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.path = path
+        self.ttl = ttl
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        with self._connection() as connection:
+            connection.execute(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns the connection of the current thread.
+
+        SQLite connections must not be shared between threads or inherited over a fork,
+        so every thread of every process opens its own.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get_many(self, keys: list[str]) -> list[Sentiments | None]:
+        connection = self._connection()
+        min_created_at = time.time() - self.ttl if self.ttl is not None else None
+
+        found = {}
+        unique_keys = list(dict.fromkeys(bytes.fromhex(key) for key in keys))
+        for start in range(0, len(unique_keys), _MAX_PARAMETERS):
+            chunk = unique_keys[start : start + _MAX_PARAMETERS]
+            rows = connection.execute(
+                "SELECT key, created_at, payload FROM sentiments "
+                f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for key, created_at, payload in rows:
+                if min_created_at is None or created_at >= min_created_at:
+                    found[key] = payload
+
+        results: list[Sentiments | None] = []
+        for key in keys:
+            payload = found.get(bytes.fromhex(key))
+            results.append(decode_sentiments(payload) if payload is not None else None)
+
+        hits = sum(result is not None for result in results)
+        with self._lock:
+            self._hits += hits
+            self._misses += len(results) - hits
+        return results
+
+    def set_many(self, items: Iterable[tuple[str, Sentiments]]) -> None:
+        now = time.time()
+        rows = [
+            (bytes.fromhex(key), now, encode_sentiments(value)) for key, value in items
+        ]
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO sentiments (key, created_at, payload) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def prune(self) -> int:
+        """
+        Deletes the expired results.
+
+        Returns:
+            int: The number of deleted results.
+        """
+        if self.ttl is None:
+            return 0
+        with self._connection() as connection:
+            cursor = connection.execute(
+                "DELETE FROM sentiments WHERE created_at < ?", (time.time() - self.ttl,)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._connection() as connection:
+            connection.execute("DELETE FROM sentiments")
+
+    def close(self) -> None:
+        """
+        Closes the connection of the current thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        return CacheStats(hits=hits, misses=misses, size=len(self))
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM sentiments").fetchone()[0]
@@ -44,3 +44,28 @@ class Sentiments:
 
     def asdict(self) -> dict:
         return asdict(self)
+
+
+@dataclass(slots=True)
+class SentenceSentiments:
+    text: str
+    start: int
+    end: int
+    sentiments: Sentiments
+
+    def asdict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class ArticleSentiments:
+    """
+    The result of `analyze_article` with `breakdown=True`: the document-level
+    scores and the scores of every sentence with its offsets in the article.
+    """
+
+    sentiments: Sentiments
+    sentences: list[SentenceSentiments] = field(default_factory=list)
+
+    def asdict(self) -> dict:
+        return asdict(self)
@@ -0,0 +1,42 @@
+import pytest
+
+from sentiment_analyzer_eng import SentimentAnalyzer
+
+
+def test_stream_consumes_lazily_and_matches_batch():
+    analyzer = SentimentAnalyzer()
+    consumed = []
+
+    def texts():
+        for number in range(7):
+            consumed.append(number)
+            yield f"Great results number {number}!" if number % 2 else f"Terrible loss {number}."
+
+    stream = analyzer.analyze_stream(texts(), chunk_size=3)
+    first = next(stream)
+
+    assert consumed == [0, 1, 2]
+    assert [first, *stream] == analyzer.analyze_batch(
+        [f"Great results number {n}!" if n % 2 else f"Terrible loss {n}." for n in range(7)]
+    )
+
+
+def test_stream_reports_skipped_items():
+    errors = []
+
+    results = list(
+        SentimentAnalyzer().analyze_stream(
+            ["Good news.", "  ", None, "Bad news."],
+            on_error=lambda index, item, exc: errors.append((index, item, type(exc))),
+        )
+    )
+
+    assert len(results) == 2
+    assert errors == [(1, "  ", ValueError), (2, None, TypeError)]
+
+
+def test_stream_raises_on_invalid_items_without_skip_invalid():
+    stream = SentimentAnalyzer().analyze_stream(["Good news.", ""], skip_invalid=False)
+
+    with pytest.raises(ValueError, match="Missing text"):
+        list(stream)
@@ -0,0 +1,51 @@
+import pytest
+
+from sentiment_analyzer_eng import ArticleSentiments, SentimentAnalyzer
+from sentiment_analyzer_eng.analyzers.articles import split_sentences
+
+ARTICLE = (
+    "Mr. Smith said the U.S. economy is great! Growth was 3.5 percent.\n\n"
+    "Analysts called the outlook terrible. Really?"
+)
+
+
+def test_split_sentences_keeps_abbreviations_and_numbers():
+    spans = split_sentences(ARTICLE)
+
+    assert [ARTICLE[start:end] for start, end in spans] == [
+        "Mr. Smith said the U.S. economy is great!",
+        "Growth was 3.5 percent.",
+        "Analysts called the outlook terrible.",
+        "Really?",
+    ]
+    assert split_sentences("  \n ") == []
+
+
+def test_article_is_the_word_weighted_mean_of_its_sentences():
+    analyzer = SentimentAnalyzer()
+
+    result = analyzer.analyze_article(ARTICLE, breakdown=True)
+
+    assert isinstance(result, ArticleSentiments)
+    assert [sentence.sentiments for sentence in result.sentences] == [
+        analyzer.analyze_text(sentence.text) for sentence in result.sentences
+    ]
+    assert result.sentences[2].start == ARTICLE.index("Analysts")
+    weights = [len(sentence.text.split()) for sentence in result.sentences]
+    compound = sum(
+        weight * sentence.sentiments.compound
+        for weight, sentence in zip(weights, result.sentences)
+    ) / sum(weights)
+    assert result.sentiments.compound == pytest.approx(compound, abs=1e-4)
+    assert analyzer.analyze_article(ARTICLE) == result.sentiments
+
+
+def test_articles_are_scored_together_in_input_order():
+    analyzer = SentimentAnalyzer()
+    articles = [ARTICLE, "What a wonderful day. Nothing went wrong.", "..."]
+
+    assert analyzer.analyze_articles([articles[0], " ", *articles[1:]]) == [
+        analyzer.analyze_article(article) for article in articles
+    ]
+    with pytest.raises(ValueError):
+        analyzer.analyze_articles([" "], skip_invalid=False)
@@ -0,0 +1,26 @@
+import asyncio
+
+from sentiment_analyzer_eng import SentimentAnalyzer
+
+
+def test_async_api_matches_sync_results():
+    analyzer = SentimentAnalyzer()
+    texts = ["Great results!", "Terrible losses.", "  ", "Flat quarter."]
+
+    async def main():
+        try:
+            single = await analyzer.analyze_text_async("Great results!")
+            batch = await analyzer.analyze_batch_async(texts)
+            concurrent = await asyncio.gather(
+                *(analyzer.analyze_text_async(text) for text in texts if text.strip())
+            )
+            return single, batch, concurrent
+        finally:
+            await analyzer.close_async()
+
+    single, batch, concurrent = asyncio.run(main())
+
+    expected = analyzer.analyze_batch(texts)
+    assert single == expected[0]
+    assert batch == expected
+    assert list(concurrent) == expected
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Generous, so slow CI machines pass; NLTK alone takes a good part of it
+BUDGET_SECONDS = 1.0
+
+
+def import_times(statement: str) -> dict[str, float]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "sentiment_analyzer_eng",
+        "sentiment_analyzer_eng.analyzers",
+        "sentiment_analyzer_eng.analyzers.sentiment_analyzer",
+        "sentiment_analyzer_eng.factory.sentiment_factory",
+    ],
+)
+def test_importing_does_not_load_nltk(module: str) -> None:
+    times = import_times(f"import {module}")
+
+    assert module in times
+    assert "nltk" not in times
+    assert times[module] < BUDGET_SECONDS
+
+
+def test_analyzer_loads_nltk_on_first_use() -> None:
+    times = import_times(
+        "from sentiment_analyzer_eng import SentimentAnalyzer\n"
+        "SentimentAnalyzer().analyze_text('Good.')"
+    )
+
+    assert "nltk" in times
@@ -0,0 +1,41 @@
+import pytest
+
+from sentiment_analyzer_eng import SentimentAnalyzer, SentimentCache
+from sentiment_analyzer_eng.analyzers.instrumentation import StageMetrics
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = SentimentAnalyzer()
+    metrics = StageMetrics()
+    analyzer.instrumentation.add_callback(metrics)
+    analyzer.metrics = metrics
+    yield analyzer
+    analyzer.instrumentation.remove_callback(metrics)
+    analyzer.set_cache(None)
+
+
+def test_stages_are_reported(analyzer):
+    analyzer.analyze_batch(["Good.", "", None, "Bad!"])
+    analyzer.set_cache(SentimentCache())
+    analyzer.analyze_batch(["Good.", "Good.", "Fine."])
+    analyzer.analyze_text("Good.")
+
+    snapshot = analyzer.metrics.snapshot()
+    assert snapshot[("vader", "normalize")]["invalid"] == 2
+    assert snapshot[("vader", "score")]["texts"] == 4
+    assert snapshot[("vader", "map")]["count"] == 2
+    assert snapshot[("vader", "cache")]["hits"] == 2
+    assert snapshot[("vader", "cache")]["misses"] == 2
+
+
+def test_disabled_instrumentation_reports_nothing():
+    metrics = StageMetrics()
+    analyzer = SentimentAnalyzer()
+    analyzer.instrumentation.add_callback(metrics)
+    analyzer.instrumentation.remove_callback(metrics)
+
+    analyzer.analyze_batch(["Good.", "Bad!"])
+
+    assert not analyzer.instrumentation.enabled
+    assert metrics.snapshot() == {}
@@ -0,0 +1,39 @@
+from sentiment_analyzer_eng import SentimentAnalyzer, SentimentCache
+
+
+def test_analyzer_serves_repeated_texts_from_cache():
+    analyzer = SentimentAnalyzer()
+    cache = SentimentCache(max_size=10)
+    analyzer.set_cache(cache)
+    try:
+        first = analyzer.analyze_batch(["Great results!", "Terrible losses.", "Great results!"])
+        second = analyzer.analyze_text("  Great results! ")
+    finally:
+        analyzer.set_cache(None)
+
+    assert first[0] is first[2]
+    assert second is first[0]
+    assert first[1].sentiment_label == "negative"
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 3
+    assert len(cache) == 2
+
+
+def test_persistent_cache_is_shared_by_reopened_instances(tmp_path):
+    from sentiment_analyzer_eng import SqliteSentimentCache
+
+    analyzer = SentimentAnalyzer()
+    path = str(tmp_path / "sentiments.db")
+    try:
+        analyzer.set_cache(SqliteSentimentCache(path))
+        first = analyzer.analyze_batch(["Great results!", "Terrible losses."])
+
+        reopened = SqliteSentimentCache(path)
+        analyzer.set_cache(reopened)
+        second = analyzer.analyze_batch(["Great results!", "Terrible losses."])
+    finally:
+        analyzer.set_cache(None)
+
+    assert second == first
+    assert reopened.stats.hits == 2
+    assert reopened.stats.misses == 0
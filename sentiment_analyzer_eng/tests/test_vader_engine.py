@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+from sentiment_analyzer_eng import SentimentAnalyzer
+from sentiment_analyzer_eng.analyzers.vader_engine import VectorizedVader, tokenize
+
+CASES = [
+    "",
+    "   ",
+    "Good.",
+    "The movie was good.",
+    "The movie was not good.",
+    "The movie was VERY good!!",
+    "The movie was GOOD, the ending was BAD.",
+    "ALL CAPS EVERYWHERE IS GREAT",
+    "It isn't bad at all, but the sequel is terrible.",
+    "It was extremely bad but kind of fun.",
+    "At least it was not the worst.",
+    "Least happy day of the year.",
+    "Very least good thing.",
+    "I have never been so happy.",
+    "Never this sad, never so sad.",
+    "Good good good bad bad good.",
+    "Not good. Not good. Not good.",
+    "Barely acceptable, hardly good, somewhat nice.",
+    "The food was the bomb, yeah right.",
+    "She is a badass, but the show is sort of boring.",
+    "Is it good?? Is it bad???",
+    "Wow!!!!! Amazing!!!!!",
+    ":) great day :( bad night",
+    "...good... ,bad, 'nice' (terrible)",
+    "Don't like it. Can't stand it. Won't buy it.",
+    "The deal is no longer good, but not bad either",
+]
+
+
+@pytest.fixture(scope="module")
+def vader():
+    return SentimentIntensityAnalyzer()
+
+
+@pytest.fixture(scope="module")
+def engine(vader):
+    return VectorizedVader(vader.lexicon, vader.polarity_scores)
+
+
+def random_texts(vader, size, seed):
+    rng = random.Random(seed)
+    lexicon = sorted(vader.lexicon)
+    words = [
+        *rng.sample(lexicon, 300),
+        "not", "never", "isn't", "very", "extremely", "barely", "least", "at",
+        "but", "BUT", "so", "this", "kind", "of", "sort", "the", "movie", "was",
+    ]
+    punctuation = ["", "", "", "!", "?", ".", ",", "!!", "??"]
+    texts = []
+    for _ in range(size):
+        tokens = []
+        for _ in range(rng.randint(0, 14)):
+            word = rng.choice(words)
+            if rng.random() < 0.15:
+                word = word.upper()
+            tokens.append(word + rng.choice(punctuation))
+        texts.append(" ".join(tokens))
+    return texts
+
+
+def test_tokenize_matches_nltk_sentitext(vader):
+    from nltk.sentiment.vader import SentiText
+
+    for text in CASES:
+        expected = SentiText(text, vader.constants.PUNC_LIST, vader.constants.REGEX_REMOVE_PUNCTUATION)
+        assert tokenize(text) == expected.words_and_emoticons
+
+
+def test_curated_cases_match_nltk(vader, engine):
+    assert engine.polarity_scores(CASES) == [vader.polarity_scores(text) for text in CASES]
+
+
+def test_random_corpus_matches_nltk(vader, engine):
+    texts = random_texts(vader, 2000, seed=11)
+
+    assert engine.polarity_scores(texts) == [vader.polarity_scores(text) for text in texts]
+
+
+def test_single_text_batches_match_nltk(vader, engine):
+    for text in CASES:
+        assert engine.polarity_scores([text]) == [vader.polarity_scores(text)]
+
+
+def test_idioms_are_delegated_to_the_fallback(vader):
+    delegated = []
+
+    def fallback(text):
+        delegated.append(text)
+        return vader.polarity_scores(text)
+
+    engine = VectorizedVader(vader.lexicon, fallback)
+    engine.polarity_scores(["The party was the bomb.", "A plain good day.", "It was kind of good."])
+
+    assert delegated == ["The party was the bomb.", "It was kind of good."]
+
+
+def test_analyzer_batches_match_single_texts():
+    analyzer = SentimentAnalyzer()
+
+    assert analyzer.analyze_batch(CASES[2:]) == [analyzer.analyze_text(text) for text in CASES[2:]]
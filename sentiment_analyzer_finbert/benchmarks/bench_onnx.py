@@ -0,0 +1,100 @@
+"""
+Accuracy drift and throughput of the ONNX Runtime backends against the torch backend.
+
+For every backend the script scores the same synthetic financial headlines and reports
+the throughput, the largest absolute difference of the class probabilities from the
+torch backend and the share of texts whose label differs. It exits with status 1 when
+the drift of a backend exceeds its tolerance.
+
+Usage:
+    python benchmarks/bench_onnx.py --size 512
+"""
+import argparse
+import random
+import sys
+import time
+
+from sentiment_analyzer_finbert import SentimentAnalyzer
+
+# The largest tolerated absolute probability difference from the torch backend
+TOLERANCES = {
+    "onnx": 1e-3,
+    "onnx-int8": 0.1,
+}
+
+SUBJECTS = ["The company", "The bank", "Management", "The retailer", "The group"]
+EVENTS = [
+    "raised its full-year guidance",
+    "reported a quarterly loss",
+    "cut its dividend",
+    "beat analyst expectations",
+    "announced layoffs",
+    "reiterated its outlook",
+    "completed the acquisition",
+    "warned of lower margins",
+]
+DETAILS = ["", " after strong demand", " amid rising costs", " despite weak sales", " in Europe"]
+
+
+def make_headlines(size: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(SUBJECTS)} {rng.choice(EVENTS)}{rng.choice(DETAILS)}."
+        for _ in range(size)
+    ]
+
+
+def top_label(result) -> str:
+    return max(("negative", "neutral", "positive"), key=lambda name: getattr(result, name))
+
+
+def score(analyzer: SentimentAnalyzer, texts: list[str], batch_size: int):
+    start = time.perf_counter()
+    results = []
+    for offset in range(0, len(texts), batch_size):
+        results.extend(analyzer.analyze_batch(texts[offset : offset + batch_size]))
+    return results, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-id", default=None)
+    parser.add_argument("--size", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    texts = make_headlines(args.size, args.seed)
+    failed = False
+    reference = None
+
+    for backend in ("torch", "onnx", "onnx-int8"):
+        analyzer = SentimentAnalyzer(model_id=args.model_id, backend=backend)
+        # Warm-up, so the measured run does not pay for lazy initialization
+        analyzer.analyze_batch(texts[: args.batch_size])
+        results, elapsed = score(analyzer, texts, args.batch_size)
+        line = f"{backend:<10} {len(texts) / elapsed:9.1f} texts/s"
+
+        if reference is None:
+            reference = results
+        else:
+            drift = max(
+                abs(getattr(result, name) - getattr(expected, name))
+                for result, expected in zip(results, reference)
+                for name in ("negative", "neutral", "positive")
+            )
+            flipped = sum(
+                top_label(result) != top_label(expected)
+                for result, expected in zip(results, reference)
+            )
+            line += f"  max drift {drift:.5f}  label changes {flipped / len(texts):.2%}"
+            if drift > TOLERANCES[backend]:
+                line += f"  (exceeds {TOLERANCES[backend]})"
+                failed = True
+        print(line)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
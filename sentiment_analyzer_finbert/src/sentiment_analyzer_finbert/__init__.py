@@ -1,18 +1,33 @@
 __all__ = [
+    "analyze_corpus",
     "SentimentAnalyzer",
+    "SentimentCache",
     "Sentiments",
+    "SqliteSentimentCache",
 ]
 
 
 def __getattr__(name: str):
+    if name == "analyze_corpus":
+        from sentiment_analyzer_finbert.analyzers.corpus import analyze_corpus
+
+        return analyze_corpus
     if name == "SentimentAnalyzer":
         from sentiment_analyzer_finbert.analyzers.sentiment_analyzer import (
             SentimentAnalyzer,
         )
 
         return SentimentAnalyzer
+    if name == "SentimentCache":
+        from sentiment_analyzer_finbert.cache.result_cache import SentimentCache
+
+        return SentimentCache
     if name == "Sentiments":
         from sentiment_analyzer_finbert.models.sentiments import Sentiments
 
         return Sentiments
+    if name == "SqliteSentimentCache":
+        from sentiment_analyzer_finbert.cache.sqlite_cache import SqliteSentimentCache
+
+        return SqliteSentimentCache
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
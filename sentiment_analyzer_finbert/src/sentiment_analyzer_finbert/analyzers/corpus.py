@@ -0,0 +1,135 @@
+import logging
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
+
+from sentiment_analyzer_finbert.analyzers.sentiment_analyzer import SentimentAnalyzer
+from sentiment_analyzer_finbert.models.sentiments import Sentiments
+
+logger = logging.getLogger(__name__)
+
+# The analyzer of the current worker process, loaded once by `_init_worker`
+_worker_analyzer = None
+
+
+def _init_worker(
+    model: str, model_id: str | None, backend: str, num_threads: int
+) -> None:
+    global _worker_analyzer
+
+    try:
+        import torch
+    except ImportError:
+        pass
+    else:
+        torch.set_num_threads(num_threads)
+
+    _worker_analyzer = SentimentAnalyzer(model=model, model_id=model_id, backend=backend)
+
+
+def _analyze_chunk(texts: list[str]) -> list[Sentiments]:
+    # The texts were validated when read, so every text gets its result
+    return _worker_analyzer.analyze_batch(texts, skip_invalid=False)
+
+
+def _valid_texts(
+    texts: Iterable[object],
+    skip_invalid: bool,
+    on_error: Callable[[int, object, Exception], None] | None,
+) -> Iterator[str]:
+    for index, text in enumerate(texts):
+        try:
+            yield SentimentAnalyzer._normalize_text(text)
+        except (TypeError, ValueError) as exc:
+            if not skip_invalid:
+                raise
+            if on_error is None:
+                logger.warning("Skipped invalid text at index %d: %s", index, exc)
+            else:
+                on_error(index, text, exc)
+
+
+def _chunks(texts: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    iterator = iter(texts)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def analyze_corpus(
+    texts: Iterable[str],
+    *,
+    workers: int | None = None,
+    model: str = "finbert",
+    model_id: str | None = None,
+    backend: str = "torch",
+    chunk_size: int = 256,
+    threads_per_worker: int | None = None,
+    skip_invalid: bool = True,
+    on_error: Callable[[int, object, Exception], None] | None = None,
+) -> Iterator[Sentiments]:
+    """
+    Analyzes a large corpus on a pool of worker processes, for offline backfills.
+
+    Every worker loads the model once and pins torch to `threads_per_worker`
+    threads (default: the CPUs divided by the workers). Texts are read lazily in
+    chunks and at most two chunks per worker are in flight, so memory stays
+    bounded; results are yielded in input order. Workers are started with
+    "spawn", so calling scripts need an `if __name__ == "__main__":` guard.
+
+    Invalid texts are dropped before they reach the workers. With `skip_invalid`,
+    each one is reported to `on_error` with its input index, the item and the
+    error, or logged as a warning when no callback is given, so results can be
+    mapped back to their inputs. An invalid `chunk_size` raises when called,
+    before any worker is started.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    cpu_count = os.cpu_count() or 1
+    workers = workers or cpu_count
+    threads_per_worker = threads_per_worker or max(1, cpu_count // workers)
+    return _analyze_corpus(
+        texts,
+        workers,
+        model,
+        model_id,
+        backend,
+        chunk_size,
+        threads_per_worker,
+        skip_invalid,
+        on_error,
+    )
+
+
+def _analyze_corpus(
+    texts: Iterable[str],
+    workers: int,
+    model: str,
+    model_id: str | None,
+    backend: str,
+    chunk_size: int,
+    threads_per_worker: int,
+    skip_invalid: bool,
+    on_error: Callable[[int, object, Exception], None] | None,
+) -> Iterator[Sentiments]:
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(model, model_id, backend, threads_per_worker),
+    )
+    pending: deque = deque()
+    try:
+        valid_texts = _valid_texts(texts, skip_invalid, on_error)
+        for chunk in _chunks(valid_texts, chunk_size):
+            pending.append(executor.submit(_analyze_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # Also reached when the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,88 @@
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+# The ways `aggregate_windows` combines the windows of a document
+AGGREGATIONS = ("mean", "max")
+
+
+def split_windows(
+    tokenizer: Any, texts: list[str], window: int, stride: int
+) -> tuple[dict[str, list[list[int]]], np.ndarray, np.ndarray]:
+    """
+    Splits every text into overlapping windows of at most `window` tokens,
+    special tokens included, with `stride` tokens shared by consecutive windows.
+    Returns the unpadded encodings of all windows, the token count of every
+    window and the index of the text every window belongs to.
+    """
+    encodings = dict(
+        tokenizer(
+            texts,
+            truncation=True,
+            max_length=window,
+            stride=stride,
+            return_overflowing_tokens=True,
+        )
+    )
+    documents = np.asarray(encodings.pop("overflow_to_sample_mapping"))
+    lengths = np.array([len(input_ids) for input_ids in encodings["input_ids"]])
+    return encodings, lengths, documents
+
+
+def window_batches(
+    tokenizer: Any,
+    encodings: dict[str, list[list[int]]],
+    lengths: np.ndarray,
+    batch_size: int,
+    return_tensors: str,
+) -> Iterator[tuple[np.ndarray, Any]]:
+    """
+    Yields the windows sorted by length in padded batches of `batch_size`,
+    with the window indices of every batch, so short windows are not padded
+    to the longest one.
+    """
+    order = np.argsort(lengths, kind="stable")
+    for start in range(0, len(order), batch_size):
+        indices = order[start : start + batch_size]
+        batch = {
+            name: [values[index] for index in indices]
+            for name, values in encodings.items()
+        }
+        yield indices, tokenizer.pad(batch, return_tensors=return_tensors)
+
+
+def aggregate_windows(
+    probabilities: np.ndarray,
+    lengths: np.ndarray,
+    documents: np.ndarray,
+    count: int,
+    aggregation: str = "mean",
+) -> np.ndarray:
+    """
+    Combines the window probabilities into one row per document: "mean"
+    averages the windows weighted by their token count, "max" takes the window
+    whose top label has the highest probability. Every document must have at
+    least one window.
+    """
+    if aggregation == "mean":
+        weights = lengths.astype(np.float64)
+        sums = np.zeros((count, probabilities.shape[1]))
+        np.add.at(sums, documents, probabilities * weights[:, None])
+        totals = np.bincount(documents, weights=weights, minlength=count)
+        return sums / totals[:, None]
+
+    if aggregation == "max":
+        # Sorted by document, then by decreasing confidence: the first window of each document wins
+        order = np.lexsort((-probabilities.max(axis=1), documents))
+        sorted_documents = documents[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = sorted_documents[1:] != sorted_documents[:-1]
+        result = np.zeros((count, probabilities.shape[1]))
+        result[sorted_documents[first]] = probabilities[order[first]]
+        return result
+
+    supported = ", ".join(AGGREGATIONS)
+    raise ValueError(
+        f"Unsupported aggregation: {aggregation}. Supported aggregations: {supported}"
+    )
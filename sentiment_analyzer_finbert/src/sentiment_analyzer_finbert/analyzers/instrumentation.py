@@ -0,0 +1,200 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class StageEvent:
+    """
+    The timing of one stage of an analyzer call, passed to the callbacks.
+
+    Stages: "normalize" (validating and stripping the texts), "cache" (result
+    cache lookup, without the scoring of the misses), "tokenize", "forward"
+    (the model on one padded batch) and "map" (building the `Sentiments`).
+    """
+
+    stage: str
+    model: str  # The model id and backend of the analyzer
+    seconds: float
+    start_time_ns: int  # Wall-clock start since the epoch, for span exporters
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+StageCallback = Callable[[StageEvent], None]
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        return False
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("_instrumentation", "_event", "_started")
+
+    def __init__(self, instrumentation: "Instrumentation", event: StageEvent) -> None:
+        self._instrumentation = instrumentation
+        self._event = event
+
+    def __enter__(self) -> "_Stage":
+        self._event.start_time_ns = time.time_ns()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        self._event.seconds = time.perf_counter() - self._started
+        if exc_type is not None:
+            self._event.attributes["error"] = exc_type.__name__
+        self._instrumentation.emit(self._event)
+        return False
+
+    def set(self, **attributes: Any) -> None:
+        self._event.attributes.update(attributes)
+
+
+class Instrumentation:
+    """
+    Reports per-stage timings of the analyzer to pluggable callbacks.
+
+    Without callbacks `stage` returns a shared no-op object, so instrumented
+    code pays one method call per stage and batch. Callbacks run on the calling
+    thread and must be fast and thread-safe; a failing callback is logged and
+    does not fail the analysis.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._callbacks: tuple[StageCallback, ...] = ()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._callbacks)
+
+    def add_callback(self, callback: StageCallback) -> None:
+        with self._lock:
+            self._callbacks = self._callbacks + (callback,)
+
+    def remove_callback(self, callback: StageCallback) -> None:
+        with self._lock:
+            self._callbacks = tuple(
+                item for item in self._callbacks if item != callback
+            )
+
+    def stage(self, stage: str, model: str, **attributes: Any):
+        """
+        Returns a context manager timing a stage. Its `set(**attributes)` adds
+        attributes known only while the stage runs, e.g. the padded tokens.
+        """
+        if not self._callbacks:
+            return _NULL_STAGE
+        return _Stage(self, StageEvent(stage, model, 0.0, 0, attributes))
+
+    def record(self, stage: str, model: str, seconds: float, **attributes: Any) -> None:
+        """
+        Reports a stage timed by the caller, e.g. the cache lookups around the
+        scoring of the misses.
+        """
+        if not self._callbacks:
+            return
+        start_time_ns = time.time_ns() - int(seconds * 1e9)
+        self.emit(StageEvent(stage, model, seconds, start_time_ns, attributes))
+
+    def emit(self, event: StageEvent) -> None:
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Instrumentation callback %r failed", callback)
+
+
+class LoggingCallback:
+    """
+    Logs every stage event at `level`.
+    """
+
+    def __init__(
+        self, logger: logging.Logger | None = None, level: int = logging.DEBUG
+    ) -> None:
+        self.logger = logger or logging.getLogger(
+            "sentiment_analyzer_finbert.instrumentation"
+        )
+        self.level = level
+
+    def __call__(self, event: StageEvent) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level,
+                "%s %s %.3fms %s",
+                event.model,
+                event.stage,
+                event.seconds * 1000,
+                event.attributes,
+            )
+
+
+class StageMetrics:
+    """
+    Prometheus-style counters per model and stage: the number of events, the
+    total and maximum seconds, and the sum of every numeric attribute (texts,
+    padded tokens, cache hits, ...). Export `snapshot()` periodically.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, str], dict[str, float]] = {}
+
+    def __call__(self, event: StageEvent) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(
+                (event.model, event.stage),
+                {"count": 0, "seconds": 0.0, "max_seconds": 0.0},
+            )
+            counters["count"] += 1
+            counters["seconds"] += event.seconds
+            counters["max_seconds"] = max(counters["max_seconds"], event.seconds)
+            for name, value in event.attributes.items():
+                if isinstance(value, int | float) and not isinstance(value, bool):
+                    counters[name] = counters.get(name, 0) + value
+
+    def snapshot(self) -> dict[tuple[str, str], dict[str, float]]:
+        with self._lock:
+            return {key: dict(counters) for key, counters in self._counters.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+class SpanCallback:
+    """
+    Reports every stage as a finished span of an OpenTelemetry-like tracer:
+    any object whose `start_span(name, start_time=..., attributes=...)` returns
+    a span with `end(end_time=...)`, such as `opentelemetry.trace.get_tracer()`.
+    """
+
+    def __init__(self, tracer: Any, prefix: str = "sentiment") -> None:
+        self.tracer = tracer
+        self.prefix = prefix
+
+    def __call__(self, event: StageEvent) -> None:
+        span = self.tracer.start_span(
+            f"{self.prefix}.{event.stage}",
+            start_time=event.start_time_ns,
+            attributes={"model": event.model, **event.attributes},
+        )
+        span.end(end_time=event.start_time_ns + int(event.seconds * 1e9))
@@ -0,0 +1,131 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def model_nbytes(model: Any) -> int:
+    """
+    Approximates the resident size of a PyTorch model as the bytes of its
+    parameters and buffers.
+    """
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+@dataclass
+class ModelRegistryStats:
+    """
+    The metrics of a `ModelRegistry`.
+    """
+
+    loads: int = 0  # Number of model loads, including reloads after an eviction
+    reloads: int = 0  # Number of loads of a model that had been evicted before
+    evictions: int = 0
+    load_seconds: float = 0.0  # Total time spent loading models
+    resident_bytes: int = 0
+    max_bytes: int | None = None
+    models: dict[str, int] = field(default_factory=dict)  # Resident bytes per loaded model
+
+
+@dataclass
+class _Entry:
+    name: str
+    nbytes: int
+
+
+class ModelRegistry:
+    """
+    Tracks the loaded models and keeps their total size within a memory budget.
+
+    Analyzers report every load with `record_load` and every use with `touch`. When the
+    models exceed `max_bytes`, the least recently used ones are evicted by calling their
+    `_evict()` method, which drops the weights; an evicted analyzer reloads its model on
+    next use. The sizes are approximations (parameter and buffer bytes of the models).
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Any, _Entry] = OrderedDict()
+        self._evicted: set[Any] = set()
+        self._stats = ModelRegistryStats()
+        self.set_budget(max_bytes)
+
+    def set_budget(self, max_bytes: int | None) -> None:
+        """
+        Sets the memory budget in bytes (None means no limit) and evicts models
+        until the loaded ones fit in it.
+        """
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        with self._lock:
+            self._stats.max_bytes = max_bytes
+            self._enforce_budget(keep=None)
+
+    def record_load(self, owner, name: str, nbytes: int, seconds: float) -> None:
+        """
+        Registers a freshly loaded model of `owner` as the most recently used one
+        and evicts the least recently used models over the budget. The new model
+        itself is never evicted.
+        """
+        with self._lock:
+            previous = self._entries.pop(owner, None)
+            if previous is not None:
+                self._stats.resident_bytes -= previous.nbytes
+            self._entries[owner] = _Entry(name, nbytes)
+            self._stats.resident_bytes += nbytes
+            self._stats.loads += 1
+            self._stats.load_seconds += seconds
+            if owner in self._evicted:
+                self._evicted.discard(owner)
+                self._stats.reloads += 1
+            self._enforce_budget(keep=owner)
+
+    def touch(self, owner) -> None:
+        """
+        Marks the model of an analyzer as the most recently used one.
+        """
+        with self._lock:
+            if owner in self._entries:
+                self._entries.move_to_end(owner)
+
+    def discard(self, owner) -> None:
+        """
+        Forgets an analyzer without evicting it, e.g. when it is released.
+        """
+        with self._lock:
+            entry = self._entries.pop(owner, None)
+            if entry is not None:
+                self._stats.resident_bytes -= entry.nbytes
+            self._evicted.discard(owner)
+
+    def _enforce_budget(self, keep) -> None:
+        max_bytes = self._stats.max_bytes
+        if max_bytes is None:
+            return
+        for owner in list(self._entries):
+            if self._stats.resident_bytes <= max_bytes:
+                break
+            if owner is keep:
+                continue
+            entry = self._entries.pop(owner)
+            self._stats.resident_bytes -= entry.nbytes
+            self._stats.evictions += 1
+            self._evicted.add(owner)
+            owner._evict()
+
+    @property
+    def stats(self) -> ModelRegistryStats:
+        with self._lock:
+            return ModelRegistryStats(
+                loads=self._stats.loads,
+                reloads=self._stats.reloads,
+                evictions=self._stats.evictions,
+                load_seconds=self._stats.load_seconds,
+                resident_bytes=self._stats.resident_bytes,
+                max_bytes=self._stats.max_bytes,
+                models={entry.name: entry.nbytes for entry in self._entries.values()},
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,28 @@
+import hashlib
+import os
+
+
+def resolve_model_version(model_id: str, config) -> str:
+    """
+    Identifies the revision of a loaded model: the Hub commit hash, or a
+    fingerprint of the local model files.
+    """
+    commit_hash = getattr(config, "_commit_hash", None)
+    if commit_hash:
+        return commit_hash
+
+    model_dir = model_id
+    if not os.path.isdir(model_dir):
+        from transformers.utils import cached_file
+
+        model_dir = os.path.dirname(cached_file(model_id, "config.json"))
+        # Hub downloads live in .../snapshots/<commit hash>/
+        if os.path.basename(os.path.dirname(model_dir)) == "snapshots":
+            return os.path.basename(model_dir)
+
+    files = sorted(
+        (entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+        for entry in os.scandir(model_dir)
+        if entry.is_file()
+    )
+    return hashlib.sha256(repr(files).encode("utf-8")).hexdigest()[:12]
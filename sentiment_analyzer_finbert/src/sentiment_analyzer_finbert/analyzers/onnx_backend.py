@@ -0,0 +1,226 @@
+import inspect
+import os
+import re
+import sys
+import threading
+
+from sentiment_analyzer_finbert.analyzers.instrumentation import Instrumentation
+from sentiment_analyzer_finbert.analyzers.model_version import resolve_model_version
+from sentiment_analyzer_finbert.models.sentiments import LABELS, Sentiments, label_columns
+
+_DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "sentiment_analyzer_finbert", "onnx"
+)
+_EXPORT_LOCK = threading.Lock()
+# Bumped when the exported graph changes, so artifacts of an older export are not reused
+_EXPORT_FORMAT = 2
+_BATCH_SIZE = 32
+
+
+def _onnx_cache_dir() -> str:
+    return os.environ.get("SENTIMENT_ANALYZER_ONNX_CACHE", _DEFAULT_CACHE_DIR)
+
+
+def export_onnx_model(model_id: str, model_version: str, quantize: bool = False) -> str:
+    """
+    Exports a sequence classification model to ONNX, optionally with int8 dynamic
+    quantization, and caches the artifact on disk.
+
+    The artifact lives under `$SENTIMENT_ANALYZER_ONNX_CACHE` (default
+    `~/.cache/sentiment_analyzer_finbert/onnx`) in a directory named after the model
+    id and revision, so a new model revision is exported again.
+
+    Returns the path of the ONNX model file.
+    """
+    try:
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+    except ImportError as exc:
+        raise RuntimeError(
+            "Exporting FinBERT to ONNX requires the 'transformers' and 'torch' packages"
+        ) from exc
+
+    export_dir = os.path.join(
+        _onnx_cache_dir(), re.sub(r"[^\w.-]+", "--", model_id.strip("/")), model_version
+    )
+    model_path = os.path.join(export_dir, f"model.v{_EXPORT_FORMAT}.onnx")
+    quantized_path = os.path.join(export_dir, f"model.v{_EXPORT_FORMAT}.int8.onnx")
+    target_path = quantized_path if quantize else model_path
+
+    with _EXPORT_LOCK:
+        if os.path.exists(target_path):
+            return target_path
+
+        os.makedirs(export_dir, exist_ok=True)
+        if not os.path.exists(model_path):
+            tokenizer = AutoTokenizer.from_pretrained(model_id)
+            model = AutoModelForSequenceClassification.from_pretrained(model_id)
+            model.eval()
+
+            sample = tokenizer(
+                ["Revenue grew.", "The company cut its full-year guidance."],
+                padding=True,
+                return_tensors="pt",
+            )
+            # The inputs are passed positionally, so they follow `model.forward`
+            # rather than the tokenizer, whose BERT order puts token_type_ids
+            # before attention_mask
+            forward_parameters = inspect.signature(model.forward).parameters
+            input_names = [name for name in forward_parameters if name in sample]
+            export_options = {}
+            # Recent torch versions default to the dynamo exporter; the TorchScript
+            # exporter handles the dynamic batch and sequence axes of these models
+            if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+                export_options["dynamo"] = False
+
+            # Written to a temporary file first, so other processes never load a partial model
+            partial_path = f"{model_path}.{os.getpid()}.tmp"
+            torch.onnx.export(
+                model,
+                tuple(sample[name] for name in input_names),
+                partial_path,
+                input_names=input_names,
+                output_names=["logits"],
+                dynamic_axes={
+                    **{name: {0: "batch", 1: "sequence"} for name in input_names},
+                    "logits": {0: "batch"},
+                },
+                opset_version=17,
+                **export_options,
+            )
+            os.replace(partial_path, model_path)
+
+        if quantize:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            partial_path = f"{quantized_path}.{os.getpid()}.tmp"
+            quantize_dynamic(model_path, partial_path, weight_type=QuantType.QInt8)
+            os.replace(partial_path, quantized_path)
+
+    return target_path
+
+
+class _OnnxFinbertBackend:
+    """
+    FinBERT served through ONNX Runtime on CPU, optionally int8-quantized.
+    """
+
+    name = "onnx"
+
+    def __init__(
+        self,
+        model_id: str,
+        quantize: bool = False,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        try:
+            import onnxruntime
+            from transformers import AutoConfig, AutoTokenizer
+        except ImportError as exc:
+            raise RuntimeError(
+                "The ONNX backend requires the 'onnxruntime' and 'transformers' packages"
+            ) from exc
+
+        self._instrumentation = instrumentation or Instrumentation()
+        self._label = f"{model_id}/{'onnx-int8' if quantize else 'onnx'}"
+        config = AutoConfig.from_pretrained(model_id)
+        self.model_version = resolve_model_version(model_id, config)
+        self._columns = label_columns(config.id2label)
+        self._tokenizer = AutoTokenizer.from_pretrained(model_id)
+        self.max_window = min(
+            self._tokenizer.model_max_length, config.max_position_embeddings
+        )
+        options = onnxruntime.SessionOptions()
+        torch = sys.modules.get("torch")
+        if torch is not None:
+            # Follow torch's intra-op thread count, so a worker pinned with
+            # `torch.set_num_threads` does not start a full ONNX Runtime thread pool
+            options.intra_op_num_threads = torch.get_num_threads()
+        model_path = export_onnx_model(model_id, self.model_version, quantize=quantize)
+        self.resident_bytes = os.path.getsize(model_path)
+        self._session = onnxruntime.InferenceSession(
+            model_path,
+            options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input_names = [item.name for item in self._session.get_inputs()]
+
+    def predict_proba(self, texts: list[str]):
+        """
+        Returns the probabilities of the texts, one row per text and the columns
+        in `LABELS` order, running `_BATCH_SIZE` texts at a time.
+        """
+        import numpy as np
+
+        instrumentation = self._instrumentation
+        label = self._label if instrumentation.enabled else ""
+        rows = []
+        for start in range(0, len(texts), _BATCH_SIZE):
+            chunk = texts[start : start + _BATCH_SIZE]
+            with instrumentation.stage("tokenize", label, texts=len(chunk)):
+                encoded = self._tokenizer(
+                    chunk,
+                    padding=True,
+                    truncation=True,
+                    return_tensors="np",
+                )
+            with instrumentation.stage(
+                "forward",
+                label,
+                batch_size=len(chunk),
+                padded_tokens=encoded["input_ids"].size,
+            ):
+                rows.append(self._run(encoded))
+
+        if not rows:
+            return np.zeros((0, len(LABELS)))
+        return np.concatenate(rows)[:, self._columns]
+
+    def predict_windows(self, texts: list[str], window: int, stride: int):
+        """
+        Returns the probabilities of the overlapping token windows of the texts
+        in `LABELS` order, with the token count and the text index of every
+        window (see `split_windows`). Windows run in length-sorted batches.
+        """
+        import numpy as np
+
+        from sentiment_analyzer_finbert.analyzers.documents import (
+            split_windows,
+            window_batches,
+        )
+
+        encodings, lengths, documents = split_windows(
+            self._tokenizer, texts, window, stride
+        )
+        probabilities = np.zeros((len(lengths), len(LABELS)))
+        for indices, batch in window_batches(
+            self._tokenizer, encodings, lengths, _BATCH_SIZE, "np"
+        ):
+            probabilities[indices] = self._run(batch)[:, self._columns]
+        return probabilities, lengths, documents
+
+    def _run(self, encoded):
+        """
+        Runs the session on a padded batch and returns the softmax
+        probabilities in the model's label order.
+        """
+        import numpy as np
+
+        logits = self._session.run(
+            ["logits"],
+            {name: encoded[name].astype(np.int64) for name in self._input_names},
+        )[0]
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        probabilities = np.exp(logits)
+        return probabilities / probabilities.sum(axis=-1, keepdims=True)
+
+    def analyze_text(self, text: str) -> Sentiments:
+        return self.analyze_batch([text])[0]
+
+    def analyze_batch(self, texts: list[str]) -> list[Sentiments]:
+        probabilities = self.predict_proba(texts)
+        instrumentation = self._instrumentation
+        with instrumentation.stage(
+            "map", self._label if instrumentation.enabled else "", texts=len(texts)
+        ):
+            return Sentiments.from_probabilities(probabilities)
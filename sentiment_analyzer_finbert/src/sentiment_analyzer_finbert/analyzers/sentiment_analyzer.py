@@ -1,8 +1,23 @@
+import asyncio
+import logging
 import threading
-from collections.abc import Iterable
+import time
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 
-from sentiment_analyzer_finbert.models.sentiments import Sentiments
+from sentiment_analyzer_finbert.analyzers.model_registry import ModelRegistry, model_nbytes
+from sentiment_analyzer_finbert.analyzers.model_version import resolve_model_version
+from sentiment_analyzer_finbert.analyzers.onnx_backend import (
+    _BATCH_SIZE,
+    _OnnxFinbertBackend,
+)
+from sentiment_analyzer_finbert.analyzers.async_batcher import AsyncBatcher
+from sentiment_analyzer_finbert.analyzers.instrumentation import Instrumentation
+from sentiment_analyzer_finbert.cache.result_cache import BaseSentimentCache
+from sentiment_analyzer_finbert.models.sentiments import LABELS, Sentiments, label_columns
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True, slots=True)
 class _ModelConfig:
@@ -12,33 +27,103 @@ class _ModelConfig:
 class _FinbertBackend:
     name = "finbert"
 
-    def __init__(self, model_id: str) -> None:
+    def __init__(
+        self, model_id: str, instrumentation: Instrumentation | None = None
+    ) -> None:
         try:
-            from transformers import (
-                AutoModelForSequenceClassification,
-                AutoTokenizer,
-                pipeline,
-            )
+            import torch
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer
         except ImportError as exc:
             raise RuntimeError(
                 "FinBERT analysis requires the 'transformers' and 'torch' packages"
             ) from exc
 
-        tokenizer = AutoTokenizer.from_pretrained(model_id)
-        model = AutoModelForSequenceClassification.from_pretrained(model_id)
-        self._classifier = pipeline(
-            "sentiment-analysis",
-            model=model,
-            tokenizer=tokenizer,
-            top_k=None,
+        self._torch = torch
+        self._instrumentation = instrumentation or Instrumentation()
+        self._label = f"{model_id}/torch"
+        self._tokenizer = AutoTokenizer.from_pretrained(model_id)
+        self._model = AutoModelForSequenceClassification.from_pretrained(model_id)
+        self._model.eval()
+        self._columns = label_columns(self._model.config.id2label)
+        self.max_window = min(
+            self._tokenizer.model_max_length,
+            self._model.config.max_position_embeddings,
+        )
+        self.model_version = resolve_model_version(model_id, self._model.config)
+        self.resident_bytes = model_nbytes(self._model)
+
+    def predict_proba(self, texts: list[str]):
+        """
+        Runs the tokenizer and the model directly, without the pipeline's
+        post-processing, `_BATCH_SIZE` texts at a time. Returns one row per
+        text with the columns in `LABELS` order.
+        """
+        import numpy as np
+
+        torch = self._torch
+        instrumentation = self._instrumentation
+        label = self._label if instrumentation.enabled else ""
+        rows = []
+        for start in range(0, len(texts), _BATCH_SIZE):
+            chunk = texts[start : start + _BATCH_SIZE]
+            with instrumentation.stage("tokenize", label, texts=len(chunk)):
+                encoded = self._tokenizer(
+                    chunk,
+                    padding=True,
+                    truncation=True,
+                    return_tensors="pt",
+                )
+            with instrumentation.stage(
+                "forward",
+                label,
+                batch_size=len(chunk),
+                padded_tokens=encoded["input_ids"].numel(),
+            ), torch.inference_mode():
+                logits = self._model(**encoded).logits
+                rows.append(torch.softmax(logits, dim=-1).numpy())
+
+        if not rows:
+            return np.zeros((0, len(LABELS)))
+        return np.concatenate(rows)[:, self._columns]
+
+    def predict_windows(self, texts: list[str], window: int, stride: int):
+        """
+        Returns the probabilities of the overlapping token windows of the texts
+        in `LABELS` order, with the token count and the text index of every
+        window (see `split_windows`). Windows run in length-sorted batches.
+        """
+        import numpy as np
+
+        from sentiment_analyzer_finbert.analyzers.documents import (
+            split_windows,
+            window_batches,
+        )
+
+        torch = self._torch
+        encodings, lengths, documents = split_windows(
+            self._tokenizer, texts, window, stride
         )
+        probabilities = np.zeros((len(lengths), len(LABELS)))
+        for indices, batch in window_batches(
+            self._tokenizer, encodings, lengths, _BATCH_SIZE, "pt"
+        ):
+            with torch.inference_mode():
+                logits = self._model(**batch).logits
+                probabilities[indices] = torch.softmax(logits, dim=-1).numpy()[
+                    :, self._columns
+                ]
+        return probabilities, lengths, documents
 
     def analyze_text(self, text: str) -> Sentiments:
-        return Sentiments.from_finbert(self._classifier(text))
+        return self.analyze_batch([text])[0]
 
     def analyze_batch(self, texts: list[str]) -> list[Sentiments]:
-        raw_results = self._classifier(texts)
-        return [Sentiments.from_finbert(result) for result in raw_results]
+        probabilities = self.predict_proba(texts)
+        instrumentation = self._instrumentation
+        with instrumentation.stage(
+            "map", self._label if instrumentation.enabled else "", texts=len(texts)
+        ):
+            return Sentiments.from_probabilities(probabilities)
 
 
 class SentimentAnalyzer:
@@ -49,34 +134,109 @@ class SentimentAnalyzer:
     be added later without changing how callers construct or use the analyzer.
     """
 
-    _instances: dict[tuple[str, str | None], "SentimentAnalyzer"] = {}
+    _instances: dict[tuple[str, str | None, str], "SentimentAnalyzer"] = {}
     _lock = threading.Lock()
     _supported_models = {
         "finbert": _ModelConfig(model_id="ProsusAI/finbert"),
     }
+    _supported_backends = ("torch", "onnx", "onnx-int8")
+    # The column order of `predict_proba`
+    labels = LABELS
+    # Keeps the loaded models of all analyzers within a memory budget
+    model_registry = ModelRegistry()
+    # Reports per-stage timings of all analyzers to the callbacks registered on it
+    instrumentation = Instrumentation()
 
-    def __new__(cls, model: str = "finbert", model_id: str | None = None):
-        cache_key = (model, model_id)
+    def __new__(
+        cls,
+        model: str = "finbert",
+        model_id: str | None = None,
+        backend: str = "torch",
+    ):
+        cache_key = (model, model_id, backend)
         with cls._lock:
             if cache_key not in cls._instances:
                 instance = super().__new__(cls)
-                instance._initialize(model, model_id)
+                instance._initialize(model, model_id, backend)
                 cls._instances[cache_key] = instance
         return cls._instances[cache_key]
 
-    def _initialize(self, model: str, model_id: str | None) -> None:
+    def _initialize(self, model: str, model_id: str | None, backend: str) -> None:
         config = self._supported_models.get(model)
         if config is None:
             supported = ", ".join(sorted(self._supported_models))
             raise ValueError(
                 f"Unsupported model: {model}. Supported models: {supported}"
             )
+        if backend not in self._supported_backends:
+            supported = ", ".join(self._supported_backends)
+            raise ValueError(
+                f"Unsupported backend: {backend}. Supported backends: {supported}"
+            )
 
         self.model = model
         self.model_id = model_id or config.model_id
-        self._backend = _FinbertBackend(self.model_id)
+        self.backend = backend
+        self._loaded_backend: _FinbertBackend | _OnnxFinbertBackend | None = None
+        self._load_lock = threading.Lock()
+        self._load()
+        self._cache: BaseSentimentCache | None = None
+        self._async_batcher: AsyncBatcher | None = None
+
+    def _load(self) -> _FinbertBackend | _OnnxFinbertBackend:
+        started = time.perf_counter()
+        if self.backend == "torch":
+            backend = _FinbertBackend(self.model_id, self.instrumentation)
+        else:
+            backend = _OnnxFinbertBackend(
+                self.model_id,
+                quantize=self.backend == "onnx-int8",
+                instrumentation=self.instrumentation,
+            )
+        self.model_version = backend.model_version
+        self._loaded_backend = backend
+        self.model_registry.record_load(
+            self,
+            f"{self.model_id}/{self.backend}",
+            backend.resident_bytes,
+            time.perf_counter() - started,
+        )
+        return backend
 
-    def _normalize_text(self, text: str) -> str:
+    @property
+    def _backend(self) -> _FinbertBackend | _OnnxFinbertBackend:
+        """
+        The loaded model, reloaded transparently after the model registry
+        evicted it.
+        """
+        backend = self._loaded_backend
+        if backend is None:
+            with self._load_lock:
+                backend = self._loaded_backend
+                if backend is None:
+                    backend = self._load()
+        else:
+            self.model_registry.touch(self)
+        return backend
+
+    def _evict(self) -> None:
+        # Calls running meanwhile keep their reference and complete
+        self._loaded_backend = None
+
+    def set_cache(self, cache: BaseSentimentCache | None) -> None:
+        """
+        Puts an in-memory or persistent result cache in front of `analyze_text`
+        and `analyze_batch`. Results are keyed by the model id and revision.
+        Passing None disables caching.
+        """
+        self._cache = cache
+
+    @property
+    def _cache_model_id(self) -> str:
+        return f"{self.model_id}@{self.model_version}/{self.backend}"
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
         if not isinstance(text, str):
             raise TypeError("Text to analyze must be a string")
 
@@ -86,22 +246,235 @@ class SentimentAnalyzer:
 
         return normalized_text
 
+    def _normalize_texts(
+        self, texts: Iterable[object], skip_invalid: bool
+    ) -> list[str]:
+        instrumentation = self.instrumentation
+        with instrumentation.stage(
+            "normalize", self._label if instrumentation.enabled else ""
+        ) as stage:
+            normalized_texts: list[str] = []
+            invalid = 0
+            for text in texts:
+                try:
+                    normalized_texts.append(self._normalize_text(text))
+                except (TypeError, ValueError):
+                    if not skip_invalid:
+                        raise
+                    invalid += 1
+            stage.set(texts=len(normalized_texts), invalid=invalid)
+        return normalized_texts
+
+    @property
+    def _label(self) -> str:
+        # Identifies the analyzer in instrumentation events
+        return f"{self.model_id}/{self.backend}"
+
+    def _score_texts(self, texts: list[str]) -> list[Sentiments]:
+        if self._cache is None:
+            return self._backend.analyze_batch(texts)
+        if not self.instrumentation.enabled:
+            return self._cache.resolve(
+                self._cache_model_id, texts, self._backend.analyze_batch
+            )
+
+        # The cache stage is the lookup and storage time, without the scoring
+        computed: list[tuple[int, float]] = []
+        backend = self._backend
+
+        def timed_analyze_batch(misses: list[str]) -> list[Sentiments]:
+            started = time.perf_counter()
+            try:
+                return backend.analyze_batch(misses)
+            finally:
+                computed.append((len(misses), time.perf_counter() - started))
+
+        started = time.perf_counter()
+        results = self._cache.resolve(self._cache_model_id, texts, timed_analyze_batch)
+        misses, compute_seconds = computed[0] if computed else (0, 0.0)
+        self.instrumentation.record(
+            "cache",
+            self._label,
+            time.perf_counter() - started - compute_seconds,
+            texts=len(texts),
+            hits=len(texts) - misses,
+            misses=misses,
+        )
+        return results
+
     def analyze_text(self, text: str) -> Sentiments:
-        return self._backend.analyze_text(self._normalize_text(text))
+        normalized_text = self._normalize_text(text)
+        if self._cache is None:
+            return self._backend.analyze_text(normalized_text)
+        return self._score_texts([normalized_text])[0]
+
+    def predict_proba(self, texts: Iterable[str]):
+        """
+        Returns the class probabilities of the texts as a NumPy array with one
+        row per text and the columns in `labels` order (negative, neutral,
+        positive). Skips the result objects and the result cache, and raises on
+        invalid texts so the rows always match the input.
+        """
+        normalized_texts = [self._normalize_text(text) for text in texts]
+        return self._backend.predict_proba(normalized_texts)
 
     def analyze_batch(
         self, texts: Iterable[str], *, skip_invalid: bool = True
     ) -> list[Sentiments]:
-        normalized_texts: list[str] = []
+        normalized_texts = self._normalize_texts(texts, skip_invalid)
+
+        if not normalized_texts:
+            return []
+
+        return self._score_texts(normalized_texts)
+
+    def analyze_documents(
+        self,
+        texts: Iterable[str],
+        *,
+        aggregation: str = "mean",
+        window: int | None = None,
+        stride: int = 64,
+        skip_invalid: bool = True,
+    ) -> list[Sentiments]:
+        """
+        Analyzes long documents, e.g. full filings or articles, instead of only
+        their first `window` tokens.
+
+        Every document is split into windows of `window` tokens (default: the
+        longest input of the model) overlapping by `stride` tokens. The windows
+        of all documents run together in length-sorted batches and are combined
+        per document: "mean" weights the windows by their token count, "max"
+        takes the most confident window. Results are not cached.
+        """
+        from sentiment_analyzer_finbert.analyzers.documents import (
+            AGGREGATIONS,
+            aggregate_windows,
+        )
+
+        if aggregation not in AGGREGATIONS:
+            supported = ", ".join(AGGREGATIONS)
+            raise ValueError(
+                f"Unsupported aggregation: {aggregation}. "
+                f"Supported aggregations: {supported}"
+            )
+
+        normalized_texts = self._normalize_texts(texts, skip_invalid)
+        backend = self._backend
+        window = window or backend.max_window
+        if not 0 <= stride < window:
+            raise ValueError("stride must be at least 0 and smaller than window")
+        if not normalized_texts:
+            return []
 
-        for text in texts:
+        probabilities, lengths, documents = backend.predict_windows(
+            normalized_texts, window, stride
+        )
+        return Sentiments.from_probabilities(
+            aggregate_windows(
+                probabilities, lengths, documents, len(normalized_texts), aggregation
+            )
+        )
+
+    def analyze_stream(
+        self,
+        texts: Iterable[object],
+        *,
+        chunk_size: int = 256,
+        skip_invalid: bool = True,
+        on_error: Callable[[int, object, Exception], None] | None = None,
+    ) -> Iterator[Sentiments]:
+        """
+        Analyzes any iterable lazily, chunk by chunk, and yields the results as
+        they are produced, so memory is bounded by `chunk_size` rather than by
+        the number of texts.
+
+        With `skip_invalid`, each invalid item is reported to `on_error` with
+        its input index, the item and the error, or logged as a warning when no
+        callback is given.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        return self._stream(texts, chunk_size, skip_invalid, on_error)
+
+    def _stream(
+        self,
+        texts: Iterable[object],
+        chunk_size: int,
+        skip_invalid: bool,
+        on_error: Callable[[int, object, Exception], None] | None,
+    ) -> Iterator[Sentiments]:
+        chunk: list[str] = []
+        for index, text in enumerate(texts):
             try:
-                normalized_texts.append(self._normalize_text(text))
-            except (TypeError, ValueError):
+                chunk.append(self._normalize_text(text))
+            except (TypeError, ValueError) as exc:
                 if not skip_invalid:
                     raise
+                if on_error is None:
+                    logger.warning("Skipped invalid text at index %d: %s", index, exc)
+                else:
+                    on_error(index, text, exc)
+                continue
 
-        if not normalized_texts:
-            return []
+            if len(chunk) == chunk_size:
+                yield from self._score_texts(chunk)
+                chunk = []
+
+        if chunk:
+            yield from self._score_texts(chunk)
+
+    def configure_async_batching(
+        self,
+        *,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 1024,
+    ) -> None:
+        """
+        Sets how `analyze_text_async` and `analyze_batch_async` coalesce
+        concurrent awaiters into shared batches. At most `max_queue_size` texts
+        wait at a time; further awaiters wait for room (backpressure). Must be
+        called before the first async call, or after `close_async`.
+        """
+        batcher = AsyncBatcher(
+            self._score_texts,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+            name=f"async-batcher-{self.model}",
+        )
+        with self._lock:
+            if self._async_batcher is not None and self._async_batcher.started:
+                raise RuntimeError(
+                    "Async batching is already running; call close_async first"
+                )
+            self._async_batcher = batcher
 
-        return self._backend.analyze_batch(normalized_texts)
+    async def close_async(self) -> None:
+        with self._lock:
+            batcher, self._async_batcher = self._async_batcher, None
+        if batcher is not None:
+            await batcher.close()
+
+    def _get_async_batcher(self) -> AsyncBatcher:
+        if self._async_batcher is None:
+            self.configure_async_batching()
+        return self._async_batcher
+
+    async def analyze_text_async(self, text: str) -> Sentiments:
+        """
+        Analyzes a text without blocking the event loop. Inference runs on a
+        dedicated executor thread, batched with concurrent awaiters.
+        """
+        return await self._get_async_batcher().submit(self._normalize_text(text))
+
+    async def analyze_batch_async(
+        self, texts: Iterable[str], *, skip_invalid: bool = True
+    ) -> list[Sentiments]:
+        normalized_texts = self._normalize_texts(texts, skip_invalid)
+
+        batcher = self._get_async_batcher()
+        return list(
+            await asyncio.gather(*(batcher.submit(text) for text in normalized_texts))
+        )
@@ -0,0 +1,15 @@
+from sentiment_analyzer_finbert.cache.result_cache import (
+    BaseSentimentCache,
+    CacheStats,
+    SentimentCache,
+    make_cache_key,
+)
+from sentiment_analyzer_finbert.cache.sqlite_cache import SqliteSentimentCache
+
+__all__ = [
+    "BaseSentimentCache",
+    "CacheStats",
+    "SentimentCache",
+    "SqliteSentimentCache",
+    "make_cache_key",
+]
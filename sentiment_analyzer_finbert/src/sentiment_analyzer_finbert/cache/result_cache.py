@@ -0,0 +1,179 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from sentiment_analyzer_finbert.models.sentiments import Sentiments
+
+
+def make_cache_key(model_id: str, text: str) -> str:
+    """
+    Builds the content-addressed cache key of a text scored by a model.
+
+    Args:
+        model_id (str): The identifier of the model that scores the text.
+        text (str): The text to score. Surrounding and repeated whitespace is ignored.
+    Returns:
+        str: The SHA-256 hex digest of the model id and the normalized text.
+    """
+    normalized_text = " ".join(text.split())
+    return hashlib.sha256(f"{model_id}\0{normalized_text}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class BaseSentimentCache:
+    """
+    Base class of the analyzer result caches.
+
+    Subclasses store the results and implement `get_many` and `set_many`;
+    the lookup and merge logic of `resolve` is shared.
+    """
+
+    def get_many(self, keys: list[str]) -> list[Sentiments | None]:
+        """
+        Looks up several keys at once.
+
+        Args:
+            keys (list): The cache keys to look up.
+        Returns:
+            list: The cached result per key, None for the misses.
+        """
+        raise NotImplementedError
+
+    def set_many(self, items: Iterable[tuple[str, Sentiments]]) -> None:
+        """
+        Stores several results at once.
+
+        Args:
+            items (iterable): The (key, result) pairs to store.
+        """
+        raise NotImplementedError
+
+    def get(self, key: str) -> Sentiments | None:
+        return self.get_many([key])[0]
+
+    def set(self, key: str, value: Sentiments) -> None:
+        self.set_many([(key, value)])
+
+    def resolve(
+        self,
+        model_id: str,
+        texts: list[str],
+        compute: Callable[[list[str]], list[Sentiments]],
+    ) -> list[Sentiments]:
+        """
+        Returns the results of the texts, computing only the cache misses.
+
+        The misses are deduplicated and sent to `compute` in one call, then merged
+        back with the cached results in input order.
+
+        Args:
+            model_id (str): The identifier of the model that scores the texts.
+            texts (list): The texts to score.
+            compute (Callable): Scores a list of texts, returning the results in the same order.
+        Returns:
+            list: The `Sentiments` per text, in input order.
+        """
+        keys = [make_cache_key(model_id, text) for text in texts]
+        results = self.get_many(keys)
+
+        missing: OrderedDict[str, list[int]] = OrderedDict()
+        for index, result in enumerate(results):
+            if result is None:
+                missing.setdefault(keys[index], []).append(index)
+
+        if missing:
+            indices = list(missing.values())
+            computed = compute([texts[positions[0]] for positions in indices])
+            self.set_many(zip(missing.keys(), computed))
+            for positions, result in zip(indices, computed):
+                for index in positions:
+                    results[index] = result
+
+        return results  # type: ignore[return-value]
+
+
+class SentimentCache(BaseSentimentCache):
+    """
+    A thread-safe in-memory cache for analyzer results.
+
+    Entries are evicted least-recently-used first once `max_size` entries are stored and,
+    when `ttl` is set, expire `ttl` seconds after they were stored. Cached `Sentiments`
+    objects are shared between callers and should be treated as read-only.
+    """
+
+    def __init__(self, max_size: int = 100_000, ttl: float | None = None) -> None:
+        """
+        Args:
+            max_size (int): The maximum number of cached results.
+            ttl (float, optional): The number of seconds a result stays valid. None means no expiry.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Sentiments]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_many(self, keys: list[str]) -> list[Sentiments | None]:
+        now = time.monotonic()
+        results: list[Sentiments | None] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and self.ttl is not None and now - entry[0] > self.ttl:
+                    del self._entries[key]
+                    self._evictions += 1
+                    entry = None
+
+                if entry is None:
+                    self._misses += 1
+                    results.append(None)
+                else:
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    results.append(entry[1])
+        return results
+
+    def set_many(self, items: Iterable[tuple[str, Sentiments]]) -> None:
+        # Evicts the least recently used entries once the cache is full
+        now = time.monotonic()
+        with self._lock:
+            for key, value in items:
+                self._entries[key] = (now, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,6 +1,17 @@
 from dataclasses import asdict, dataclass, field
 from typing import Any
 
+# The label order of probability matrices, see `Sentiments.from_probabilities`
+LABELS = ("negative", "neutral", "positive")
+
+
+def label_columns(id2label: dict[int, str]) -> list[int]:
+    """
+    Returns the model's output column of each label in `LABELS` order.
+    """
+    label_ids = {str(label).lower(): label_id for label_id, label in id2label.items()}
+    return [label_ids[label] for label in LABELS]
+
 
 @dataclass(slots=True)
 class Sentiments:
@@ -29,6 +40,22 @@ class Sentiments:
             compound=positive - negative,
         )
 
+    @classmethod
+    def from_probabilities(cls, probabilities: Any) -> list["Sentiments"]:
+        """
+        Builds the results of a batch from a probability matrix with one row per
+        text and the columns in `LABELS` order.
+        """
+        return [
+            cls(
+                negative=negative,
+                neutral=neutral,
+                positive=positive,
+                compound=positive - negative,
+            )
+            for negative, neutral, positive in probabilities.tolist()
+        ]
+
     @classmethod
     def _scores_by_label(cls, result: Any) -> dict[str, float]:
         rows = cls._flatten_pipeline_result(result)
@@ -39,7 +66,6 @@ class Sentiments:
             if label in {"negative", "neutral", "positive"}:
                 scores[label] = float(row.get("score", 0.0))
 
-        print(scores)
         return scores
 
     @classmethod
@@ -0,0 +1,69 @@
+import pytest
+
+from sentiment_analyzer_finbert.analyzers import sentiment_analyzer as analyzer_module
+from sentiment_analyzer_finbert.models.sentiments import Sentiments
+
+
+class _StubBackend:
+    """Scores every text by its length, in place of the FinBERT model."""
+
+    batches: list[list[str]] = []
+
+    def __init__(self, model_id, instrumentation=None):
+        self.model_version = "stub"
+        self.resident_bytes = 0
+
+    def analyze_batch(self, texts):
+        self.batches.append(texts)
+        return [Sentiments(compound=float(len(text))) for text in texts]
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setattr(analyzer_module, "_FinbertBackend", _StubBackend)
+    monkeypatch.setattr(analyzer_module.SentimentAnalyzer, "_instances", {})
+    monkeypatch.setattr(_StubBackend, "batches", [])
+    return analyzer_module.SentimentAnalyzer()
+
+
+def test_stream_consumes_lazily_and_matches_batch(analyzer):
+    texts = ["x" * number for number in range(1, 8)]
+    consumed = []
+
+    def read():
+        for text in texts:
+            consumed.append(text)
+            yield text
+
+    stream = analyzer.analyze_stream(read(), chunk_size=3)
+    first = next(stream)
+
+    assert len(consumed) == 3
+    assert [first, *stream] == analyzer.analyze_batch(texts)
+    assert [len(batch) for batch in _StubBackend.batches] == [3, 3, 1, 7]
+
+
+def test_stream_reports_skipped_items(analyzer):
+    errors = []
+
+    results = list(
+        analyzer.analyze_stream(
+            ["Good news.", "  ", None, "Bad news."],
+            on_error=lambda index, item, exc: errors.append((index, item, type(exc))),
+        )
+    )
+
+    assert [result.compound for result in results] == [10.0, 9.0]
+    assert errors == [(1, "  ", ValueError), (2, None, TypeError)]
+
+
+def test_stream_raises_on_invalid_items_without_skip_invalid(analyzer):
+    stream = analyzer.analyze_stream(["Good news.", ""], skip_invalid=False)
+
+    with pytest.raises(ValueError, match="Missing text"):
+        list(stream)
+
+
+def test_stream_rejects_invalid_chunk_size_when_called(analyzer):
+    with pytest.raises(ValueError, match="chunk_size"):
+        analyzer.analyze_stream(["Good news."], chunk_size=0)
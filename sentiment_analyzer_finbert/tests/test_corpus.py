@@ -0,0 +1,113 @@
+from concurrent.futures import Future
+
+import pytest
+
+from sentiment_analyzer_finbert.analyzers import corpus
+from sentiment_analyzer_finbert.analyzers import sentiment_analyzer as analyzer_module
+from sentiment_analyzer_finbert.analyzers.corpus import _chunks, analyze_corpus
+from sentiment_analyzer_finbert.models.sentiments import Sentiments
+
+
+class _StubBackend:
+    """Scores every text by its length, in place of the FinBERT model."""
+
+    batches: list[list[str]] = []
+
+    def __init__(self, model_id, instrumentation=None):
+        self.model_version = "stub"
+        self.resident_bytes = 0
+
+    def analyze_batch(self, texts):
+        self.batches.append(texts)
+        return [Sentiments(compound=float(len(text))) for text in texts]
+
+
+class _InlineExecutor:
+    """Runs the worker initializer and every chunk in the test process."""
+
+    def __init__(self, max_workers, mp_context, initializer, initargs):
+        self.max_workers = max_workers
+        initializer(*initargs)
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait, cancel_futures):
+        pass
+
+
+@pytest.fixture
+def stub_backend(monkeypatch):
+    monkeypatch.setattr(analyzer_module, "_FinbertBackend", _StubBackend)
+    monkeypatch.setattr(analyzer_module.SentimentAnalyzer, "_instances", {})
+    monkeypatch.setattr(corpus, "ProcessPoolExecutor", _InlineExecutor)
+    monkeypatch.setattr(_StubBackend, "batches", [])
+    try:
+        import torch
+    except ImportError:
+        yield _StubBackend
+    else:
+        # The inline worker pins the threads of the test process
+        num_threads = torch.get_num_threads()
+        yield _StubBackend
+        torch.set_num_threads(num_threads)
+
+
+def test_chunks_reads_the_iterable_lazily():
+    chunks = _chunks((str(number) for number in range(5)), 2)
+
+    assert next(chunks) == ["0", "1"]
+    assert list(chunks) == [["2", "3"], ["4"]]
+
+
+def test_analyze_corpus_rejects_invalid_chunk_size():
+    with pytest.raises(ValueError, match="chunk_size"):
+        analyze_corpus(["text"], chunk_size=0)
+
+
+def test_analyze_corpus_yields_results_in_input_order(stub_backend):
+    texts = ["x" * number for number in range(1, 24)]
+    consumed = []
+
+    def read():
+        for text in texts:
+            consumed.append(text)
+            yield text
+
+    results = analyze_corpus(read(), workers=1, chunk_size=4, threads_per_worker=1)
+    first = next(results)
+
+    # At most two chunks per worker are read ahead
+    assert len(consumed) == 8
+    assert [first.compound, *(result.compound for result in results)] == list(
+        range(1, 24)
+    )
+    assert [len(batch) for batch in stub_backend.batches] == [4, 4, 4, 4, 4, 3]
+
+
+def test_analyze_corpus_reports_skipped_texts_by_input_index(stub_backend):
+    texts = ["a", "  ", None, "bbb", "", "cc"]
+    errors = []
+
+    results = list(
+        analyze_corpus(
+            texts,
+            workers=1,
+            chunk_size=3,
+            threads_per_worker=1,
+            on_error=lambda index, item, exc: errors.append((index, item, type(exc))),
+        )
+    )
+
+    assert [result.compound for result in results] == [1.0, 3.0, 2.0]
+    assert errors == [(1, "  ", ValueError), (2, None, TypeError), (4, "", ValueError)]
+    # Only valid texts reach the workers
+    assert stub_backend.batches == [["a", "bbb", "cc"]]
+    with pytest.raises(ValueError, match="Missing text"):
+        list(
+            analyze_corpus(
+                texts, workers=1, chunk_size=3, threads_per_worker=1, skip_invalid=False
+            )
+        )
@@ -0,0 +1,15 @@
+import numpy as np
+
+from sentiment_analyzer_finbert.analyzers.documents import aggregate_windows
+
+
+def test_aggregate_windows_per_document():
+    probabilities = np.array([[0.6, 0.3, 0.1], [0.2, 0.2, 0.6], [0.1, 0.8, 0.1]])
+    lengths = np.array([10, 30, 30])
+    documents = np.array([0, 1, 0])
+
+    mean = aggregate_windows(probabilities, lengths, documents, 2, "mean")
+    best = aggregate_windows(probabilities, lengths, documents, 2, "max")
+
+    assert np.allclose(mean, [[0.225, 0.675, 0.1], [0.2, 0.2, 0.6]])
+    assert best.tolist() == [[0.1, 0.8, 0.1], [0.2, 0.2, 0.6]]
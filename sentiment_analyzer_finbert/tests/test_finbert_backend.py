@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from sentiment_analyzer_finbert.analyzers.sentiment_analyzer import _FinbertBackend
+from sentiment_analyzer_finbert.models.sentiments import LABELS, Sentiments
+
+WORDS = (
+    "the company profit loss rose fell sharply shares results were strong weak"
+).split()
+TEXTS = [
+    "The company profit rose sharply.",
+    "Shares fell.",
+    "",
+    "The results were weak, the loss rose and the shares fell sharply " * 3,
+    "Strong results.",
+]
+
+
+@pytest.fixture(scope="module")
+def tiny_finbert(tmp_path_factory):
+    """
+    A randomly initialized BERT with FinBERT's label order, small enough to build
+    in the test, so the backend can be compared with the Hugging Face pipeline.
+    """
+    path = tmp_path_factory.mktemp("tiny-finbert")
+    vocab = path / "vocab.txt"
+    vocab.write_text(
+        "\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", ",", "."] + WORDS)
+    )
+    tokenizer = transformers.BertTokenizerFast(vocab_file=str(vocab))
+    tokenizer.model_max_length = 64
+    config = transformers.BertConfig(
+        vocab_size=len(tokenizer),
+        hidden_size=16,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=32,
+        max_position_embeddings=64,
+        # Large initial weights, so the texts get clearly different probabilities
+        initializer_range=0.5,
+        id2label={0: "positive", 1: "negative", 2: "neutral"},
+        label2id={"positive": 0, "negative": 1, "neutral": 2},
+    )
+    torch.manual_seed(0)
+    model = transformers.BertForSequenceClassification(config)
+    model.save_pretrained(path)
+    tokenizer.save_pretrained(path)
+    return str(path)
+
+
+def test_torch_backend_matches_the_pipeline(tiny_finbert) -> None:
+    backend = _FinbertBackend(tiny_finbert)
+    classifier = transformers.pipeline(
+        "text-classification", model=tiny_finbert, tokenizer=tiny_finbert, top_k=None
+    )
+
+    probabilities = backend.predict_proba(TEXTS)
+    sentiments = backend.analyze_batch(TEXTS)
+    results = classifier(TEXTS)
+
+    assert len(probabilities) == len(sentiments) == len(TEXTS)
+    for row, result, pipeline_result in zip(probabilities, sentiments, results):
+        scores = {item["label"]: item["score"] for item in pipeline_result}
+        expected_row = [scores[label] for label in LABELS]
+        assert row.tolist() == pytest.approx(expected_row, abs=1e-5)
+        expected = Sentiments.from_finbert(pipeline_result)
+        assert result.compound == pytest.approx(expected.compound, abs=1e-5)
+        assert result.compound_label == expected.compound_label
+
+
+def test_length_sorted_windows_match_padded_batches(tiny_finbert) -> None:
+    backend = _FinbertBackend(tiny_finbert)
+    # More texts than one batch, so padding differs between the two paths
+    texts = TEXTS * 7
+
+    windows, _, documents = backend.predict_windows(texts, backend.max_window, 8)
+
+    assert documents.tolist() == list(range(len(texts)))
+    assert windows == pytest.approx(backend.predict_proba(texts), abs=1e-5)
+
+
+@pytest.mark.parametrize("quantize, tolerance", [(False, 1e-4), (True, 0.05)])
+def test_onnx_backend_matches_torch(
+    tiny_finbert, tmp_path, monkeypatch, quantize, tolerance
+) -> None:
+    pytest.importorskip("onnx")
+    pytest.importorskip("onnxruntime")
+    from sentiment_analyzer_finbert.analyzers.onnx_backend import _OnnxFinbertBackend
+
+    monkeypatch.setenv("SENTIMENT_ANALYZER_ONNX_CACHE", str(tmp_path))
+    texts = [text for text in TEXTS if text]
+
+    # Padded batches of mixed-length texts
+    expected = _FinbertBackend(tiny_finbert).predict_proba(texts)
+    probabilities = _OnnxFinbertBackend(tiny_finbert, quantize=quantize).predict_proba(
+        texts
+    )
+
+    # A random model still scores different texts differently
+    assert np.ptp(expected, axis=0).max() > 1e-3
+    assert np.allclose(probabilities, expected, atol=tolerance)
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("torch", "transformers", "onnxruntime")
+# Generous, so slow CI machines pass; torch and transformers alone take seconds
+BUDGET_SECONDS = 1.0
+
+
+def import_times(statement: str) -> dict[str, float]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "sentiment_analyzer_finbert",
+        "sentiment_analyzer_finbert.analyzers.sentiment_analyzer",
+        "sentiment_analyzer_finbert.analyzers.corpus",
+    ],
+)
+def test_importing_loads_no_heavy_dependency(module: str) -> None:
+    times = import_times(f"import {module}")
+
+    assert module in times
+    assert [name for name in HEAVY_MODULES if name in times] == []
+    assert times[module] < BUDGET_SECONDS
@@ -0,0 +1,37 @@
+import pytest
+
+from sentiment_analyzer_finbert.analyzers.instrumentation import (
+    Instrumentation,
+    StageMetrics,
+)
+
+
+def test_stages_are_timed_and_aggregated():
+    instrumentation = Instrumentation()
+    metrics = StageMetrics()
+    instrumentation.add_callback(metrics)
+
+    for padded_tokens in (64, 32):
+        with instrumentation.stage("forward", "finbert/torch", batch_size=2) as stage:
+            stage.set(padded_tokens=padded_tokens)
+    instrumentation.record("cache", "finbert/torch", 0.25, hits=3, misses=1)
+
+    snapshot = metrics.snapshot()
+    forward = snapshot[("finbert/torch", "forward")]
+    assert (forward["count"], forward["batch_size"], forward["padded_tokens"]) == (2, 4, 96)
+    assert snapshot[("finbert/torch", "cache")]["seconds"] == 0.25
+
+
+def test_errors_are_reported_and_callbacks_cannot_fail_the_analysis():
+    instrumentation = Instrumentation()
+    events = []
+    instrumentation.add_callback(lambda event: 1 / 0)
+    instrumentation.add_callback(events.append)
+
+    with pytest.raises(RuntimeError):
+        with instrumentation.stage("tokenize", "finbert/torch", texts=1):
+            raise RuntimeError("tokenizer failed")
+
+    assert events[0].attributes == {"texts": 1, "error": "RuntimeError"}
+    instrumentation.remove_callback(events.append)
+    assert instrumentation.enabled
@@ -0,0 +1,23 @@
+from sentiment_analyzer_finbert.analyzers.model_registry import ModelRegistry
+
+
+class _Owner:
+    def __init__(self):
+        self.evicted = False
+
+    def _evict(self):
+        self.evicted = True
+
+
+def test_registry_evicts_least_recently_used_model_over_budget():
+    registry = ModelRegistry(max_bytes=250)
+    first, second, third = _Owner(), _Owner(), _Owner()
+
+    registry.record_load(first, "first", 100, 1.0)
+    registry.record_load(second, "second", 100, 1.0)
+    registry.touch(first)
+    registry.record_load(third, "third", 100, 1.0)
+
+    assert second.evicted and not first.evicted and not third.evicted
+    assert registry.stats.models == {"first": 100, "third": 100}
+    assert registry.stats.evictions == 1
@@ -8,3 +8,11 @@ def test_analyzer_rejects_unknown_model_before_loading_backend():
         ValueError, match="Unsupported model: custom. Supported models: finbert"
     ):
         SentimentAnalyzer(model="custom")
+
+
+def test_analyzer_rejects_unknown_backend_before_loading_backend():
+    with pytest.raises(
+        ValueError,
+        match="Unsupported backend: tensorrt. Supported backends: torch, onnx, onnx-int8",
+    ):
+        SentimentAnalyzer(backend="tensorrt")
@@ -42,3 +42,21 @@ def test_sentiments_from_finbert_nested_pipeline_result():
 def test_sentiments_rejects_invalid_finbert_result():
     with pytest.raises(TypeError, match="FinBERT result must be a dictionary or list"):
         Sentiments.from_finbert("positive")
+
+
+def test_sentiments_from_probabilities_in_label_order():
+    import numpy as np
+
+    from sentiment_analyzer_finbert.models.sentiments import LABELS, label_columns
+
+    logits_order = {0: "positive", 1: "negative", 2: "neutral"}
+    probabilities = np.array([[0.92, 0.02, 0.06], [0.1, 0.7, 0.2]])[:, label_columns(logits_order)]
+
+    results = Sentiments.from_probabilities(probabilities)
+
+    assert LABELS == ("negative", "neutral", "positive")
+    assert [(result.negative, result.neutral, result.positive) for result in results] == [
+        (0.02, 0.06, 0.92),
+        (0.7, 0.2, 0.1),
+    ]
+    assert [result.compound_label for result in results] == ["positive", "negative"]